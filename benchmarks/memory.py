@@ -0,0 +1,74 @@
+"""
+Memory benchmark for the model layer.
+
+Builds synthetic contacts and notes the way loading does (from dicts of
+freshly decoded strings) and reports the traced bytes kept per record.
+
+Usage:
+    python benchmarks/memory.py [--records N] [--packed-phones]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.contact import Contact  # noqa: E402
+from src.model.note import NoteEntity  # noqa: E402
+from src.model.phone import Phone  # noqa: E402
+
+STREETS = [f"Street {i}" for i in range(1000)]
+TAGS = ["work", "home", "urgent", "ideas", "shopping", "travel", "health", "family"]
+
+
+def contact_record(i: int) -> dict:
+    """A contact with two phones, an email, an address and a birthday."""
+    return {
+        "name": f"Contact {i}",
+        "phones": [f"050{i:07d}", f"067{i:07d}"],
+        "emails": [f"contact{i}@example.com"],
+        "addresses": [f"Kyiv, {STREETS[i % len(STREETS)]}, {i % 50}"],
+        "birthday": f"{i % 28 + 1:02d}.{i % 12 + 1:02d}.{1950 + i % 60}",
+    }
+
+
+def note_record(i: int) -> dict:
+    """A short note with two tags."""
+    return {
+        "topic": f"Note {i}",
+        "content": f"Remember to follow up on item {i}",
+        "tags": [f"{TAGS[i % len(TAGS)]}", f"{TAGS[(i * 7) % len(TAGS)]}"],
+    }
+
+
+def bytes_per_record(build, count: int) -> float:
+    """Return the traced memory kept by ``count`` records divided by ``count``."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    records = [build(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    # The list holding the records is not part of their cost.
+    used -= sys.getsizeof(records)
+    del records
+    return used / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--packed-phones", action="store_true")
+    args = parser.parse_args()
+    if args.packed_phones:
+        Phone.PACKED = True
+
+    contact = bytes_per_record(lambda i: Contact.from_dict(contact_record(i)), args.records)
+    note = bytes_per_record(lambda i: NoteEntity.from_dict(note_record(i)), args.records)
+    print(f"records:            {args.records}")
+    print(f"bytes per contact:  {contact:.0f}")
+    print(f"bytes per note:     {note:.0f}")
+
+
+if __name__ == "__main__":
+    main()
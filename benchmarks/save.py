@@ -0,0 +1,69 @@
+"""
+Save benchmark for the JSON snapshot storage.
+
+Saves a synthetic contact book repeatedly and reports the snapshot size, the
+time per save and, on Linux, the bytes the process wrote per save (``wchar``
+and ``write_bytes`` of /proc/self/io), i.e. the write amplification.
+
+Usage:
+    python benchmarks/save.py [--records N] [--saves N] [--fsync none|file|file+dir]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import data_storage  # noqa: E402
+
+from memory import contact_record  # noqa: E402
+
+
+def io_counters() -> dict[str, int]:
+    """Return the I/O counters of this process, or an empty dict off Linux."""
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            return {name: int(value) for name, value in (line.split(": ") for line in f)}
+    except OSError:
+        return {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--saves", type=int, default=10)
+    parser.add_argument("--fsync", choices=getattr(data_storage, "FSYNC_POLICIES", None))
+    args = parser.parse_args()
+
+    if args.fsync:
+        data_storage.FSYNC_POLICY = args.fsync
+    # A throwaway data folder; point it at a tmpfs to take the disk out.
+    config = data_storage.StorageConfig(tempfile.mkdtemp(prefix="save-bench-"))
+    storage = data_storage.DataStorage(data_storage.CONTACTS_FILE, config)
+    snapshot = {
+        "version": data_storage.STORAGE_VERSION,
+        "data": {f"contact {i}": contact_record(i) for i in range(args.records)},
+    }
+    # The first save has no previous file to back up.
+    storage.save_data(snapshot, silent=True)
+
+    before = io_counters()
+    start = time.perf_counter()
+    for _ in range(args.saves):
+        storage.save_data(snapshot, silent=True)
+    elapsed = time.perf_counter() - start
+    after = io_counters()
+
+    size = os.path.getsize(storage.filename)
+    print(f"snapshot size:      {size} bytes")
+    print(f"time per save:      {elapsed / args.saves * 1000:.1f} ms")
+    for counter in ("wchar", "write_bytes"):
+        if counter in after:
+            written = (after[counter] - before[counter]) / args.saves
+            print(f"{counter + ':':<20}{written:.0f} bytes per save ({written / size:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
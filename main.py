@@ -5,15 +5,126 @@ This module contains the main entry point of the program, designed to initialize
 and execute the core functionality of the application. It ensures that the primary
 logic is invoked only when the module is run as the main script.
 """
+import argparse
+import os
+import sys
 
+from src import data_storage
+from src.data_storage import (
+    CONTACTS_FILE,
+    DATA_DIR_ENV,
+    NOTES_FILE,
+    PROFILE_ENV,
+    SNAPSHOT_FORMATS,
+    DataStorage,
+    StorageConfig,
+)
 from src.personal_assistant import PersonalAssistant
 
 
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parses the command line options of the application.
+    """
+    parser = argparse.ArgumentParser(
+        prog="personal-assistant",
+        description="A console-based personal assistant for managing contacts and notes.",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=os.environ.get(DATA_DIR_ENV) or None,
+        help=f"Folder of the data files, e.g. on a tmpfs (default: ${DATA_DIR_ENV} or ~/.cli_assistant).",
+    )
+    parser.add_argument(
+        "--profile",
+        default=os.environ.get(PROFILE_ENV) or None,
+        help=f"Use a separate data set stored in a subfolder of the data folder (default: ${PROFILE_ENV}).",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run the commands in FILE ('-' for stdin) without prompting, save and exit.",
+    )
+    parser.add_argument(
+        "--save-every",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --batch, also save after every N commands (default: only at the end).",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="With --batch, print only the failures.",
+    )
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Copy contacts.json and notes.json into the SQLite database and exit.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help=(
+            "Check the checksums, load contacts and notes with full validation, report problems and exit. "
+            "Nothing is repaired; damaged files are restored from backups by the next normal start."
+        ),
+    )
+    parser.add_argument(
+        "--convert",
+        choices=SNAPSHOT_FORMATS,
+        help="Rewrite contacts.json and notes.json in the given snapshot format and exit.",
+    )
+    return parser.parse_args(argv)
+
+
 def main() -> None:
     """
     The main entry point of the application that initializes and executes the program.
     """
-    PersonalAssistant().run()
+    args = parse_args()
+    try:
+        config = StorageConfig(args.data_dir, args.profile)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Cannot use the data folder: {e}")
+    # Every storage of this process, whatever the command, uses this folder.
+    data_storage.use_config(config)
+    if args.migrate:
+        # Imported here: only needed for the one-off migration.
+        from src.storage.sqlite_storage import migrate_json_to_sqlite
+        contacts, notes = migrate_json_to_sqlite()
+        print(f"Migrated {contacts} contact(s) and {notes} note(s) to SQLite.")
+        return
+    if args.verify:
+        # Imported here: the model layer is only needed for the check.
+        from src.model.contact_book import ContactBook
+        from src.model.note import Notes
+        for filename in (CONTACTS_FILE, NOTES_FILE):
+            for problem in DataStorage(filename).verify():
+                print(f"{filename}: {problem}")
+        data_storage.TRUSTED_LOAD = False
+        data_storage.LAZY_LOAD = False
+        data_storage.REPAIR_ON_LOAD = False
+        data_storage.POOLED_LOAD = True
+        book = ContactBook.load_from_storage()
+        notes = Notes.load_from_storage()
+        print(f"Verified {len(book)} contact(s) and {len(notes)} note(s).")
+        return
+    if args.convert:
+        for filename in (CONTACTS_FILE, NOTES_FILE):
+            if DataStorage(filename).convert(args.convert):
+                print(f"Converted {filename} to the {args.convert} format.")
+        return
+    if args.batch:
+        if args.batch == "-":
+            failures = PersonalAssistant(config).run_batch(sys.stdin, args.save_every, args.quiet)
+        else:
+            with open(args.batch, encoding="utf-8") as script:
+                failures = PersonalAssistant(config).run_batch(script, args.save_every, args.quiet)
+        if failures:
+            raise SystemExit(f"{failures} command(s) failed.")
+        return
+    PersonalAssistant(config).run()
 
 if __name__ == '__main__':
     main()
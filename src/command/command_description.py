@@ -8,6 +8,7 @@ a descriptive help string for the command.
 """
 
 import rich
+from rich.console import Console
 from rich.table import Table
 
 from src.command.command_argument import CommandArgument
@@ -46,11 +47,12 @@ class CommandDefinition:
         """Returns the number of the command arguments."""
         return len(self.__args)
 
-    def show_usage(self):
+    def show_usage(self, console: Console | None = None):
         """Returns a formatted string representation of the command definition."""
-        rich.print(
+        console = console or rich.get_console()
+        console.print(
             f"usage: {cmd_color(self.__name)} "
-            f"{" ".join(map(lambda a: CommandDefinition.__arg_name_format(a), self.__args))}"
+            f"{' '.join(map(lambda a: CommandDefinition.__arg_name_format(a), self.__args))}"
         )
         if len(self.__args) > 0:
             table = Table(box=None, show_header=False)
@@ -58,7 +60,7 @@ class CommandDefinition:
             table.add_column("Description", justify="left", style="yellow")
             for arg in self.__args:
                 table.add_row(" - " + arg.name, arg.description)
-            rich.print(table)
+            console.print(table)
 
     @staticmethod
     def __arg_name_format(arg: CommandArgument) -> str:
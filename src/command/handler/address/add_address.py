@@ -1,5 +1,4 @@
 """Handler for the add-address command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -25,17 +24,18 @@ class AddAddressCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Adds an address to the specified contact."""
         name = Name(args[0])
         address = Address(args[1])
         contact = self.__address_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
 
         try:
             contact.add_address(address)
-            rprint(ADDRESS_ADDED.format(name=name))
+            self.console.print(ADDRESS_ADDED.format(name=name))
         except ValueError:
-            rprint(INVALID_ADDRESS)
+            self.console.print(INVALID_ADDRESS)
+            return False
@@ -1,5 +1,4 @@
 """Handler for the change-address command."""
-from rich import print as rprint
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
 from src.command.handler.command_handler import CommandHandler
@@ -25,7 +24,7 @@ class ChangeAddressCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Changes an existing address of the specified contact."""
         name = Name(args[0])
         old_address = Address(args[1])
@@ -33,10 +32,11 @@ class ChangeAddressCommandHandler(CommandHandler):
 
         contact = self.__address_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
         try:
             contact.update_address(old_address, new_address)
-            rprint(ADDRESS_UPDATED.format(name=name) )
+            self.console.print(ADDRESS_UPDATED.format(name=name) )
         except ValueError:
-            rprint(ADDRESS_NOT_FOUND.format(name=name))
+            self.console.print(ADDRESS_NOT_FOUND.format(name=name))
+            return False
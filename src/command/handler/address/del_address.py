@@ -1,5 +1,4 @@
 """Handler for the del-address command."""
-from rich import print as rprint
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
 from src.command.handler.command_handler import CommandHandler
@@ -24,15 +23,15 @@ class DelAddressCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Deletes the address from the specified contact if it matches."""
         name = Name(args[0])
         address_to_delete = Address(args[1])
 
         contact = self.__address_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
 
         is_confirmed = confirm_delete(
             f"the address '{address_to_delete.value}' from contact '{name.value}'"
@@ -42,6 +41,7 @@ class DelAddressCommandHandler(CommandHandler):
 
         try:
             contact.remove_address(address_to_delete)
-            rprint(ADDRESS_DELETED.format(name=name))
+            self.console.print(ADDRESS_DELETED.format(name=name))
         except ValueError:
-            rprint(ADDRESS_NOT_FOUND.format(name=name))
+            self.console.print(ADDRESS_NOT_FOUND.format(name=name))
+            return False
@@ -1,5 +1,4 @@
 """Handler for the set-birthday command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -22,15 +21,15 @@ class AddBirthdayCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Sets or updates the birthday of the specified contact."""
         name = Name(args[0])
         birthday = " ".join(args[1:])
 
         contact = self.__address_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
 
         try:
             # Check if birthday already exists (for user feedback only)
@@ -41,8 +40,9 @@ class AddBirthdayCommandHandler(CommandHandler):
 
             # Provide appropriate feedback
             if had_birthday:
-                rprint(BIRTHDAY_UPDATED.format(name=name))
+                self.console.print(BIRTHDAY_UPDATED.format(name=name))
             else:
-                rprint(BIRTHDAY_ADDED.format(name=name))
+                self.console.print(BIRTHDAY_ADDED.format(name=name))
         except ValueError as e:
-            rprint(f"Failed to set birthday: {e}")
+            self.console.print(f"Failed to set birthday: {e}")
+            return False
@@ -1,5 +1,4 @@
 """Handler for the del-birthday command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -23,20 +22,20 @@ class DelBirthdayCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Deletes the birthday from the specified contact if it matches."""
         name = Name(args[0])
         contact = self.__address_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
 
         if contact.birthday is None:
-            rprint(BIRTHDAY_NOT_FOUND.format(name=name))
-            return
+            self.console.print(BIRTHDAY_NOT_FOUND.format(name=name))
+            return False
 
         is_confirmed = confirm_delete(f"the birthday from contact '{name.value}'")
         if not is_confirmed:
             return
         contact.clear_birthday()
-        rprint(BIRTHDAY_DELETED.format(name=name))
+        self.console.print(BIRTHDAY_DELETED.format(name=name))
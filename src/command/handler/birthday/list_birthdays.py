@@ -1,5 +1,5 @@
 """Handler for the birthdays command."""
-from rich import print as rprint, box
+from rich import box
 from rich.table import Table
 
 from src.command.command_argument import optional_arg
@@ -21,7 +21,7 @@ class BirthdaysCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Display upcoming birthdays."""
         # Parse days argument (default to 7)
         days = 7
@@ -29,20 +29,20 @@ class BirthdaysCommandHandler(CommandHandler):
             try:
                 days = int(args[0])
                 if days < 0:
-                    print("Number of days must be non-negative.")
-                    return
+                    self.console.print("Number of days must be non-negative.")
+                    return False
             except ValueError:
-                print("Invalid number of days. Please provide a valid integer.")
-                return
+                self.console.print("Invalid number of days. Please provide a valid integer.")
+                return False
 
         # Get upcoming birthdays
         try:
             upcoming = self.__address_book.get_upcoming_birthdays(days)
         except (ValueError, AttributeError) as e:
-            rprint(f"Error retrieving birthdays: {e}")
-            return
+            self.console.print(f"Error retrieving birthdays: {e}")
+            return False
         if not upcoming:
-            rprint(NO_UPCOMING_BIRTHDAYS)
+            self.console.print(NO_UPCOMING_BIRTHDAYS)
             return
 
   # Create table to display birthdays
@@ -61,4 +61,4 @@ class BirthdaysCommandHandler(CommandHandler):
             f"[cyan]{entry['name']}[/cyan]",
             f"[red]{entry['congratulation_date']}[/red]"
         )
-        rprint(table)
+        self.console.print(table)
@@ -1,5 +1,6 @@
 """Base class for command handlers."""
 import rich
+from rich.console import Console
 
 from src.command.command_description import CommandDefinition
 from src.util.colorize import error_color
@@ -10,17 +11,30 @@ class CommandHandler:
 
     def __init__(self, definition: CommandDefinition):
         self.__definition = definition
+        self.__console = None
 
-    def handle(self, args: list[str]) -> None:
-        """Handles the command."""
+    def handle(self, args: list[str]) -> bool:
+        """
+        Handles the command. Returns False if the arguments were rejected or
+        the command failed.
+        """
         try:
             self.__check_args(args)
         except ValueError as e:
-            rich.print(f"{error_color('[ERROR]')}: " + str(e))
+            self.console.print(f"{error_color('[ERROR]')}: " + str(e))
             self.show_usage()
-            return
+            return False
 
-        self._handle(args)
+        return self._handle(args) is not False
+
+    @property
+    def console(self) -> Console:
+        """The console the command prints to; the global rich console by default."""
+        return self.__console or rich.get_console()
+
+    @console.setter
+    def console(self, console: Console | None) -> None:
+        self.__console = console
 
     @property
     def name(self) -> str:
@@ -34,10 +48,10 @@ class CommandHandler:
 
     def show_usage(self) -> None:
         """Returns the help message for the command."""
-        return self.__definition.show_usage()
+        return self.__definition.show_usage(self.console)
 
-    def _handle(self, args: list[str]) -> None:
-        """Handles the command."""
+    def _handle(self, args: list[str]) -> bool | None:
+        """Handles the command. Returns False if it failed."""
 
     def __check_args(self, args: list[str]) -> None:
         """Checks if the number of command arguments matches the expected number."""
@@ -8,7 +8,7 @@ and retrieve command handlers and to view all registered command names.
 from collections import UserDict
 
 from rich import box
-from rich import print as rprint
+from rich.console import Console
 from rich.table import Table
 
 from src.command.handler.command_handler import CommandHandler
@@ -34,10 +34,15 @@ class CommandHandlers(UserDict[str, CommandHandler]):
     def __getitem__(self, command_name: str) -> CommandHandler | None:
         return self.data.get(command_name, None)
 
-    def show_list_available_commands(self) -> None:
+    def use_console(self, console: Console | None) -> None:
+        """Makes every handler print to ``console``; None restores the global console."""
+        for handler in self.data.values():
+            handler.console = console
+
+    def show_list_available_commands(self, console: Console) -> None:
         """Shows commands with maximum sass."""
         if not self.data:
-            print(NO_COMMANDS_AVAILABLE)
+            console.print(NO_COMMANDS_AVAILABLE)
             return
 
         table = Table(
@@ -58,5 +63,5 @@ class CommandHandlers(UserDict[str, CommandHandler]):
                 f"[dim]{command_handler.description}[/dim]"
             )
 
-        rprint(table)
-        rprint("[dim]💡 Pro tip: Most of these actually work. Sometimes.[/dim]")
+        console.print(table)
+        console.print("[dim]💡 Pro tip: Most of these actually work. Sometimes.[/dim]")
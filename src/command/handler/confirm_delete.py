@@ -1,4 +1,10 @@
+# Set in batch mode, where there is nobody to ask and stdin holds commands.
+AUTO_CONFIRM = False
+
+
 def confirm_delete(message: str) -> bool:
+    if AUTO_CONFIRM:
+        return True
     input_line = input(f"Are you sure you want to delete {message}? (y/n) [N] ")
     cleared_line = input_line.strip()
     if len(cleared_line) == 0 or cleared_line.lower() != "y":
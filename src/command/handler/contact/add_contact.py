@@ -1,5 +1,4 @@
 """Handler for the add-contact command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -22,15 +21,17 @@ class AddContactCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Adds an address to the specified contact."""
         name = args[0]
         phone = args[1]
         try:
             ret, _ = self.__contact_book.create_contact(name, phone)
             if ret:
-                rprint(ADD_CONTACT_SUCCESS.format(name=name))
+                self.console.print(ADD_CONTACT_SUCCESS.format(name=name))
             else:
-                rprint(f"Contact '{name}' already exist in the contact book")
+                self.console.print(f"Contact '{name}' already exist in the contact book")
+                return False
         except ValueError as e:
-            rprint(f"Failed to add contact: {e}")
+            self.console.print(f"Failed to add contact: {e}")
+            return False
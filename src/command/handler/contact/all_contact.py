@@ -21,4 +21,4 @@ class AllContactsCommandHandler(CommandHandler):
     def _handle(self, args: list[str]) -> None:
         """Handles the all-contacts command."""
         contacts = list(self.__contact_book.values())
-        show_contacts(contacts)
+        show_contacts(contacts, self.console)
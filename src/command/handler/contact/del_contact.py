@@ -1,5 +1,4 @@
 """Handler for the del-contact command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -23,7 +22,7 @@ class DelContactCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the del-contact command."""
         name = Name(args[0])
 
@@ -33,6 +32,7 @@ class DelContactCommandHandler(CommandHandler):
 
         ret, _ = self.__contact_book.delete_contact(name.value)
         if ret:
-            rprint(CONTACT_DELETED.format(name=args[0]))
+            self.console.print(CONTACT_DELETED.format(name=args[0]))
         else:
-            rprint(CONTACT_NOT_FOUND.format(name=args[0]))
+            self.console.print(CONTACT_NOT_FOUND.format(name=args[0]))
+            return False
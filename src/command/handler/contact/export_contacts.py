@@ -0,0 +1,34 @@
+"""Handler for the export command."""
+
+from src.command.command_argument import mandatory_arg, optional_arg
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.model.contact_book import ContactBook
+from src.storage.contact_exchange import FORMATS, detect_format, export_contacts
+
+
+class ExportContactsCommandHandler(CommandHandler):
+    """Writes the address book to a CSV or vCard file."""
+
+    def __init__(self, contact_book: ContactBook):
+        self.__contact_book = contact_book
+        super().__init__(
+            CommandDefinition(
+                "export",
+                "Exports all contacts to a CSV or vCard file.",
+                mandatory_arg("file", "Path of the file to write."),
+                optional_arg("format", f"One of {', '.join(FORMATS)}; taken from the file extension if omitted."),
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Exports the contacts to the given file."""
+        path = args[0]
+        try:
+            fmt = detect_format(path, args[1] if len(args) > 1 else None)
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                count = export_contacts(self.__contact_book.values(), file, fmt)
+        except (OSError, ValueError) as e:
+            self.console.print(f"Failed to export contacts: {e}")
+            return False
+        self.console.print(f"Exported {count} contact(s) to '{path}'.")
@@ -22,14 +22,14 @@ class FindContactCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Find contact in the address book"""
         if args[0] not in ("name", "phones", "emails", "addresses", "birthday"):
-            print(("Wrong parameter value, must be on of the following:"
+            self.console.print(("Wrong parameter value, must be on of the following:"
                    "name, phones, emails, addresses, birthday"))
-            return
+            return False
         contact = self.__contact_book.find_contact_by_param(args[0], args[1])
         if not contact or not contact[0]:
-            print(f"Contact with {args[0]}: '{args[1]}' not found.")
+            self.console.print(f"Contact with {args[0]}: '{args[1]}' not found.")
             return
-        show_contacts(contact)
+        show_contacts(contact, self.console)
@@ -0,0 +1,48 @@
+"""Handler for the import command."""
+
+from src.command.command_argument import mandatory_arg, optional_arg
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.model.contact_book import ContactBook
+from src.storage.contact_exchange import FORMATS, detect_format, import_contacts
+from src.util.colorize import error_color
+
+# Rejected rows beyond this many are only counted.
+MAX_REPORTED_ERRORS = 50
+
+
+class ImportContactsCommandHandler(CommandHandler):
+    """Merges contacts from a CSV or vCard file into the address book."""
+
+    def __init__(self, contact_book: ContactBook):
+        self.__contact_book = contact_book
+        super().__init__(
+            CommandDefinition(
+                "import",
+                "Imports contacts from a CSV or vCard file, merging them into existing ones.",
+                mandatory_arg("file", "Path of the file to read."),
+                optional_arg("format", f"One of {', '.join(FORMATS)}; taken from the file extension if omitted."),
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Imports the contacts of the given file."""
+        path = args[0]
+        reported = 0
+
+        def report(line: int, message: str) -> None:
+            nonlocal reported
+            if reported < MAX_REPORTED_ERRORS:
+                self.console.print(f"{error_color('[ERROR]')} line {line}: {message}")
+            reported += 1
+
+        try:
+            fmt = detect_format(path, args[1] if len(args) > 1 else None)
+            with open(path, encoding="utf-8", newline="") as file:
+                result = import_contacts(self.__contact_book, file, fmt, report)
+        except (OSError, ValueError) as e:
+            self.console.print(f"Failed to import contacts: {e}")
+            return False
+        self.console.print(f"Imported {result.created} new and updated {result.updated} existing contact(s).")
+        if result.failed:
+            self.console.print(f"{result.failed} row(s) rejected.")
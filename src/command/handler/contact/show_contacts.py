@@ -1,15 +1,15 @@
 """Module for showing contacts in the table format."""
 
+from rich.console import Console
 from rich.table import Table
 from rich.box import ROUNDED
-from rich import print as rprint
 from src.util.messages import CONTACT_BOOK_EMPTY
 from src.model.contact import Contact
 
-def show_contacts(contacts: list[Contact]) -> None:
+def show_contacts(contacts: list[Contact], console: Console) -> None:
     """Shows all contacts in a clean Rich table."""
     if not contacts:
-        rprint(CONTACT_BOOK_EMPTY)
+        console.print(CONTACT_BOOK_EMPTY)
         return
 
     table = Table(
@@ -33,4 +33,4 @@ def show_contacts(contacts: list[Contact]) -> None:
                     ", ".join(cont_dict["emails"]) or "[dim]-[/dim]",
                     ", ".join(cont_dict["addresses"]) or "[dim]-[/dim]",
                     cont_dict["birthday"] if contact.birthday else "[dim]-[/dim]")
-    rprint(table)
+    console.print(table)
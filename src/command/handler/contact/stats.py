@@ -0,0 +1,58 @@
+"""Handler for the stats command."""
+import calendar
+
+from rich import box
+from rich.table import Table
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.model.contact_book import ContactBook
+from src.util.messages import CONTACT_BOOK_EMPTY
+
+TOP_DOMAINS = 5
+
+
+class StatsCommandHandler(CommandHandler):
+    """Displays aggregate statistics about the address book."""
+
+    def __init__(self, address_book: ContactBook):
+        self.__address_book = address_book
+        super().__init__(
+            CommandDefinition(
+                "stats",
+                "Shows statistics about the contacts in the address book.",
+            )
+        )
+
+    def _handle(self, args: list[str]) -> None:
+        """Display contact statistics."""
+        columns = self.__address_book.columns()
+        if not len(columns):
+            self.console.print(CONTACT_BOOK_EMPTY)
+            return
+
+        table = Table(
+            title="[bold blue]📊 Contact Statistics[/bold blue]",
+            show_header=True,
+            header_style="bold yellow",
+            border_style="blue",
+            box=box.ROUNDED,
+        )
+        table.add_column("Metric", style="cyan", justify="left")
+        table.add_column("Value", style="white", justify="right")
+
+        table.add_row("Contacts", str(len(columns)))
+        table.add_row("Phone numbers", str(columns.total("phone_counts")))
+        table.add_row("Without email", str(columns.count_without_emails()))
+        table.add_row("Without birthday", str(columns.count_without_birthday()))
+        table.add_section()
+        for month, count in enumerate(columns.birthdays_per_month(), start=1):
+            if count:
+                table.add_row(f"Birthdays in {calendar.month_name[month]}", str(count))
+        table.add_section()
+        for domain, count in columns.top_email_domains(TOP_DOMAINS):
+            table.add_row(f"Emails at {domain}", str(count))
+        table.add_section()
+        for address, names in self.__address_book.shared_addresses().items():
+            table.add_row(f"Shared address: {address}", ", ".join(names))
+        self.console.print(table)
@@ -1,5 +1,4 @@
 """Handler for the add-email command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -24,13 +23,13 @@ class AddEmailCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         name = Name(args[0])
         email = Email(args[1])
         contact = self.__contact_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
         contact.add_email(email)
-        rprint(EMAIL_ADDED.format(name=name))
+        self.console.print(EMAIL_ADDED.format(name=name))
@@ -1,5 +1,4 @@
 """Handler for the del-email command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -25,14 +24,14 @@ class DelEmailCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         name = Name(args[0])
         email = Email(args[1])
         contact = self.__contact_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
 
         is_confirmed = confirm_delete(
             f"the email '{email.value}' from contact '{name.value}'"
@@ -41,4 +40,4 @@ class DelEmailCommandHandler(CommandHandler):
             return
 
         contact.remove_email(email)
-        rprint(EMAIL_DELETED.format(name=name))
+        self.console.print(EMAIL_DELETED.format(name=name))
@@ -23,7 +23,7 @@ class HelpCommandHandler(CommandHandler):
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
         if len(args) == 0:
-            self.__handlers.show_list_available_commands()
+            self.__handlers.show_list_available_commands(self.console)
         else:
             self.__show_help_for_command(args[0])
 
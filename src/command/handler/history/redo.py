@@ -0,0 +1,27 @@
+"""Handler for the redo command."""
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.storage.save_coordinator import SaveCoordinator
+
+
+class RedoCommandHandler(CommandHandler):
+    """Applies again the most recently undone change."""
+
+    def __init__(self, save_coordinator: SaveCoordinator):
+        self.__save_coordinator = save_coordinator
+        super().__init__(
+            CommandDefinition(
+                "redo",
+                "Applies again what the last undo took back.",
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Redoes the last undone change."""
+        try:
+            count = self.__save_coordinator.redo()
+        except ValueError as e:
+            self.console.print(f"Failed to redo: {e}")
+            return False
+        self.console.print(f"Redone {count} change(s).")
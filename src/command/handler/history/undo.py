@@ -0,0 +1,27 @@
+"""Handler for the undo command."""
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.storage.save_coordinator import SaveCoordinator
+
+
+class UndoCommandHandler(CommandHandler):
+    """Undoes the most recent change of contacts or notes."""
+
+    def __init__(self, save_coordinator: SaveCoordinator):
+        self.__save_coordinator = save_coordinator
+        super().__init__(
+            CommandDefinition(
+                "undo",
+                "Undoes the last command that changed contacts or notes (a transaction at once).",
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Undoes the last change."""
+        try:
+            count = self.__save_coordinator.undo()
+        except ValueError as e:
+            self.console.print(f"Failed to undo: {e}")
+            return False
+        self.console.print(f"Undone {count} change(s). Use 'redo' to apply them again.")
@@ -21,7 +21,7 @@ class AddNoteCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         topic = args[0]
         content = args[1]
@@ -29,4 +29,6 @@ class AddNoteCommandHandler(CommandHandler):
             tags = args[2]
         else:
             tags = None
-        print(self.__notes.add_note(topic, content, tags))
+        result = self.__notes.add_note(topic, content, tags)
+        self.console.print(result)
+        return result == "New note is added"
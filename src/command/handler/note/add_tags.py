@@ -4,6 +4,7 @@ from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
 from src.command.handler.command_handler import CommandHandler
 from src.model.note import Notes
+from src.util.messages import TAG_ADDED
 
 
 class AddTagsCommandHandler(CommandHandler):
@@ -23,8 +24,10 @@ class AddTagsCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         topic = args[0]
         tags = args[1]
-        print(self.__notes.add_tag(topic, tags))
+        result = self.__notes.add_tag(topic, tags)
+        self.console.print(result)
+        return result == TAG_ADDED.format(topic=topic)
@@ -1,5 +1,4 @@
 """Handler for the change-note command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -22,12 +21,13 @@ class ChangeNoteCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         topic = args[0]
         content = args[1]
         is_done = self.__notes.edit_note(topic, content)
         if is_done == "The note is changed.":
-            rprint(NOTE_UPDATED.format(topic=topic))
+            self.console.print(NOTE_UPDATED.format(topic=topic))
         else:
-            rprint(NOTE_NOT_FOUND.format(topic=topic))
+            self.console.print(NOTE_NOT_FOUND.format(topic=topic))
+            return False
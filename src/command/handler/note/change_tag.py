@@ -1,5 +1,4 @@
 """Handler for the change-tag command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -24,13 +23,14 @@ class ChangeTagCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         topic = args[0]
         old_tag = args[1]
         naw_tag = args[2]
         is_done = self.__notes.edit_tag(topic, old_tag, naw_tag)
         if is_done == "The tag is changed.":
-            rprint(TAG_UPDATED.format(topic=topic))
+            self.console.print(TAG_UPDATED.format(topic=topic))
         else:
-            rprint(f"Tag {old_tag} not found in the note.")
+            self.console.print(f"Tag {old_tag} not found in the note.")
+            return False
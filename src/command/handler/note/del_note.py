@@ -1,5 +1,4 @@
 """Handler for the del-note command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -22,7 +21,7 @@ class DelNoteCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         topic = args[0]
 
@@ -32,6 +31,7 @@ class DelNoteCommandHandler(CommandHandler):
 
         is_done = self.__notes.delete_note(topic)
         if is_done == "The note is deleted.":
-            rprint(NOTE_DELETED.format(topic=topic))
+            self.console.print(NOTE_DELETED.format(topic=topic))
         else:
-            rprint(NOTE_NOT_FOUND.format(topic=topic))
+            self.console.print(NOTE_NOT_FOUND.format(topic=topic))
+            return False
@@ -1,5 +1,4 @@
 """Handler for the del-tags command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -26,7 +25,7 @@ class DelTagsCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         topic = args[0]
         tags = args[1]
@@ -38,6 +37,7 @@ class DelTagsCommandHandler(CommandHandler):
 
         is_done = self.__notes.delete_tags(topic, tags)
         if is_done == "Tags deleted.":
-            rprint(TAG_DELETED.format(topic=topic))
+            self.console.print(TAG_DELETED.format(topic=topic))
         else:
-            print("No such tags in the note.")
+            self.console.print("No such tags in the note.")
+            return False
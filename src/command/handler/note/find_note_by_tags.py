@@ -1,5 +1,4 @@
 """Handler for the note-by-tag command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -17,16 +16,23 @@ class FindNoteByTagCommandHandler(CommandHandler):
         super().__init__(
             CommandDefinition(
                 "note-by-tag",
-                "Finds a note in notes by tag.",
-                mandatory_arg("tags", "The tag to search for."),
+                "Finds notes by tag.",
+                mandatory_arg(
+                    "tags",
+                    "The tag or tag query to search for. Example: 'work and not done, home'."
+                ),
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         tag = args[0]
-        notes: list[NoteEntity] = self.__notes.search_by_tag(tag)
+        try:
+            notes: list[NoteEntity] = self.__notes.search_by_tag(tag)
+        except ValueError as e:
+            self.console.print(f"Invalid tag query: {e}")
+            return False
         if notes:
-            show_notes(notes)
+            show_notes(notes, self.console)
         else:
-            rprint(NOTE_NOT_FOUND)
+            self.console.print(NOTE_NOT_FOUND)
@@ -1,5 +1,4 @@
 """Handler for the note-by-text command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -27,6 +26,6 @@ class FindNoteByTextCommandHandler(CommandHandler):
         text = args[0]
         notes: list[NoteEntity] = self.__notes.find_text_in_notes(text)
         if notes:
-            show_notes(notes)
+            show_notes(notes, self.console)
         else:
-            rprint(NOTE_NOT_FOUND)
+            self.console.print(NOTE_NOT_FOUND)
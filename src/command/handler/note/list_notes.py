@@ -20,4 +20,4 @@ class ListNoteTextCommandHandler(CommandHandler):
 
     def _handle(self, args: list[str]) -> None:
         """Handles the command."""
-        show_notes(self.__notes.data)
+        show_notes(self.__notes.data, self.console)
@@ -1,16 +1,16 @@
 """Module for showing notes."""
 
-from rich import print as rprint
+from rich.console import Console
 from rich.table import Table, box
 
 from src.model.note import NoteEntity
 from src.util.messages import NO_NOTES_FOUND
 
 
-def show_notes(notes: list[NoteEntity]) -> None:
+def show_notes(notes: list[NoteEntity], console: Console) -> None:
     """Shows the notes in a clean Rich table."""
     if not notes:
-        rprint(NO_NOTES_FOUND)
+        console.print(NO_NOTES_FOUND)
         return
 
     table = Table(
@@ -32,4 +32,4 @@ def show_notes(notes: list[NoteEntity]) -> None:
 
         table.add_row(topic_display, note.content)
 
-    rprint(table)
+    console.print(table)
@@ -1,12 +1,14 @@
 """Handler for the sort-notes-tags command."""
-from rich import print as rprint
 
+from src.command.command_argument import optional_arg
 from src.command.command_description import CommandDefinition
 from src.command.handler.command_handler import CommandHandler
 from src.command.handler.note.show_notes import show_notes
 from src.model.note import Notes
 from src.util.messages import NO_NOTES_TO_SORT
 
+# Number of notes shown per page.
+PAGE_SIZE = 20
 
 
 class SortNotesByTagCommandHandler(CommandHandler):
@@ -18,13 +20,37 @@ class SortNotesByTagCommandHandler(CommandHandler):
             CommandDefinition(
                 "sort-notes-tags",
                 "Sort all notes by their tags in alphabetical order.",
+                optional_arg(
+                    "then_by",
+                    "Order of notes with the same tag: 'topic' or 'length' (default: added)."
+                ),
+                optional_arg("page", f"Page to show, {PAGE_SIZE} notes per page (default: all)."),
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
-        ret = self.__notes.sort_by_tag()
+        then_by = None
+        page = None
+        for arg in args:
+            if arg.isdigit():
+                page = int(arg)
+            else:
+                then_by = arg.lower()
+        if page == 0:
+            self.console.print("Page number must be positive.")
+            return False
+
+        try:
+            ret = self.__notes.sort_by_tag(then_by, page, PAGE_SIZE)
+        except ValueError as e:
+            self.console.print(f"Failed to sort notes: {e}")
+            return False
         if ret is None:
-            rprint(NO_NOTES_TO_SORT)
-        else:
-            show_notes(ret)
+            self.console.print(NO_NOTES_TO_SORT)
+            return
+
+        show_notes(ret, self.console)
+        if page is not None:
+            pages = (len(self.__notes) + PAGE_SIZE - 1) // PAGE_SIZE
+            self.console.print(f"[dim]Page {page} of {pages}.[/dim]")
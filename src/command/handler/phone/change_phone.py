@@ -1,5 +1,4 @@
 """Handler for the change-phone command."""
-from rich import print as rprint
 
 from src.command.command_argument import mandatory_arg
 from src.command.command_description import CommandDefinition
@@ -25,14 +24,14 @@ class ChangePhoneCommandHandler(CommandHandler):
             )
         )
 
-    def _handle(self, args: list[str]) -> None:
+    def _handle(self, args: list[str]) -> bool | None:
         """Handles the command."""
         name = Name(args[0])
         old_phone = Phone(args[1])
         new_phone = Phone(args[2])
         contact = self.__contact_book.find_contact_by_name(name)
         if contact is None:
-            rprint(CONTACT_NOT_FOUND.format(name=name))
-            return
+            self.console.print(CONTACT_NOT_FOUND.format(name=name))
+            return False
         contact.update_phone(old_phone, new_phone)
-        rprint(PHONE_UPDATED.format(name=name, phone=new_phone))
+        self.console.print(PHONE_UPDATED.format(name=name, phone=new_phone))
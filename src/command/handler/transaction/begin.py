@@ -0,0 +1,27 @@
+"""Handler for the begin command."""
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.storage.save_coordinator import SaveCoordinator
+
+
+class BeginCommandHandler(CommandHandler):
+    """Opens a transaction: later changes are saved together on commit."""
+
+    def __init__(self, save_coordinator: SaveCoordinator):
+        self.__save_coordinator = save_coordinator
+        super().__init__(
+            CommandDefinition(
+                "begin",
+                "Starts a transaction; changes are saved on commit or undone by rollback.",
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Opens the transaction."""
+        try:
+            self.__save_coordinator.begin()
+        except ValueError as e:
+            self.console.print(f"Failed to start a transaction: {e}")
+            return False
+        self.console.print("Transaction started. Use 'commit' to save the changes or 'rollback' to undo them.")
@@ -0,0 +1,27 @@
+"""Handler for the commit command."""
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.storage.save_coordinator import SaveCoordinator
+
+
+class CommitCommandHandler(CommandHandler):
+    """Closes the open transaction and saves its changes."""
+
+    def __init__(self, save_coordinator: SaveCoordinator):
+        self.__save_coordinator = save_coordinator
+        super().__init__(
+            CommandDefinition(
+                "commit",
+                "Saves the changes of the open transaction.",
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Commits the transaction."""
+        try:
+            self.__save_coordinator.commit()
+        except ValueError as e:
+            self.console.print(f"Failed to commit: {e}")
+            return False
+        self.console.print("Transaction committed.")
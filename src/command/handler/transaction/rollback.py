@@ -0,0 +1,27 @@
+"""Handler for the rollback command."""
+
+from src.command.command_description import CommandDefinition
+from src.command.handler.command_handler import CommandHandler
+from src.storage.save_coordinator import SaveCoordinator
+
+
+class RollbackCommandHandler(CommandHandler):
+    """Undoes every change of the open transaction."""
+
+    def __init__(self, save_coordinator: SaveCoordinator):
+        self.__save_coordinator = save_coordinator
+        super().__init__(
+            CommandDefinition(
+                "rollback",
+                "Undoes the changes of the open transaction.",
+            )
+        )
+
+    def _handle(self, args: list[str]) -> bool | None:
+        """Rolls the transaction back."""
+        try:
+            self.__save_coordinator.rollback()
+        except ValueError as e:
+            self.console.print(f"Failed to roll back: {e}")
+            return False
+        self.console.print("Transaction rolled back.")
@@ -1,52 +1,266 @@
+import glob
 import json
 import os
 import shutil
 import tempfile
-from typing import Any, Dict
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Sequence, TypeVar
 from rich import print as rprint
+from src.storage.backend import Change, StorageBackend
+from src.storage.compact_format import (
+    ChecksumError,
+    has_checksum,
+    iter_compact_records,
+    read_header,
+    verify_compact,
+    write_compact,
+)
+from src.storage.file_lock import FileLock
+from src.storage.json_stream import iter_snapshot_items, iter_snapshot_records
+from src.storage.mmap_source import MmapContactSource, open_mmap_source
 from src.util.messages import DATA_SAVED
 
 
 # --- Data storage settings ---
-# Files are persisted in the user's home directory under APP_FOLDER.
+# Files are persisted in the user's home directory under APP_FOLDER, or in
+# the folder named by DATA_DIR_ENV / "--data-dir" (e.g. on a tmpfs). A profile
+# (PROFILE_ENV / "--profile") keeps a separate data set in a subfolder.
 APP_FOLDER = ".cli_assistant"
+DATA_DIR_ENV = "CLI_ASSISTANT_DATA_DIR"
+PROFILE_ENV = "CLI_ASSISTANT_PROFILE"
+PROFILES_FOLDER = "profiles"
 CONTACTS_FILE = "contacts.json"
 NOTES_FILE = "notes.json"
 STORAGE_VERSION = 1
+# Storage mode: "snapshot" rewrites the whole file on every save, "journal"
+# appends one compact record per change and compacts the snapshot only when
+# the journal grows past JOURNAL_COMPACT_BYTES.
+STORAGE_MODE = "snapshot"
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+# Storage backend: "json" keeps contacts.json / notes.json, "sqlite" keeps
+# both stores in SQLITE_FILE with indexed tables and lazy loading.
+STORAGE_BACKEND = "json"
+SQLITE_FILE = "assistant.db"
+# Snapshot file format: "json" writes indented v1 JSON, "compact" writes the
+# version 2 format (one header line, then one JSON array per record). Both
+# are detected automatically on load.
+SNAPSHOT_FORMAT = "json"
+SNAPSHOT_FORMATS = ("json", "compact")
+# Lazy loading: compact contact snapshots are memory-mapped and only a
+# name -> offset index is built at startup; contacts are decoded on first use.
+LAZY_LOAD = False
+# Trusted load: compact snapshots whose records match the header checksum are
+# rehydrated without re-validating every field. "--verify" turns this off.
+TRUSTED_LOAD = True
+# Validation workers: untrusted contact records of imports and of loads with
+# POOLED_LOAD ("--verify") are validated by this many processes; None uses
+# every core and 1 validates in this process. Inputs of fewer than
+# VALIDATION_CHUNK records are always validated in this process. Startup
+# loads are validated in this process: starting the workers costs more than
+# they save on a book of any usual size.
+VALIDATION_WORKERS: int | None = None
+VALIDATION_CHUNK = 2000
+POOLED_LOAD = False
+# Undo history: the inverse records of recent commands, kept within
+# HISTORY_BYTES (their size in JSON; the oldest are dropped first). With
+# HISTORY_PERSIST the history is saved to HISTORY_FILE on exit and read back,
+# so "undo" also works after a restart.
+HISTORY_BYTES = 1024 * 1024
+HISTORY_PERSIST = False
+HISTORY_FILE = "history.json"
+# Save debounce: changes are written by a background thread once no command
+# arrived for this many seconds; 0 saves synchronously after every command.
+SAVE_DEBOUNCE_SECONDS = 1.0
+# Backups: every save keeps the snapshot it replaces as the newest backup
+# generation (contacts.json.bak, then .bak.2, .bak.3, ...), retaining up to
+# BACKUP_GENERATIONS files; 0 keeps none. A generation is a hard link to the
+# replaced file, so a save writes the snapshot bytes only once.
+BACKUP_GENERATIONS = 3
+# Fsync policy of snapshot and journal writes: "none" leaves flushing to the
+# OS, "file" syncs a written file before it replaces the old one, and
+# "file+dir" also syncs the folder so that the rename survives a power loss.
+FSYNC_POLICY = "file+dir"
+FSYNC_POLICIES = ("none", "file", "file+dir")
+# A main file that cannot be read in full is kept under this suffix, so that
+# saving the recovered (or empty) data never destroys what was left of it.
+DAMAGED_SUFFIX = ".damaged"
+# Repair on load: a damaged main file is kept under DAMAGED_SUFFIX and
+# replaced by the newest readable backup. "--verify" turns this off, so that
+# checking the files only reports problems and never writes.
+REPAIR_ON_LOAD = True
+# Sessions sharing the files coordinate through "<file>.lock": loads hold it
+# shared, saves hold it exclusive.
+LOCK_SUFFIX = ".lock"
 # -----------------------------------
 
+T = TypeVar("T")
 
-class DataStorage:
+
+class SnapshotVersionError(ValueError):
+    """Raised when a snapshot file has an unsupported version."""
+
+
+class StorageConfig:
     """
-    Manages atomic saving, backup, and restoration of JSON data.
-    Persists files inside the user's home directory (APP_FOLDER) using UTF-8.
+    Where the data files of a session live.
+
+    The folder is resolved and created once, when the configuration is
+    built; every storage opened with it reuses the folder. Sessions with
+    different folders or profiles never touch each other's files.
     """
 
-    def __init__(self, filename: str):
-        home_dir = os.path.expanduser("~")
-        self.storage_dir = os.path.join(home_dir, APP_FOLDER)
+    def __init__(self, data_dir: str | None = None, profile: str | None = None):
+        """
+        :param data_dir: Base folder; defaults to APP_FOLDER in the home directory.
+        :param profile: Name of a separate data set inside the base folder.
+        :raises ValueError: If the profile name is not a plain folder name.
+        :raises OSError: If an explicitly given folder cannot be created.
+        """
+        if profile is not None and (not re.fullmatch(r"[\w.-]+", profile) or profile in (".", "..")):
+            raise ValueError(f"Invalid profile name '{profile}'.")
+        self.profile = profile
+        base = os.path.abspath(os.path.expanduser(data_dir)) if data_dir else None
+        storage_dir = base or os.path.join(os.path.expanduser("~"), APP_FOLDER)
+        if profile:
+            storage_dir = os.path.join(storage_dir, PROFILES_FOLDER, profile)
 
         try:
-            os.makedirs(self.storage_dir, exist_ok=True)
-        except Exception as e:
+            os.makedirs(storage_dir, exist_ok=True)
+        except OSError as e:
+            if base is not None or profile:
+                raise
             # Fallback to current directory if we cannot create the folder.
             print(
-                f"FATAL ERROR: Could not create storage directory {self.storage_dir}: {e}. "
+                f"FATAL ERROR: Could not create storage directory {storage_dir}: {e}. "
                 "Falling back to current directory."
             )
-            self.storage_dir = "."
+            storage_dir = "."
+        self.storage_dir = storage_dir
+
+    @classmethod
+    def from_environment(cls) -> "StorageConfig":
+        """Build the configuration named by DATA_DIR_ENV and PROFILE_ENV."""
+        return _environment_config(
+            os.environ.get(DATA_DIR_ENV) or None,
+            os.environ.get(PROFILE_ENV) or None,
+            os.path.expanduser("~"),
+        )
+
+    def path(self, filename: str) -> str:
+        """Return the full path of a data file."""
+        return os.path.join(self.storage_dir, filename)
+
+
+@lru_cache(maxsize=None)
+def _environment_config(data_dir: str | None, profile: str | None, _home: str) -> StorageConfig:
+    # Cached per environment, so the folder is resolved once per setting.
+    return StorageConfig(data_dir, profile)
+
+
+_config: StorageConfig | None = None
+
+
+def use_config(config: StorageConfig | None) -> None:
+    """Make ``config`` the configuration of every storage opened from now on."""
+    global _config
+    _config = config
+
+
+def current_config() -> StorageConfig:
+    """Return the configuration set by ``use_config``, or the one from the environment."""
+    return _config or StorageConfig.from_environment()
+
+
+def resolve_storage_dir() -> str:
+    """Return the storage folder of the current configuration."""
+    return current_config().storage_dir
 
-        self.filename = os.path.join(self.storage_dir, filename)
+
+def open_storage(filename: str, config: StorageConfig | None = None) -> StorageBackend:
+    """Return the configured storage backend for CONTACTS_FILE or NOTES_FILE."""
+    config = config or current_config()
+    if STORAGE_BACKEND == "sqlite":
+        # Imported lazily: the SQLite backend depends on the model layer.
+        from src.storage.sqlite_storage import open_sqlite_storage
+        return open_sqlite_storage(filename, config.storage_dir)
+    return DataStorage(filename, config)
+
+
+class DataStorage(StorageBackend):
+    """
+    Manages atomic saving, backup, and restoration of JSON data.
+    Persists files in the folder of a ``StorageConfig`` using UTF-8.
+
+    Crash safety: a snapshot is written to a temporary file and renamed over
+    the main file, so the main file always holds either the old or the new
+    complete snapshot. Backup generations are previous complete snapshots;
+    loading falls back to the newest one that reads cleanly. With the
+    "file+dir" fsync policy a save that returned True survives a power loss,
+    with "file" the rename may be lost (the old snapshot is then loaded), and
+    with "none" recently written data may be lost as well.
+
+    Concurrent sessions: reads hold ``lock`` shared and writes exclusive.
+    Each storage remembers the identity (inode, size, mtime) of the snapshot
+    and journal it last read or wrote; ``changed_on_disk`` compares it with
+    the files to detect writes of other sessions with two ``stat`` calls.
+    """
+
+    def __init__(self, filename: str, config: StorageConfig | None = None):
+        config = config or current_config()
+        self.storage_dir = config.storage_dir
+        self.filename = config.path(filename)
         self.backup_filename = self.filename + ".bak"
+        self.journal_filename = self.filename + JOURNAL_SUFFIX
+        self.journal_enabled = STORAGE_MODE == "journal"
+        self.snapshot_format = SNAPSHOT_FORMAT
+        self.backup_generations = BACKUP_GENERATIONS
+        self.fsync_policy = FSYNC_POLICY
+
+        # Sequence number of the last change contained in the snapshot or journal.
+        self.last_seq = 0
+        self.__snapshot_seq = 0
+        self.__compaction: threading.Thread | None = None
+        self.__mmap_source: MmapContactSource | None = None
+        self.lock = FileLock(self.filename + LOCK_SUFFIX)
+        self.__signature = self._disk_signature()
 
         # Use the storage version constant
         self.initial_data: Dict[str, Any] = {"version": STORAGE_VERSION, "data": []}
 
     def _load_file(self, file_path: str) -> Dict[str, Any] | None:
-        """Reads data from a file with UTF-8 encoding set."""
+        """Reads data from a file with UTF-8 encoding set, in either format."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                header = read_header(f)
+                damaged: list[int] = []
+                if header is None:
+                    try:
+                        return json.load(f)
+                    except json.JSONDecodeError:
+                        f.seek(0)
+                    meta: Dict[str, Any] = {}
+                    items = list(iter_snapshot_items(f, meta, damaged))
+                    if not items:
+                        return None
+                    data = dict(items) if items[0][0] is not None else [record for _, record in items]
+                    self._report_damaged(file_path, damaged)
+                    if file_path == self.filename:
+                        self._keep_damaged()
+                    return {**meta, "data": data}
+                records = iter_compact_records(f, header, damaged=damaged)
+                if header.get("keyed"):
+                    data = dict(records)
+                else:
+                    data = [record for _, record in records]
+                if damaged:
+                    self._report_damaged(file_path, damaged)
+                    if file_path == self.filename:
+                        self._keep_damaged()
+                return {"version": STORAGE_VERSION, "data": data, "seq": header.get("seq", 0)}
         except (FileNotFoundError, json.JSONDecodeError):
             return None
         except Exception as e:
@@ -55,14 +269,303 @@ class DataStorage:
 
     def load_data(self) -> Dict[str, Any]:
         """
-        Load data, attempting recovery from .bak if the main file is missing or corrupted.
+        Load data, attempting recovery from the newest readable backup
+        generation if the main file is missing or corrupted.
+        """
+        with self.read_session():
+            data = self._load_snapshot()
+        self.__snapshot_seq = self.last_seq = data.get("seq", 0)
+        return data
+
+    def record_source(self) -> MmapContactSource | None:
+        """
+        Return a memory-mapped source over a compact contacts snapshot when
+        LAZY_LOAD is enabled; other files are loaded in full.
+        """
+        if not LAZY_LOAD:
+            return None
+        self._release_source()
+        with self.read_session():
+            source = open_mmap_source(self.filename)
+        if source is not None:
+            # "--verify" loads untrusted: every record is validated when read.
+            source.trusted = source.trusted and TRUSTED_LOAD
+            self.__snapshot_seq = self.last_seq = source.seq
+            self.__mmap_source = source
+        return source
+
+    def load_records(self, build: Callable[[Iterable[Dict[str, Any]], bool], T]) -> T | None:
+        """
+        Stream the snapshot records into ``build`` one at a time.
+
+        Records are decoded incrementally, so the file is never held in memory
+        as a whole. The checksum of compact snapshots is verified, and their
+        records are passed as trusted when TRUSTED_LOAD is set; if the
+        checksum turns out not to match, the file is read again untrusted.
+        Records of compact snapshots with line checksums are checked one by
+        one instead: damaged records are skipped and the intact ones kept.
+        Records of v1 files that fail to decode are skipped the same way.
+
+        If the main file turns out to be damaged, ``build`` is called again
+        with the records of each backup generation, newest first; with
+        REPAIR_ON_LOAD, the first one that loads replaces the main file, and a
+        main file that could not be read in full is kept with the
+        DAMAGED_SUFFIX.
+        """
+        with self.read_session():
+            return self._load_records(build)
+
+    def _load_records(self, build: Callable[[Iterable[Dict[str, Any]], bool], T]) -> T | None:
+        for path in (self.filename, *self.backup_files()):
+            header: Dict[str, Any] = {}
+            damaged: list[int] = []
+            try:
+                checked = self._has_checksum(path)
+                try:
+                    result = build(
+                        self._stream_records(path, header, checked, damaged), TRUSTED_LOAD and checked
+                    )
+                except ChecksumError:
+                    print(f"⚠️ Checksum mismatch in '{path}'. Validating every record.")
+                    result = build(self._stream_records(path, header), False)
+            except FileNotFoundError:
+                continue
+            except SnapshotVersionError:
+                print(
+                    f"❌ {'Main' if path == self.filename else 'Backup'} file version mismatch. "
+                    f"Expected {STORAGE_VERSION}, found {header.get('version')}. Using initial data."
+                )
+                self._keep_damaged()
+                return None
+            except (OSError, ValueError) as e:
+                if not isinstance(e, json.JSONDecodeError):
+                    print(f"Error reading file {path}: {e}")
+                if path == self.filename:
+                    self._keep_damaged()
+                continue
+
+            if damaged:
+                self._report_damaged(path, damaged)
+                if path == self.filename:
+                    self._keep_damaged()
+            if path != self.filename:
+                print(f"⚠️ Main file '{self.filename}' is damaged. Restore from backup.")
+                self._restore_backup(path)
+            self.__snapshot_seq = self.last_seq = header.get("seq", 0)
+            return result
+
+        if not self._journal_files():
+            # Before the first compaction, the journal alone holds the data.
+            print(f"ℹ️ File '{self.filename}' not found or cannot be loaded. New data created.")
+        return None
+
+    @staticmethod
+    def _has_checksum(path: str) -> bool:
+        """Whether the file is a compact snapshot carrying a record checksum."""
+        with open(path, "r", encoding="utf-8") as f:
+            return has_checksum(read_header(f))
+
+    @staticmethod
+    def _stream_records(
+        path: str,
+        header: Dict[str, Any],
+        verify: bool = False,
+        damaged: list[int] | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of a snapshot file, checking its version first and,
+        with ``verify``, the checksum of a compact file last. Line numbers of
+        damaged records are collected in ``damaged``, if given: compact
+        records fail their line checksum, v1 records fail to decode.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            compact_header = read_header(f)
+            if compact_header is not None:
+                header["seq"] = compact_header.get("seq", 0)
+                header["version"] = STORAGE_VERSION
+                for _, record in iter_compact_records(f, compact_header, verify, damaged):
+                    yield record
+                return
+
+            for record in iter_snapshot_records(f, header, damaged):
+                if header.get("version") != STORAGE_VERSION:
+                    raise SnapshotVersionError(header.get("version"))
+                yield record
+        if header.get("version") != STORAGE_VERSION:
+            raise SnapshotVersionError(header.get("version"))
+
+    # ----- Concurrent sessions --------------------------------------------
+    @contextmanager
+    def read_session(self) -> Iterator[None]:
+        """
+        Hold the files for a consistent read of the snapshot and journal.
+        Other sessions may read at the same time, but not write.
+        """
+        with self.lock.shared():
+            yield
+            self.__signature = self._disk_signature()
+
+    @contextmanager
+    def write_session(self) -> Iterator[None]:
+        """
+        Hold the files exclusively for a check-merge-write cycle. A running
+        background compaction is finished first.
+        """
+        self.wait_for_compaction()
+        with self.lock.exclusive():
+            yield
+
+    def changed_on_disk(self) -> bool:
+        """Whether another session wrote since this storage last read or wrote."""
+        return self._disk_signature() != self.__signature
+
+    def new_changes(self) -> list[Change] | None:
+        """
+        Return the journal changes other sessions appended since this storage
+        last read or wrote, oldest first. Returns None when that is not
+        enough to catch up (snapshot mode, or the snapshot was rewritten), so
+        the store has to be loaded again.
+        """
+        if not self.journal_enabled:
+            return None
+        with self.lock.shared():
+            signature = self._disk_signature()
+            if signature[0] != self.__signature[0]:
+                return None
+            changes = []
+            for path in self._journal_files():
+                for record in self._read_journal_file(path):
+                    if record["s"] > self.last_seq:
+                        changes.append((record["op"], record["k"], record["a"]))
+                        self.last_seq = record["s"]
+            self.__signature = signature
+        return changes
+
+    def _disk_signature(self) -> tuple:
+        """Identify the current snapshot and journal files by inode, size and mtime."""
+        signature = []
+        for path in (self.filename, self.journal_filename):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+    @staticmethod
+    def _report_damaged(path: str, lines: list[int]) -> None:
+        shown = ", ".join(map(str, lines[:10])) + (", ..." if len(lines) > 10 else "")
+        print(f"⚠️ Skipped {len(lines)} damaged record(s) in '{path}' (line {shown}). Intact records were kept.")
+
+    def _keep_damaged(self) -> None:
+        """Keep the current main file as DAMAGED_SUFFIX before it is replaced."""
+        if not REPAIR_ON_LOAD or not os.path.exists(self.filename):
+            return
+        damaged_path = self.filename + DAMAGED_SUFFIX
+        try:
+            if os.path.exists(damaged_path):
+                os.remove(damaged_path)
+            try:
+                os.link(self.filename, damaged_path)
+            except OSError:
+                shutil.copy2(self.filename, damaged_path)
+            print(f"ℹ️ The damaged file was kept as '{damaged_path}'.")
+        except OSError as e:
+            print(f"❌ Unable to keep the damaged file '{self.filename}': {e}")
+
+    def verify(self) -> list[str]:
+        """
+        Check the snapshot file against its checksums without loading it.
+
+        Fast enough for every startup: a compact snapshot is read once as
+        bytes; v1 JSON files carry no checksums and are not checked.
+
+        :return: Descriptions of all problems found; empty if there are none.
+        """
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                compact = read_header(f) is not None
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            return [str(e)]
+        return verify_compact(self.filename) if compact else []
+
+    def backup_path(self, generation: int) -> str:
+        """Return the file of backup ``generation``; generation 1 is the newest."""
+        if generation == 1:
+            return self.backup_filename
+        return f"{self.backup_filename}.{generation}"
+
+    def backup_files(self) -> list[str]:
+        """Return the existing backup generations, newest first."""
+        generations = range(1, max(self.backup_generations, 1) + 1)
+        return [path for path in map(self.backup_path, generations) if os.path.exists(path)]
+
+    def _rotate_backups(self) -> None:
+        """
+        Shift every backup generation one step older, dropping the oldest,
+        and keep the current main file as the newest generation.
         """
+        if self.backup_generations <= 0 or not os.path.exists(self.filename):
+            return
+        for generation in range(self.backup_generations, 1, -1):
+            newer = self.backup_path(generation - 1)
+            if os.path.exists(newer):
+                os.replace(newer, self.backup_path(generation))
+        if os.path.exists(self.backup_filename):
+            os.remove(self.backup_filename)
+        try:
+            os.link(self.filename, self.backup_filename)
+        except OSError:
+            # No hard links on this file system: fall back to a copy.
+            shutil.copy2(self.filename, self.backup_filename)
+
+    def _fsync_file(self, file) -> None:
+        """Flush ``file`` to disk unless the fsync policy is "none"."""
+        if self.fsync_policy != "none":
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _fsync_dir(self) -> None:
+        """Flush the storage folder, and so its renames, under the "file+dir" policy."""
+        if self.fsync_policy != "file+dir" or not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.storage_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _restore_backup(self, backup_path: str) -> None:
+        """Atomically replace the main file with a copy of a backup generation."""
+        if not REPAIR_ON_LOAD:
+            return
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.storage_dir)
+        os.close(temp_fd)
+        try:
+            shutil.copy2(backup_path, temp_path)
+            if self.fsync_policy != "none":
+                with open(temp_path, "rb") as f:
+                    os.fsync(f.fileno())
+            os.replace(temp_path, self.filename)
+            self._fsync_dir()
+        except Exception as e:
+            print(f"❌ Unable to restore the main file from the backup: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _load_snapshot(self) -> Dict[str, Any]:
+        """Load the snapshot file or its newest readable backup generation."""
         data = self._load_file(self.filename)
 
         if data is None:
-            backup_data = self._load_file(self.backup_filename)
-
-            if backup_data is not None:
+            self._keep_damaged()
+            for backup_path in self.backup_files():
+                backup_data = self._load_file(backup_path)
+                if backup_data is None:
+                    continue
                 print(f"⚠️ Main file '{self.filename}' is damaged. Restore from backup.")
 
                 if backup_data.get("version") != STORAGE_VERSION:
@@ -72,14 +575,11 @@ class DataStorage:
                     )
                     return self.initial_data
 
-                try:
-                    self.save_data(backup_data)
-                    return backup_data
-                except Exception as e:
-                    print(f"❌ Unable to restore the main file from the backup: {e}")
-                    return self.initial_data
+                self._restore_backup(backup_path)
+                return backup_data
 
-            print(f"ℹ️ File '{self.filename}' not found or cannot be loaded. New data created.")
+            if not self._journal_files():
+                print(f"ℹ️ File '{self.filename}' not found or cannot be loaded. New data created.")
             return self.initial_data
 
         if data.get("version") != STORAGE_VERSION:
@@ -87,16 +587,19 @@ class DataStorage:
                 f"❌ Main file version mismatch. Expected {STORAGE_VERSION}, "
                 f"found {data.get('version')}. Using initial data."
             )
+            self._keep_damaged()
             return self.initial_data
 
         return data
 
-    def save_data(self, data: Dict[str, Any], silent: bool = False) -> None:
+    def save_data(self, data: Dict[str, Any], silent: bool = False) -> bool:
         """
         Atomically save data:
-        1. Create a backup copy of the existing main file.
-        2. Write new data to a temporary file.
-        3. Replace the main file with the temp file.
+        1. Write new data to a temporary file and sync it (fsync policy).
+        2. Rotate the backups; the existing main file becomes the newest one.
+        3. Replace the main file with the temp file and sync the folder.
+
+        Returns True when the data reached the main file.
         """
 
         if not isinstance(data, dict) or "version" not in data or data.get("version") != STORAGE_VERSION:
@@ -106,28 +609,238 @@ class DataStorage:
                 )
             else:
                 print("❌ Error: Invalid data format for saving. Saving canceled.")
-            return
+            return False
 
-        if os.path.exists(self.filename):
-            try:
-                shutil.copy2(self.filename, self.backup_filename)
-            except Exception as e:
-                print(f"❌ Error creating backup '{self.backup_filename}': {e}")
+        with self.lock.exclusive():
+            saved = self._write_snapshot(data, silent)
+            self.__signature = self._disk_signature()
+        return saved
 
+    def _write_snapshot(self, data: Dict[str, Any], silent: bool) -> bool:
         temp_fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.storage_dir)
 
         try:
-            with os.fdopen(temp_fd, "w", encoding="utf-8") as tmp_file:
-                json.dump(data, tmp_file, indent=4, ensure_ascii=False)
+            # "\n" line ends on every platform keep compact checksums portable.
+            with os.fdopen(temp_fd, "w", encoding="utf-8", newline="\n") as tmp_file:
+                if self.snapshot_format == "compact":
+                    write_compact(tmp_file, data)
+                else:
+                    if not self.journal_enabled and not self._journal_files():
+                        # Without a journal to resume, v1 files keep their original shape.
+                        data = {key: value for key, value in data.items() if key != "seq"}
+                    json.dump(data, tmp_file, indent=4, ensure_ascii=False)
+                self._fsync_file(tmp_file)
+
+            try:
+                self._rotate_backups()
+            except Exception as e:
+                print(f"❌ Error creating backup '{self.backup_filename}': {e}")
 
             os.replace(temp_path, self.filename)
+            self._fsync_dir()
             if not silent:
                 rprint(DATA_SAVED.format(filename=self.filename))
-
-            if os.path.exists(self.backup_filename):
-                os.remove(self.backup_filename)
+            return True
 
         except Exception as e:
             print(f"❌ Error during data write: {e}. Existing data preserved.")
             if os.path.exists(temp_path):
                 os.remove(temp_path)
+            return False
+
+    def convert(self, snapshot_format: str) -> bool:
+        """
+        Rewrite the snapshot in ``snapshot_format`` ("json" or "compact").
+
+        The journal stays valid, as the snapshot keeps its sequence number.
+        Returns True if there was nothing to convert or the file was rewritten.
+        """
+        if snapshot_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unknown snapshot format '{snapshot_format}'.")
+        if not os.path.exists(self.filename) and not self.backup_files():
+            return True
+        data = self.load_data()
+        if data is self.initial_data:
+            return False
+        self.snapshot_format = snapshot_format
+        return self.save_data(dict(data, seq=self.last_seq), silent=True)
+
+    # ----- Journal -------------------------------------------------------
+    def save_changes(
+        self,
+        changes: Sequence[Change],
+        build_snapshot: Callable[[], Dict[str, Any]],
+        silent: bool = False,
+    ) -> bool:
+        """
+        Persist a batch of changes according to the storage mode.
+
+        In snapshot mode the full snapshot is rewritten. In journal mode the
+        changes are appended to the journal, and the snapshot is compacted in
+        the background once the journal passes JOURNAL_COMPACT_BYTES.
+        """
+        with self.lock.exclusive():
+            if not self.journal_enabled:
+                snapshot = build_snapshot()
+                self._release_source()
+                return self._write_compacted_snapshot(dict(snapshot, seq=self.last_seq), silent=silent)
+
+            if not self.append_journal(changes):
+                return False
+            if not silent:
+                rprint(DATA_SAVED.format(filename=self.journal_filename))
+            if self._journal_size() >= JOURNAL_COMPACT_BYTES:
+                snapshot = build_snapshot()
+                self._release_source()
+                self.compact(snapshot)
+            return True
+
+    def _release_source(self) -> None:
+        """
+        Unmap the lazy source before its file is replaced. Building a snapshot
+        reads every record, so the source is no longer needed.
+        """
+        if self.__mmap_source is not None:
+            self.__mmap_source.close()
+            self.__mmap_source = None
+
+    def append_journal(self, changes: Sequence[Change]) -> bool:
+        """
+        Append changes to the journal, one compact JSON line per change.
+
+        Unless the fsync policy is "none", the file is flushed and fsync'ed
+        before returning, so an acknowledged change survives a crash. A torn
+        last line is ignored on replay.
+        """
+        if not changes:
+            return True
+
+        lines = []
+        seq = self.last_seq
+        for op, key, args in changes:
+            seq += 1
+            record = {"s": seq, "op": op, "k": key, "a": list(args)}
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+        with self.lock.exclusive():
+            created = not os.path.exists(self.journal_filename)
+            try:
+                with open(self.journal_filename, "a", encoding="utf-8") as journal:
+                    journal.write("\n".join(lines) + "\n")
+                    self._fsync_file(journal)
+                if created:
+                    self._fsync_dir()
+            except Exception as e:
+                print(f"❌ Error writing journal '{self.journal_filename}': {e}.")
+                return False
+            self.__signature = self._disk_signature()
+
+        self.last_seq = seq
+        return True
+
+    def replay_journal(self) -> Iterator[Change]:
+        """
+        Yield journal changes newer than the loaded snapshot, oldest first.
+
+        Must be called after ``load_data`` or ``load_records``. Rotated journals left over by an
+        unfinished compaction are replayed before the current journal.
+        """
+        for path in self._journal_files():
+            for record in self._read_journal_file(path):
+                if record["s"] <= self.__snapshot_seq:
+                    continue
+                self.last_seq = max(self.last_seq, record["s"])
+                yield record["op"], record["k"], record["a"]
+
+    def compact(self, data: Dict[str, Any]) -> None:
+        """
+        Write ``data`` as the new snapshot in a background thread.
+
+        The current journal is rotated first so that new changes can be
+        appended while the snapshot is written; the rotated journal is removed
+        only after the snapshot has replaced the main file.
+        """
+        self.wait_for_compaction()
+
+        snapshot = dict(data, seq=self.last_seq)
+        with self.lock.exclusive():
+            if os.path.exists(self.journal_filename):
+                os.replace(self.journal_filename, f"{self.journal_filename}.{self.last_seq}")
+            self.__signature = self._disk_signature()
+
+        self.__compaction = threading.Thread(
+            target=self._compact_in_background,
+            args=(snapshot, self.__signature),
+            name=f"compact-{os.path.basename(self.filename)}",
+        )
+        self.__compaction.start()
+
+    def _compact_in_background(self, snapshot: Dict[str, Any], signature: tuple) -> None:
+        """Write the compacted snapshot unless another session wrote since the rotation."""
+        with self.lock.exclusive():
+            if self._disk_signature() != signature:
+                # The rotated journal stays and is compacted by a later save.
+                return
+            self._write_compacted_snapshot(snapshot)
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running background compaction has finished."""
+        if self.__compaction is not None:
+            self.__compaction.join()
+            self.__compaction = None
+
+    def _write_compacted_snapshot(self, snapshot: Dict[str, Any], silent: bool = True) -> bool:
+        """Write the snapshot, then drop the journals it already contains."""
+        if not self.save_data(snapshot, silent=silent):
+            return False
+        for path in self._journal_files():
+            if path == self.journal_filename and self.journal_enabled:
+                # Changes appended during a background compaction are kept.
+                continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"❌ Error removing compacted journal '{path}': {e}")
+        self.__signature = self._disk_signature()
+        return True
+
+    def _journal_files(self) -> list[str]:
+        """Return rotated journals ordered by sequence, then the current journal."""
+        rotated = sorted(
+            glob.glob(glob.escape(self.journal_filename) + ".*"),
+            key=self._rotated_seq,
+        )
+        rotated = [path for path in rotated if self._rotated_seq(path) >= 0]
+        if os.path.exists(self.journal_filename):
+            rotated.append(self.journal_filename)
+        return rotated
+
+    def _rotated_seq(self, path: str) -> int:
+        suffix = path[len(self.journal_filename) + 1:]
+        return int(suffix) if suffix.isdigit() else -1
+
+    def _journal_size(self) -> int:
+        try:
+            return os.path.getsize(self.journal_filename)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _read_journal_file(path: str) -> Iterator[Dict[str, Any]]:
+        """Read journal records, stopping at the first damaged line."""
+        try:
+            with open(path, "r", encoding="utf-8") as journal:
+                for line_no, line in enumerate(journal, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        print(
+                            f"⚠️ Journal '{path}' is damaged at line {line_no}. "
+                            "Later changes are ignored."
+                        )
+                        return
+                    yield record
+        except OSError as e:
+            print(f"Error reading journal {path}: {e}")
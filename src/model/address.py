@@ -1,8 +1,12 @@
+import sys
+
 from src.model.field import Field
 from src.util.messages import INVALID_ADDRESS
 
 # Represents an address field
 class Address(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         if not isinstance(value, str):
             raise ValueError(INVALID_ADDRESS)
@@ -11,7 +15,12 @@ class Address(Field):
         if not clean_value:
             raise ValueError(INVALID_ADDRESS)
             
-        super().__init__(clean_value)
+        # Contacts often share an address (families, offices): keep one copy.
+        super().__init__(sys.intern(clean_value))
+
+    @classmethod
+    def trusted(cls, value):
+        return super().trusted(sys.intern(value))
 
     def __str__(self):
         return str(self.value)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from src.model.field import Field
 from src.util.messages import INVALID_BIRTHDAY
@@ -6,9 +6,16 @@ from src.util.messages import INVALID_BIRTHDAY
 
 # Represents a birthday field with date validation
 class Birthday(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         try:
             date_obj = datetime.strptime(value, "%d.%m.%Y").date()
             super().__init__(date_obj)
         except ValueError as exc:
             raise ValueError(INVALID_BIRTHDAY) from exc
+
+    @classmethod
+    def trusted(cls, value):
+        """Create a birthday from a persisted DD.MM.YYYY string without strptime."""
+        return super().trusted(date(int(value[6:]), int(value[3:5]), int(value[:2])))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Type, TypeVar
+from typing import Callable, Type, TypeVar
 
 from src.model.address import Address
 from src.model.birthday import Birthday
@@ -12,6 +12,8 @@ from src.model.phone import Phone
 from src.util.messages import ADDRESS_NOT_FOUND, PHONE_NOT_FOUND, EMAIL_NOT_FOUND, BIRTHDAY_NOT_FOUND, PHONE_ALREADY_EXISTS, EMAIL_ALREADY_EXISTS, ADDRESS_ALREADY_EXISTS
 
 FieldType = TypeVar("FieldType", Name, Phone, Email, Address, Birthday)
+ChangeCallback = Callable[["Contact", str, tuple], None]
+ChangingCallback = Callable[["Contact"], None]
 
 
 class Contact:
@@ -23,12 +25,17 @@ class Contact:
     dedicated helper methods so that commands can focus on a single value at a time.
     """
 
+    __slots__ = ("name", "phones", "emails", "addresses", "birthday", "_on_change", "_on_changing")
+
     def __init__(self, name: Name | str, phone: Phone | str) -> None:
         self.name: Name = self._coerce(name, Name)
         self.phones: list[Phone] = [self._coerce(phone, Phone)]
         self.emails: list[Email] = []
         self.addresses: list[Address] = []
         self.birthday: Birthday | None = None
+        # Set by the owning ContactBook so it can track changes of this record.
+        self._on_change: ChangeCallback | None = None
+        self._on_changing: ChangingCallback | None = None
 
     @staticmethod
     def _coerce(value: FieldType | str, field_cls: Type[FieldType]) -> FieldType:
@@ -38,12 +45,26 @@ class Contact:
             return value
         return field_cls(value)
 
+    def _changing(self) -> None:
+        """Tell the owner that a field is about to change, e.g. to keep its current state."""
+
+        if self._on_changing is not None:
+            self._on_changing(self)
+
+    def _changed(self, op: str, *args: str) -> None:
+        """Report a mutation (method name and its plain arguments) to the owner."""
+
+        if self._on_change is not None:
+            self._on_change(self, op, args)
+
     # ----- Phone handling -------------------------------------------------
     def add_phone(self, phone: Phone | str) -> Phone:
         phone_obj = self._coerce(phone, Phone)
         if any(existing.value == phone_obj.value for existing in self.phones):
             raise ValueError(PHONE_ALREADY_EXISTS.format(name=self.name.value))
+        self._changing()
         self.phones.append(phone_obj)
+        self._changed("add_phone", phone_obj.value)
         return phone_obj
 
     def remove_phone(self, phone: Phone | str) -> Phone:
@@ -52,7 +73,10 @@ class Contact:
             if existing.value == phone_value:
                 if len(self.phones) == 1:
                     raise ValueError("Contact must keep at least one phone number.")
-                return self.phones.pop(idx)
+                self._changing()
+                removed = self.phones.pop(idx)
+                self._changed("remove_phone", removed.value)
+                return removed
         raise ValueError(PHONE_NOT_FOUND.format(phone=phone_value, name=self.name.value))
 
     def update_phone(self, old_phone: Phone | str, new_phone: Phone | str) -> Phone:
@@ -64,7 +88,9 @@ class Contact:
 
         for idx, existing in enumerate(self.phones):
             if existing.value == old_value:
+                self._changing()
                 self.phones[idx] = new_obj
+                self._changed("update_phone", existing.value, new_obj.value)
                 return new_obj
         raise ValueError(PHONE_NOT_FOUND.format(phone=old_value, name=self.name.value))
 
@@ -73,14 +99,19 @@ class Contact:
         email_obj = self._coerce(email, Email)
         if any(e.value.lower() == email_obj.value.lower() for e in self.emails):
             raise ValueError(EMAIL_ALREADY_EXISTS.format(name=self.name.value))
+        self._changing()
         self.emails.append(email_obj)
+        self._changed("add_email", email_obj.value)
         return email_obj
 
     def remove_email(self, email: Email | str) -> Email:
         email_value = self._coerce(email, Email).value.lower()
         for idx, existing in enumerate(self.emails):
             if existing.value.lower() == email_value:
-                return self.emails.pop(idx)
+                self._changing()
+                removed = self.emails.pop(idx)
+                self._changed("remove_email", removed.value)
+                return removed
         raise ValueError(EMAIL_NOT_FOUND.format(name=self.name.value))
 
     def update_email(self, old_email: Email | str, new_email: Email | str) -> Email:
@@ -90,7 +121,9 @@ class Contact:
             raise ValueError(EMAIL_ALREADY_EXISTS.format(name=self.name.value))
         for idx, existing in enumerate(self.emails):
             if existing.value.lower() == old_value:
+                self._changing()
                 self.emails[idx] = new_obj
+                self._changed("update_email", existing.value, new_obj.value)
                 return new_obj
         raise ValueError(EMAIL_NOT_FOUND.format(name=self.name.value))
 
@@ -99,14 +132,19 @@ class Contact:
         address_obj = self._coerce(address, Address)
         if any(a.value == address_obj.value for a in self.addresses):
             raise ValueError(ADDRESS_ALREADY_EXISTS.format(name=self.name.value))
+        self._changing()
         self.addresses.append(address_obj)
+        self._changed("add_address", address_obj.value)
         return address_obj
 
     def remove_address(self, address: Address | str) -> Address:
         address_value = self._coerce(address, Address).value
         for idx, existing in enumerate(self.addresses):
             if existing.value == address_value:
-                return self.addresses.pop(idx)
+                self._changing()
+                removed = self.addresses.pop(idx)
+                self._changed("remove_address", removed.value)
+                return removed
         raise ValueError(ADDRESS_NOT_FOUND.format(name=self.name.value))
 
     def update_address(self, old_address: Address | str, new_address: Address | str) -> Address:
@@ -116,13 +154,18 @@ class Contact:
             raise ValueError(ADDRESS_ALREADY_EXISTS.format(name=self.name.value))
         for idx, existing in enumerate(self.addresses):
             if existing.value == old_value:
+                self._changing()
                 self.addresses[idx] = new_obj
+                self._changed("update_address", existing.value, new_obj.value)
                 return new_obj
         raise ValueError(ADDRESS_NOT_FOUND.format(name=self.name.value))
 
     # ----- Birthday handling ----------------------------------------------
     def set_birthday(self, birthday: Birthday | str) -> Birthday:
-        self.birthday = self._coerce(birthday, Birthday)
+        birthday_obj = self._coerce(birthday, Birthday)
+        self._changing()
+        self.birthday = birthday_obj
+        self._changed("set_birthday", self.birthday.value.strftime("%d.%m.%Y"))
         return self.birthday
 
     def clear_birthday(self, birthday: Birthday | str | None = None) -> None:
@@ -132,9 +175,21 @@ class Contact:
             existing_value = self._coerce(birthday, Birthday).value
             if self.birthday.value != existing_value:
                 raise ValueError("Provided birthday does not match the existing value.")
+        self._changing()
         self.birthday = None
+        self._changed("clear_birthday")
 
     # ----- Utility helpers ------------------------------------------------
+    def _snapshot(self) -> tuple:
+        """Return the mutable state of the contact; the lists are copied, the fields shared."""
+
+        return self.phones[:], self.emails[:], self.addresses[:], self.birthday
+
+    def _restore(self, state: tuple) -> None:
+        """Return to a state taken by ``_snapshot``, without reporting a change."""
+
+        self.phones, self.emails, self.addresses, self.birthday = state
+
     def to_dict(self) -> dict[str, object]:
         """Return a serialisable representation of the contact."""
 
@@ -179,3 +234,21 @@ class Contact:
             contact.set_birthday(birthday)
 
         return contact
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, object]) -> "Contact":
+        """
+        Rehydrate a Contact from a to_dict result that was persisted by this
+        application and passed the storage checksum: fields are built
+        without validation or duplicate checks.
+        """
+        contact = cls.__new__(cls)
+        contact.name = Name.trusted(data["name"])
+        contact.phones = [Phone.trusted(phone) for phone in data["phones"]]
+        contact.emails = [Email.trusted(email) for email in data.get("emails") or []]
+        contact.addresses = [Address.trusted(address) for address in data.get("addresses") or []]
+        birthday = data.get("birthday")
+        contact.birthday = Birthday.trusted(birthday) if birthday else None
+        contact._on_change = None
+        contact._on_changing = None
+        return contact
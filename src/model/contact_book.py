@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import calendar
 from collections import UserDict
-from datetime import datetime, timedelta
-from typing import Optional
+from contextlib import suppress
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
 
-from src.data_storage import DataStorage, CONTACTS_FILE, STORAGE_VERSION
+from src import data_storage
+from src.data_storage import CONTACTS_FILE, STORAGE_VERSION, open_storage
+from src.storage.backend import Change, ContactSource, StorageBackend
 from src.model.contact import Contact
+from src.model.contact_columns import ContactColumns
+from src.model.contact_index import DAY_SLOTS, ContactIndex
+from src.model.history import History
 from src.model.name import Name
+from src.model.validation_pool import validate_contacts
 from src.model.birthday import Birthday
 
+# Contact methods that may be replayed from a change record.
+CONTACT_OPERATIONS = frozenset({
+    "add_phone", "remove_phone", "update_phone",
+    "add_email", "remove_email", "update_email",
+    "add_address", "remove_address", "update_address",
+    "set_birthday", "clear_birthday",
+})
 
 
 class ContactBook(UserDict[str, Contact]):
     """
     Store ``Contact`` records indexed by the contact name.
 
-    The book provides helpers to create, fetch, and delete contacts. Names are
-    matched irrespective of case, while phone lookups expect an exact match.
+    The book provides helpers to create, fetch, and delete contacts. Names and
+    emails are matched irrespective of case, while phone, address and birthday
+    lookups expect an exact match. Field lookups are answered by inverted
+    indexes that follow every change of the stored contacts.
+
+    A book opened over a ``ContactSource`` is lazy: contacts are read from the
+    source on first access, and searches are pushed down to the source.
     """
 
     def create_contact(self, name: str, phone: str) -> tuple[bool, Optional[Contact]]:
@@ -30,13 +50,47 @@ class ContactBook(UserDict[str, Contact]):
         """
 
         normalized = self._normalize_name(name)
-        if normalized in self.data:
-            return False, self.data[normalized]
+        existing = self._get(normalized)
+        if existing is not None:
+            return False, existing
 
         contact = Contact(name, phone)
-        self.data[normalized] = contact
+        self._attach(normalized, contact)
+        self._record(
+            "create_contact", normalized, (contact.name.value, contact.phones[0].value),
+            [("delete_contact", normalized, ())],
+        )
         return True, contact
 
+    def merge_contact(self, contact: Contact) -> bool:
+        """
+        Add ``contact``, or merge it into the stored contact of the same name:
+        phones, emails and addresses it lacks are added and the birthday is
+        taken over.
+
+        :returns: True if the contact was new, False if it was merged.
+        """
+
+        key = self._normalize_name(contact.name.value)
+        existing = self._get(key)
+        if existing is None:
+            self[key] = contact
+            return True
+        for add, values in (
+            (existing.add_phone, contact.phones),
+            (existing.add_email, contact.emails),
+            (existing.add_address, contact.addresses),
+        ):
+            for value in values:
+                # Values the stored contact already has are kept once.
+                with suppress(ValueError):
+                    add(value)
+        if contact.birthday is not None and (
+            existing.birthday is None or existing.birthday.value != contact.birthday.value
+        ):
+            existing.set_birthday(contact.birthday)
+        return False
+
     def find_contact_by_name(self, name: Name) -> Contact | None:
         """
         Find a contact by its name.
@@ -47,7 +101,7 @@ class ContactBook(UserDict[str, Contact]):
         :rtype: Contact | None
         """
         normalized = self._normalize_name(name.value)
-        return self.data.get(normalized, None)
+        return self._get(normalized)
 
     def find_contact(self, query: str) -> Optional[Contact]:
         """
@@ -61,7 +115,7 @@ class ContactBook(UserDict[str, Contact]):
             return None
 
         normalized = cleaned.casefold()
-        contact = self.data.get(normalized)
+        contact = self._get(normalized)
         if contact:
             return contact
 
@@ -84,7 +138,7 @@ class ContactBook(UserDict[str, Contact]):
         if param == "name":
             return [self.find_contact_by_name(Name(val.casefold().strip()))]
         if param in ("phones", "emails"):
-            return self._find_by_attr(param, val.casefold().strip())
+            return self._find_by_attr(param, val.strip())
         if param == "addresses":
             return self._find_by_attr(param, val)
         if param == "birthday":
@@ -100,51 +154,50 @@ class ContactBook(UserDict[str, Contact]):
         """
 
         normalized = self._normalize_name(name)
-        contact = self.data.pop(normalized, None)
+        if self._get(normalized) is None:
+            return False, None
+        contact = self._detach(normalized)
+        if contact is not None:
+            self._record("delete_contact", normalized, (), self._restoring(normalized, contact))
         return (contact is not None, contact)
 
     def get_upcoming_birthdays(self, days: int = 7) -> list[dict[str, str]]:
-        """ Get a list of contacts with birthdays within the next 'days' days. """
+        """
+        Get a list of contacts with birthdays within the next 'days' days.
+
+        Only the calendar buckets of the dates in the window are visited, so
+        the cost depends on the number of matches, not on the book size.
+        Contacts are listed in the order of their upcoming birthdays.
+        """
         today = datetime.today().date()
         upcoming_birthdays = []
-
-        for record in self.data.values():
-            if record.birthday is None:
-                continue
-
-            birthday = record.birthday.value
-
-            # Adjust to this year (handle Feb 29)
-            try:
-                birthday_this_year = birthday.replace(year=today.year)
-            except ValueError:
-                # Handle leap year (Feb 29)
-                birthday_this_year = birthday.replace(year=today.year, day=28)
-
-            # If birthday already passed this year, use next year
-            if birthday_this_year < today:
-                try:
-                    birthday_this_year = birthday.replace(year=today.year + 1)
-                except ValueError:
-                    birthday_this_year = birthday.replace(year=today.year + 1, day=28)
-
-            days_until = (birthday_this_year - today).days
-
-            # Only include if within the specified range
-            if 0 <= days_until <= days:
-                congratulation_date = birthday_this_year
-
-                # Adjust for weekends
-                weekday = congratulation_date.weekday()
-                if weekday == 5:  # Saturday
-                    congratulation_date += timedelta(days=2)
-                elif weekday == 6:  # Sunday
-                    congratulation_date += timedelta(days=1)
-
-                upcoming_birthdays.append({
-                    "name": record.name.value,
-                    "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
-                })
+        seen = set()
+
+        # A single pass over the calendar reaches every day-of-year bucket.
+        for offset in range(min(days, DAY_SLOTS) + 1):
+            for key in self._birthdays_on(today + timedelta(days=offset)):
+                if key in seen:
+                    continue
+                seen.add(key)
+                record = self.data[key]
+                birthday_this_year = self._next_birthday(record.birthday.value, today)
+                days_until = (birthday_this_year - today).days
+
+                # Only include if within the specified range
+                if 0 <= days_until <= days:
+                    congratulation_date = birthday_this_year
+
+                    # Adjust for weekends
+                    weekday = congratulation_date.weekday()
+                    if weekday == 5:  # Saturday
+                        congratulation_date += timedelta(days=2)
+                    elif weekday == 6:  # Sunday
+                        congratulation_date += timedelta(days=1)
+
+                    upcoming_birthdays.append({
+                        "name": record.name.value,
+                        "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
+                    })
 
         return upcoming_birthdays
 
@@ -152,27 +205,168 @@ class ContactBook(UserDict[str, Contact]):
     # Internal helpers
     # ------------------------------------------------------------------ #
     def _find_by_phone(self, phone: str) -> Optional[Contact]:
-        for contact in self.data.values():
-            for number in getattr(contact, "phones", []):
-                if number.value == phone:
-                    return contact
-        return None
+        contacts = self._find_by_attr("phones", phone)
+        return contacts[0] if contacts else None
 
-    def _find_by_attr(self, attr: str, val: str) -> Optional[Contact]:
-        ret = []
-        for contact in self.data.values():
-            for items in getattr(contact, attr, []):
-                if items.value == val:
-                    ret.append(contact)
-        return ret
-
-    def _find_by_birthday(self, birthday: str) -> Optional[Contact]:
-        ret = []
-        birthday_obj = Birthday(birthday)
-        for contact in self.data.values():
-            if contact.birthday and contact.birthday.value == birthday_obj.value:
-                ret.append(contact)
-        return ret
+    def _find_by_attr(self, attr: str, val) -> list[Contact]:
+        if self._source is not None:
+            # Read matching contacts into memory; their in-memory state (and
+            # so the index) is authoritative over the source.
+            for key in self._source.find_keys(attr, val):
+                self._get(key)
+        return [self.data[key] for key in self._index.lookup(attr, val)]
+
+    def _find_by_birthday(self, birthday: str) -> list[Contact]:
+        return self._find_by_attr("birthday", Birthday(birthday).value)
+
+    def _birthdays_on(self, day: date) -> list[str]:
+        """
+        Return keys of contacts whose birthday is celebrated on ``day``.
+
+        Feb 29 birthdays are celebrated on Feb 28 in non-leap years.
+        """
+        month_days = [(day.month, day.day)]
+        if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+            month_days.append((2, 29))
+
+        keys = []
+        for month, day_of_month in month_days:
+            if self._source is not None:
+                for key in self._source.find_keys("birthday_day", (month, day_of_month)):
+                    self._get(key)
+            keys.extend(self._index.lookup_day(month, day_of_month))
+        return keys
+
+    @staticmethod
+    def _next_birthday(birthday: date, today: date) -> date:
+        """Return the next celebration of ``birthday`` on or after ``today``."""
+        # Adjust to this year (handle Feb 29)
+        try:
+            birthday_this_year = birthday.replace(year=today.year)
+        except ValueError:
+            # Handle leap year (Feb 29)
+            birthday_this_year = birthday.replace(year=today.year, day=28)
+
+        # If birthday already passed this year, use next year
+        if birthday_this_year < today:
+            try:
+                birthday_this_year = birthday.replace(year=today.year + 1)
+            except ValueError:
+                birthday_this_year = birthday.replace(year=today.year + 1, day=28)
+        return birthday_this_year
+
+    def _contacts(self):
+        """Iterate over all contacts, reading them from the source if lazy."""
+        if self._source is None:
+            return iter(self.data.values())
+        contacts = (self._get(key) for key in list(self))
+        # A record of the source can turn out damaged when it is read.
+        return (contact for contact in contacts if contact is not None)
+
+    def _get(self, key: str) -> Optional[Contact]:
+        """Return the contact stored under ``key``, reading it from the source if needed."""
+        contact = self.data.get(key)
+        if contact is None and self._source is not None and key not in self._shadowed:
+            record = self._source.get(key)
+            if record is not None:
+                if self._source.trusted:
+                    contact = Contact.from_trusted_dict(record)
+                else:
+                    contact = Contact.from_dict(record)
+                self._attach(key, contact)
+        return contact
+
+    def _attach(self, key: str, contact: Contact) -> None:
+        """Store a contact under ``key`` and start tracking its changes."""
+        self._keep(key)
+        previous = self.data.get(key)
+        if previous is not None:
+            previous._on_change = None
+            previous._on_changing = None
+            self._index.remove_contact(key, previous)
+        contact._on_change = self._contact_changed
+        contact._on_changing = self._contact_changing
+        self.data[key] = contact
+        self._index.add_contact(key, contact)
+        if self._columns is not None:
+            self._columns.set(key, contact)
+        self._shadowed.discard(key)
+
+    def _detach(self, key: str) -> Optional[Contact]:
+        """Remove the contact stored under ``key`` and stop tracking it."""
+        self._keep(key)
+        contact = self.data.pop(key, None)
+        if contact is not None:
+            contact._on_change = None
+            contact._on_changing = None
+            self._index.remove_contact(key, contact)
+            if self._columns is not None:
+                self._columns.remove(key)
+        if self._source is not None:
+            # Never read a removed contact back from the source.
+            self._shadowed.add(key)
+        return contact
+
+    def _contact_changing(self, contact: Contact) -> None:
+        """Callback invoked by tracked contacts before every mutation."""
+        self._keep(self._normalize_name(contact.name.value))
+        if self._history is not None:
+            self._before = contact._snapshot()
+
+    def _keep(self, key: str) -> None:
+        """In a transaction, remember what ``key`` held before its first change."""
+        if self._saved is not None and key not in self._saved:
+            contact = self.data.get(key)
+            self._saved[key] = None if contact is None else (contact, contact._snapshot())
+
+    def _contact_changed(self, contact: Contact, op: str, args: tuple) -> None:
+        """Callback invoked by tracked contacts after every mutation."""
+        key = self._normalize_name(contact.name.value)
+        self._index.apply(key, contact, op, args)
+        if self._columns is not None:
+            self._columns.set(key, contact)
+        self._record(op, key, args, self._field_inverse(contact, op, key, args))
+
+    def _record(self, op: str, key: str, args: tuple, inverse: list[Change] | None = None) -> None:
+        """
+        Remember a change so that it can be persisted on the next save, and
+        its ``inverse`` so that it can be undone.
+        """
+        self._changes.append((op, key, args))
+        self._dirty = True
+        if self._history is not None and inverse is not None:
+            self._history.record(self, inverse)
+
+    def _restoring(self, key: str, contact: Contact | None) -> list[Change] | None:
+        """The change that puts ``contact`` back under ``key``, or removes what is there."""
+        if self._history is None:
+            return None
+        if contact is None:
+            return [("delete_contact", key, ())]
+        return [("put_contact", key, (contact.to_dict(),))]
+
+    def _field_inverse(self, contact: Contact, op: str, key: str, args: tuple) -> list[Change] | None:
+        """The change undoing a contact method; ``_before`` holds the fields it changed."""
+        if self._history is None:
+            return None
+        field = op.partition("_")[2]
+        if op.startswith("add_"):
+            return [("remove_" + field, key, args)]
+        if op.startswith("update_"):
+            return [(op, key, args[::-1])]
+        phones, emails, addresses, birthday = self._before
+        if op.startswith("remove_"):
+            # Adding the value back would move it to the end; the contact keeps its order.
+            return [("put_contact", key, ({
+                "name": contact.name.value,
+                "phones": [phone.value for phone in phones],
+                "emails": [email.value for email in emails],
+                "addresses": [address.value for address in addresses],
+                "birthday": birthday.value.strftime("%d.%m.%Y") if birthday else None,
+            },))]
+        if birthday is None:
+            return [("clear_birthday", key, ())]
+        return [("set_birthday", key, (birthday.value.strftime("%d.%m.%Y"),))]
 
     def _normalize_name(self, name: str) -> str:
         stripped = name.strip()
@@ -183,48 +377,319 @@ class ContactBook(UserDict[str, Contact]):
     # ------------------------------------------------------------------ #
     # Save, load, storage
     # ------------------------------------------------------------------ #
-    def __init__(self, contacts: dict[str, Contact] | None = None):
+    def __init__(
+        self,
+        contacts: dict[str, Contact] | None = None,
+        source: ContactSource | None = None,
+    ):
         super().__init__()
+        # True when the book differs from what was last loaded or saved.
+        self._dirty = False
+        # Changes made since the last save, persisted by the storage backend.
+        self._changes: list[Change] = []
+        self._storage: StorageBackend | None = None
+        # Lazy mode: records not yet in self.data are read from the source,
+        # except for the shadowed keys, which were removed in memory.
+        self._source = source
+        self._shadowed: set[str] = set()
+        # Secondary indexes over the contacts in self.data.
+        self._index = ContactIndex()
+        # Columnar mirror for aggregate queries, built on first use.
+        self._columns: ContactColumns | None = None
+        # Open transaction: what every key touched since begin() held before
+        # (None if it was empty); None itself when no transaction is open.
+        self._saved: dict[str, tuple[Contact, tuple] | None] | None = None
+        self._saved_shadowed: set[str] = set()
+        self._saved_dirty = False
+        self._saved_changes = 0
+        self._saved_history = 0
+        # Undo history, if one is attached, and the fields of the contact
+        # being changed, taken right before the change.
+        self._history: History | None = None
+        self._before: tuple = ()
         if contacts:
             for contact in contacts.values():
-                # Key is the contact name in lowercase (for case-insensitive search)
-                self.data[contact.name.value.lower()] = contact
+                # Key is the contact name in casefold (for case-insensitive search)
+                self._attach(self._normalize_name(contact.name.value), contact)
+
+    def __setitem__(self, key: str, contact: Contact) -> None:
+        inverse = None if self._history is None else self._restoring(key, self._get(key))
+        self._attach(key, contact)
+        self._record("put_contact", key, (contact.to_dict(),), inverse)
+
+    def __delitem__(self, key: str) -> None:
+        if self._get(key) is None:
+            raise KeyError(key)
+        contact = self._detach(key)
+        self._record("delete_contact", key, (), self._restoring(key, contact))
+
+    def __getitem__(self, key: str) -> Contact:
+        contact = self._get(key)
+        if contact is None:
+            raise KeyError(key)
+        return contact
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._get(key) is not None
+
+    def __iter__(self):
+        if self._source is None:
+            return iter(self.data)
+        return self._iter_lazy()
+
+    def __len__(self) -> int:
+        if self._source is None:
+            return len(self.data)
+        return sum(1 for _ in self._iter_lazy())
+
+    def _iter_lazy(self):
+        """Iterate keys in memory, then source keys that were not shadowed."""
+        in_memory = list(self.data)
+        yield from in_memory
+        seen = set(in_memory)
+        for key in self._source.keys():
+            if key not in seen and key not in self._shadowed:
+                yield key
+
+    def columns(self) -> ContactColumns:
+        """
+        Return the columnar mirror of the book, building it on first use.
+
+        Once built, the columns follow every change of the stored contacts.
+        A lazy book reads all of its contacts from the source to build them.
+        """
+        if self._columns is None:
+            contacts = [(key, self._get(key)) for key in list(self)]
+            self._columns = ContactColumns(contacts)
+        return self._columns
+
+    def shared_addresses(self) -> dict[str, list[str]]:
+        """
+        Return the addresses held by more than one contact, with their names.
+
+        The address index finds the shared addresses and the names column
+        names their contacts. Building the columns reads every contact of a
+        lazy book, which completes the index as well.
+        """
+        columns = self.columns()
+        return {
+            address: [columns.name(key) for key in keys]
+            for address, keys in self._index.shared("addresses").items()
+        }
+
+    def check_indexes(self) -> list[str]:
+        """
+        Verify the secondary indexes against the stored contacts.
+
+        Meant for tests and debugging; it rebuilds the indexes from scratch.
+
+        :return: Descriptions of all inconsistencies; empty if there are none.
+        """
+        return self._index.check(self.data)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the book has unsaved changes."""
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        """Mark the current state as persisted."""
+        self._dirty = False
+        self._changes = []
+
+    def apply_change(self, op: str, key: str, args: list) -> None:
+        """
+        Re-apply a change record produced by this book, e.g. from the journal.
+
+        :raises ValueError: If the change cannot be applied to the current state.
+        """
+        if op == "create_contact":
+            self.create_contact(*args)
+        elif op == "put_contact":
+            self[key] = Contact.from_dict(args[0])
+        elif op == "delete_contact":
+            self.delete_contact(key)
+        elif op in CONTACT_OPERATIONS:
+            contact = self._get(key)
+            if contact is None:
+                raise ValueError(f"Contact '{key}' not found.")
+            getattr(contact, op)(*args)
+        else:
+            raise ValueError(f"Unknown change operation '{op}'.")
+
+    # ------------------------------------------------------------------ #
+    # Transactions
+    # ------------------------------------------------------------------ #
+    @property
+    def in_transaction(self) -> bool:
+        """Whether changes are collected in an open transaction."""
+        return self._saved is not None
+
+    def begin(self) -> None:
+        """
+        Open a transaction. Nothing is copied up front: a contact's state is
+        kept only when it is first changed, added or removed.
+
+        :raises ValueError: If a transaction is already open.
+        """
+        if self._saved is not None:
+            raise ValueError("A transaction is already open.")
+        self._saved = {}
+        self._saved_shadowed = set(self._shadowed)
+        self._saved_dirty = self._dirty
+        self._saved_changes = len(self._changes)
+        self._saved_history = self._history.mark() if self._history is not None else 0
+
+    def commit(self) -> None:
+        """Keep the changes of the open transaction; they are saved as usual."""
+        if self._saved is None:
+            raise ValueError("No transaction is open.")
+        self._saved = None
+
+    def rollback(self) -> None:
+        """Undo every change made since ``begin`` and close the transaction."""
+        saved = self._saved
+        if saved is None:
+            raise ValueError("No transaction is open.")
+        self._saved = None
+        for key, state in saved.items():
+            if key in self.data:
+                self._detach(key)
+            if state is not None:
+                contact, snapshot = state
+                contact._restore(snapshot)
+                self._attach(key, contact)
+        self._shadowed = self._saved_shadowed
+        del self._changes[self._saved_changes:]
+        self._dirty = self._saved_dirty
+        if self._history is not None:
+            # The undone changes must not be undone again.
+            self._history.forget(self._saved_history)
 
     def to_dict(self) -> dict[str, any]:
         """Converts ContactBook into a serializable dictionary of contact data."""
         # Store contact data (represented as Name: Contact.to_dict()),
         # ignoring the lowercase keys used internally by UserDict.
-        return {contact.name.value: contact.to_dict() for contact in self.data.values()}
+        return {contact.name.value: contact.to_dict() for contact in self._contacts()}
 
     @classmethod
     def from_data_payload(cls, data_payload: dict[str, any]) -> 'ContactBook':
         """Creates an ContactBook from the loaded dictionary data payload."""
+        return cls.from_records(data_payload.values())
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, any]], trusted: bool = False) -> 'ContactBook':
+        """
+        Creates an ContactBook from contact records, consumed one at a time.
+        Trusted records, verified by the storage checksum, skip validation.
+        """
         contacts = {}
-        for contact_data in data_payload.values():
-            try:
-                contact = Contact.from_dict(contact_data)
-                # Store with case-insensitive key
+        if trusted:
+            for contact_data in records:
+                try:
+                    contact = Contact.from_trusted_dict(contact_data)
+                    # Store with case-insensitive key
+                    contacts[contact.name.value.lower()] = contact
+                except Exception as e:
+                    print(f"[WARNING]: Failed to load contact: {contact_data.get('name', 'N/A')}. Details: {e}")
+            return cls(contacts)
+        # Untrusted records are validated in chunks, on several cores for a
+        # large store loaded with POOLED_LOAD ("--verify").
+        labelled = ((contact_data.get('name', 'N/A'), contact_data) for contact_data in records)
+        workers = None if data_storage.POOLED_LOAD else 1
+        for label, contact, error in validate_contacts(labelled, workers=workers):
+            if contact is None:
+                print(f"[WARNING]: Failed to load contact: {label}. Details: {error}")
+            else:
                 contacts[contact.name.value.lower()] = contact
-            except Exception as e:
-                print(f"[WARNING]: Failed to load contact: {contact_data.get('name', 'N/A')}. Details: {e}")
         return cls(contacts)
 
     @staticmethod
-    def load_from_storage() -> 'ContactBook':
-        """Loads contacts from file, handling errors and file absence."""
-        storage = DataStorage(CONTACTS_FILE)
-        raw_data = storage.load_data()
-
-        # 'data' key contains the contacts dictionary
-        if raw_data.get("data"):
-            return ContactBook.from_data_payload(raw_data["data"])
-
-        print("Contacts not found. Created a new contact book.")
-        return ContactBook()
-
-    def save_to_storage(self, silent: bool = False):
-        """Saves the current ContactBook state to file."""
-        data_payload = self.to_dict()
-        data_to_save = {"version": STORAGE_VERSION, "data": data_payload}
-        storage = DataStorage(CONTACTS_FILE)
-        storage.save_data(data_to_save, silent=silent)
+    def load_from_storage(storage: StorageBackend | None = None, silent: bool = False) -> 'ContactBook':
+        """
+        Loads contacts from storage, handling errors and file absence.
+
+        :param silent: Do not report an empty book, e.g. when reloading.
+        """
+        storage = storage or open_storage(CONTACTS_FILE)
+        # Snapshot and journal are read without another session writing in between.
+        with storage.read_session():
+            source = storage.record_source()
+            if source is not None:
+                book = ContactBook(source=source)
+            else:
+                # Records are streamed straight into contacts, without a full payload copy.
+                book = storage.load_records(ContactBook.from_records) or ContactBook()
+            book._replay(storage.replay_journal())
+            if not book and source is None and not silent:
+                print("Contacts not found. Created a new contact book.")
+        book.mark_clean()
+        book._storage = storage
+        return book
+
+    def refresh_from_storage(self) -> bool:
+        """
+        Catch up with changes another session saved, keeping unsaved ones.
+
+        Journal changes of other sessions are applied directly when the book
+        has no unsaved changes. Otherwise the book is loaded again and its
+        unsaved changes are replayed on top, so the edits of both sessions
+        survive; changes that no longer apply are reported and dropped.
+
+        :return: True if the book was updated.
+        """
+        storage = self._storage
+        if storage is None or not storage.changed_on_disk():
+            return False
+        if not self._changes:
+            changes = storage.new_changes()
+            if changes is not None:
+                self._replay(changes)
+                self.mark_clean()
+                return True
+        pending = self._changes
+        self._adopt(ContactBook.load_from_storage(storage, silent=True))
+        self._replay(pending)
+        return True
+
+    def _replay(self, changes: Iterable[Change]) -> None:
+        """Apply change records, reporting the ones that fail; they are not undoable."""
+        history, self._history = self._history, None
+        try:
+            for op, key, args in changes:
+                try:
+                    self.apply_change(op, key, args)
+                except Exception as e:
+                    print(f"[WARNING]: Failed to replay change '{op}' for contact '{key}'. Details: {e}")
+        finally:
+            self._history = history
+
+    def _adopt(self, other: 'ContactBook') -> None:
+        """Take over the contacts and source of ``other``, dropping this book's state."""
+        for contact in self.data.values():
+            contact._on_change = None
+            contact._on_changing = None
+        self.data = {}
+        self._index = ContactIndex()
+        self._columns = None
+        self._source = other._source
+        self._shadowed = set(other._shadowed)
+        for key, contact in other.data.items():
+            self._attach(key, contact)
+        self.mark_clean()
+
+    def save_to_storage(self, silent: bool = False) -> bool:
+        """Saves the changes of the ContactBook to file (snapshot or journal)."""
+        if self._storage is None:
+            self._storage = open_storage(CONTACTS_FILE)
+        with self._storage.write_session():
+            # Merge what other sessions saved, so that their edits are not overwritten.
+            self.refresh_from_storage()
+            saved = self._storage.save_changes(
+                self._changes,
+                lambda: {"version": STORAGE_VERSION, "data": self.to_dict()},
+                silent=silent,
+            )
+        if saved:
+            self.mark_clean()
+        return saved
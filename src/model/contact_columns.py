@@ -0,0 +1,171 @@
+"""Columnar mirror of a contact book for aggregate queries."""
+
+from __future__ import annotations
+
+import heapq
+import operator
+from array import array
+from itertools import compress, repeat
+from typing import Iterable
+
+from src.model.contact import Contact
+
+# Comparisons accepted by ``ContactColumns.names_where``.
+COMPARISONS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
+
+class ContactColumns:
+    """
+    Keep one array per contact attribute, one row per contact.
+
+    Rows are addressed by contact key; deleting a contact moves the last row
+    into its place, so every update is O(1). Aggregates run over the flat
+    arrays (``array.count``) instead of walking Contact objects. Email
+    domains are dictionary-encoded: each distinct domain gets an id, and a row
+    holds the ids of all its emails. Per-month and per-domain totals are kept
+    up to date as rows change.
+    """
+
+    def __init__(self, contacts: Iterable[tuple[str, Contact]] = ()) -> None:
+        self.keys: list[str] = []
+        self.names: list[str] = []
+        self.phone_counts = array("H")
+        self.email_counts = array("H")
+        self.address_counts = array("H")
+        # 0 when the contact has no birthday.
+        self.birth_months = array("b")
+        self.birth_ordinals = array("l")
+        # Dictionary-encoded domain of every email, one id per email.
+        self.email_domains: list[tuple[int, ...]] = []
+        self.domains: list[str] = []
+        self._domain_ids: dict[str, int] = {}
+        self._domain_counts = array("l")
+        # Index 0 counts contacts without a birthday.
+        self._month_counts = array("l", [0] * 13)
+        self._rows: dict[str, int] = {}
+        for key, contact in contacts:
+            self.set(key, contact)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def set(self, key: str, contact: Contact) -> None:
+        """Insert or refresh the row of ``contact``."""
+        values = self._row_values(contact)
+        row = self._rows.get(key)
+        if row is None:
+            self._rows[key] = len(self.keys)
+            self.keys.append(key)
+            for column, value in zip(self._columns(), values):
+                column.append(value)
+        else:
+            self._count(row, -1)
+            for column, value in zip(self._columns(), values):
+                column[row] = value
+        self._count(self._rows[key], 1)
+
+    def remove(self, key: str) -> None:
+        """Drop the row of ``key``, moving the last row into its place."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        self._count(row, -1)
+        last = len(self.keys) - 1
+        if row != last:
+            moved = self.keys[last]
+            self.keys[row] = moved
+            self._rows[moved] = row
+            for column in self._columns():
+                column[row] = column[last]
+        self.keys.pop()
+        for column in self._columns():
+            column.pop()
+
+    # ------------------------------------------------------------------ #
+    # Aggregates
+    # ------------------------------------------------------------------ #
+    def count_without_emails(self) -> int:
+        """Return the number of contacts without any email."""
+        return self.email_counts.count(0)
+
+    def count_without_birthday(self) -> int:
+        """Return the number of contacts without a birthday."""
+        return self._month_counts[0]
+
+    def birthdays_per_month(self) -> list[int]:
+        """Return the number of birthdays in each month, January first."""
+        return self._month_counts[1:].tolist()
+
+    def top_email_domains(self, limit: int = 5) -> list[tuple[str, int]]:
+        """Return the most common email domains with their email counts."""
+        counts = ((domain, count) for domain, count in zip(self.domains, self._domain_counts) if count)
+        return heapq.nsmallest(limit, counts, key=lambda item: -item[1])
+
+    def total(self, column: str) -> int:
+        """Return the sum of a count column, e.g. ``phone_counts``."""
+        return sum(getattr(self, column))
+
+    def names_where(self, column: str, comparison: str, threshold: int) -> list[str]:
+        """
+        Return names of contacts whose value in ``column`` compares to
+        ``threshold``, e.g. ``names_where("phone_counts", ">", 1)``.
+
+        The comparison is one of COMPARISONS; it is mapped over the column
+        in C, and the names column filtered by the result without building
+        rows.
+
+        :raises ValueError: If the comparison is not supported.
+        """
+        compare = COMPARISONS.get(comparison)
+        if compare is None:
+            raise ValueError(f"Unsupported comparison '{comparison}'.")
+        return list(compress(self.names, map(compare, getattr(self, column), repeat(threshold))))
+
+    def name(self, key: str) -> str:
+        """Return the name in the row of ``key``."""
+        return self.names[self._rows[key]]
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+    def _columns(self) -> tuple:
+        return (
+            self.names, self.phone_counts, self.email_counts, self.address_counts,
+            self.birth_months, self.birth_ordinals, self.email_domains,
+        )
+
+    def _row_values(self, contact: Contact) -> tuple:
+        birthday = contact.birthday.value if contact.birthday else None
+        domains = tuple(
+            self._domain_id(email.value.rsplit("@", 1)[-1].casefold()) for email in contact.emails
+        )
+        return (
+            contact.name.value,
+            len(contact.phones),
+            len(contact.emails),
+            len(contact.addresses),
+            birthday.month if birthday else 0,
+            birthday.toordinal() if birthday else 0,
+            domains,
+        )
+
+    def _count(self, row: int, delta: int) -> None:
+        """Add ``delta`` to the per-month and per-domain totals of ``row``."""
+        self._month_counts[self.birth_months[row]] += delta
+        for domain in self.email_domains[row]:
+            self._domain_counts[domain] += delta
+
+    def _domain_id(self, domain: str) -> int:
+        domain_id = self._domain_ids.get(domain)
+        if domain_id is None:
+            domain_id = self._domain_ids[domain] = len(self.domains)
+            self.domains.append(domain)
+            self._domain_counts.append(0)
+        return domain_id
@@ -0,0 +1,156 @@
+"""Inverted indexes from contact field values to contact keys."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Hashable, Iterable
+
+from src.model.contact import Contact
+
+# Indexed search parameters, as accepted by ContactBook.find_contact_by_param.
+INDEXED_FIELDS = ("phones", "emails", "addresses", "birthday")
+
+# Offset of the first day of each month in a leap year: birthdays are bucketed
+# by month and day into 366 slots, Feb 29 included.
+MONTH_START = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+DAY_SLOTS = 366
+
+
+def day_slot(month: int, day: int) -> int:
+    """Return the calendar bucket (0..365) of a month and day."""
+    return MONTH_START[month - 1] + day - 1
+
+
+class ContactIndex:
+    """
+    Map phone numbers, casefolded emails, addresses and birthday dates to the
+    keys of the contacts that hold them.
+
+    Postings are insertion-ordered dicts used as sets, so lookups return keys
+    in the order the values were indexed. Birthdays are additionally bucketed
+    by day of year, regardless of the birth year.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[Hashable, dict[str, None]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        # Birthday events carry only the new value, so remember the indexed one.
+        self._birthdays: dict[str, date] = {}
+        self._days: list[dict[str, None]] = [{} for _ in range(DAY_SLOTS)]
+
+    @staticmethod
+    def normalize(field: str, value):
+        """Return the form of ``value`` under which ``field`` is indexed."""
+        if field == "emails":
+            return value.casefold()
+        return value
+
+    def lookup(self, field: str, value) -> list[str]:
+        """Return the keys of contacts whose ``field`` holds ``value``."""
+        return list(self._postings[field].get(self.normalize(field, value), ()))
+
+    def lookup_day(self, month: int, day: int) -> list[str]:
+        """Return the keys of contacts born on ``day`` of ``month`` in any year."""
+        return list(self._days[day_slot(month, day)])
+
+    def shared(self, field: str) -> dict[Hashable, list[str]]:
+        """Return the values of ``field`` held by more than one contact."""
+        return {
+            value: list(keys)
+            for value, keys in self._postings[field].items()
+            if len(keys) > 1
+        }
+
+    def add_contact(self, key: str, contact: Contact) -> None:
+        """Index every field value of ``contact``."""
+        for field, values in self._field_values(contact):
+            for value in values:
+                self._add(field, value, key)
+        if contact.birthday is not None:
+            self._birthdays[key] = contact.birthday.value
+
+    def remove_contact(self, key: str, contact: Contact) -> None:
+        """Remove every field value of ``contact`` from the index."""
+        for field, values in self._field_values(contact):
+            for value in values:
+                self._remove(field, value, key)
+        self._birthdays.pop(key, None)
+
+    def apply(self, key: str, contact: Contact, op: str, args: tuple) -> None:
+        """Update the index after ``contact`` reported the change ``op(*args)``."""
+        if op in ("set_birthday", "clear_birthday"):
+            previous = self._birthdays.pop(key, None)
+            if previous is not None:
+                self._remove("birthday", previous, key)
+            if contact.birthday is not None:
+                self._add("birthday", contact.birthday.value, key)
+                self._birthdays[key] = contact.birthday.value
+            return
+
+        action, field = op.split("_", 1)
+        field = field + "es" if field == "address" else field + "s"
+        if action == "add":
+            self._add(field, args[0], key)
+        elif action == "remove":
+            self._remove(field, args[0], key)
+        elif action == "update":
+            self._remove(field, args[0], key)
+            self._add(field, args[1], key)
+
+    def check(self, contacts: dict[str, Contact]) -> list[str]:
+        """
+        Compare the index with a fresh one built from ``contacts``.
+
+        :return: Human-readable descriptions of every inconsistency; an empty
+            list when the index matches the contacts.
+        """
+        expected = ContactIndex()
+        for key, contact in contacts.items():
+            expected.add_contact(key, contact)
+
+        problems = []
+        for slot, (actual, wanted) in enumerate(zip(self._days, expected._days)):
+            if set(actual) != set(wanted):
+                problems.append(
+                    f"birthday slot {slot}: indexed {sorted(actual)}, expected {sorted(wanted)}"
+                )
+        for field in INDEXED_FIELDS:
+            actual_postings = self._postings[field]
+            expected_postings = expected._postings[field]
+            for value in expected_postings.keys() | actual_postings.keys():
+                actual = set(actual_postings.get(value, ()))
+                wanted = set(expected_postings.get(value, ()))
+                if not actual:
+                    problems.append(f"{field} {value!r}: missing {sorted(wanted)}")
+                elif actual != wanted:
+                    problems.append(
+                        f"{field} {value!r}: indexed {sorted(actual)}, expected {sorted(wanted)}"
+                    )
+        return problems
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _field_values(contact: Contact) -> Iterable[tuple[str, list]]:
+        yield "phones", [phone.value for phone in contact.phones]
+        yield "emails", [email.value for email in contact.emails]
+        yield "addresses", [address.value for address in contact.addresses]
+        yield "birthday", [contact.birthday.value] if contact.birthday else []
+
+    def _add(self, field: str, value, key: str) -> None:
+        self._postings[field].setdefault(self.normalize(field, value), {})[key] = None
+        if field == "birthday":
+            self._days[day_slot(value.month, value.day)][key] = None
+
+    def _remove(self, field: str, value, key: str) -> None:
+        postings = self._postings[field]
+        value = self.normalize(field, value)
+        keys = postings.get(value)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del postings[value]
+        if field == "birthday":
+            self._days[day_slot(value.month, value.day)].pop(key, None)
@@ -6,6 +6,8 @@ from src.util.messages import INVALID_EMAIL
 
 # Represents an email field with basic validation
 class Email(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         # Basic email validation pattern
         email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
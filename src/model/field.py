@@ -1,7 +1,17 @@
 # Base class for all fields in a contact record
 class Field:
+    # Slotted: a book holds several fields per contact, so no per-instance dict.
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    @classmethod
+    def trusted(cls, value):
+        """Create a field from an already validated, persisted value, skipping validation."""
+        field = cls.__new__(cls)
+        field.value = value
+        return field
+
     def __str__(self):
         return str(self.value)
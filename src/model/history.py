@@ -0,0 +1,247 @@
+"""
+Undo and redo of recent changes.
+
+Every change a store records (see ``ContactBook._record``) comes with its
+inverse: a change record in the same ``(op, key, args)`` form that the store
+applies through ``apply_change``, e.g. ``remove_phone`` for ``add_phone`` or
+``set_tags`` with the previous tags for ``edit_tag``. ``History`` keeps those
+inverses, grouped per command, so undoing a command applies only the few
+records it made, never a copy of the data. Applying an inverse records its
+own inverse, which becomes the redo record, so undo and redo are the same
+operation in opposite directions.
+
+The groups are kept within ``HISTORY_BYTES``, measured as their size in
+JSON; the oldest ones are dropped first. With ``HISTORY_PERSIST`` the
+history is written next to the data files when the session ends and read
+back by the next one.
+"""
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from typing import Iterable, Protocol
+
+from src import data_storage
+from src.data_storage import StorageConfig
+from src.storage.backend import Change
+
+# A change of one store: store name, operation, key and arguments.
+Entry = tuple[str, str, str, tuple]
+# The changes of one command, with their size in bytes.
+Group = tuple[int, list[Entry]]
+
+
+class UndoableStore(Protocol):
+    """A data store that reports the inverse of each of its changes."""
+
+    _history: "History | None"
+
+    def apply_change(self, op: str, key: str, args: list) -> None:
+        """Applies a change record."""
+
+    def begin(self) -> None:
+        """Opens a transaction."""
+
+    def commit(self) -> None:
+        """Keeps the changes of the open transaction."""
+
+    def rollback(self) -> None:
+        """Undoes the changes of the open transaction."""
+
+
+class History:
+    """Bounded undo and redo stacks of inverse change records."""
+
+    def __init__(self, budget: int | None = None):
+        """:param budget: Bytes the history may take; defaults to ``HISTORY_BYTES``."""
+        self._budget = data_storage.HISTORY_BYTES if budget is None else budget
+        self._stores: dict[str, UndoableStore] = {}
+        self._names: dict[int, str] = {}
+        self._undo: deque[Group] = deque()
+        self._redo: deque[Group] = deque()
+        self._size = 0
+        # Inverses of the current command, not yet a group of the undo stack.
+        self._open: list[Entry] = []
+        self._open_size = 0
+        # Set during a transaction: its commands make up a single group.
+        self._held = False
+        # While undoing or redoing: the inverses of the applied records.
+        self._collected: list[Entry] | None = None
+
+    def attach(self, name: str, store: UndoableStore) -> None:
+        """Start recording the changes of ``store`` under ``name``."""
+        self._stores[name] = store
+        self._names[id(store)] = name
+        store._history = self
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._open or self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, store: UndoableStore, inverse: Iterable[Change]) -> None:
+        """
+        Remember how to undo a change ``store`` just made. A new change
+        drops what could be redone.
+        """
+        name = self._names[id(store)]
+        entries = [(name, op, key, tuple(args)) for op, key, args in inverse]
+        if self._collected is not None:
+            self._collected.extend(entries)
+            return
+        self._open.extend(entries)
+        self._open_size += sum(_entry_size(entry) for entry in entries)
+        if self._redo:
+            self._size -= sum(size for size, _ in self._redo)
+            self._redo.clear()
+
+    def checkpoint(self) -> None:
+        """End the current command: its changes are undone together."""
+        if self._held or not self._open:
+            return
+        self._undo.append((self._open_size, self._open))
+        self._size += self._open_size
+        self._open, self._open_size = [], 0
+        self._trim()
+
+    # ----- Transactions ---------------------------------------------------
+    def begin(self) -> None:
+        """Collect the changes of a transaction in a single group."""
+        self.checkpoint()
+        self._held = True
+
+    def commit(self) -> None:
+        """Close the group of the transaction."""
+        self._held = False
+        self.checkpoint()
+
+    def rollback(self) -> None:
+        """Forget the changes of the transaction; the stores have undone them."""
+        self._held = False
+        self._open, self._open_size = [], 0
+
+    def mark(self) -> int:
+        """Return a position in the current command's changes, for ``forget``."""
+        return len(self._open)
+
+    def forget(self, mark: int) -> None:
+        """Drop the changes recorded since ``mark``; the store has undone them."""
+        dropped = self._open[mark:]
+        del self._open[mark:]
+        self._open_size -= sum(_entry_size(entry) for entry in dropped)
+
+    # ----- Undo and redo --------------------------------------------------
+    def undo(self) -> int:
+        """
+        Undo the most recent group of changes.
+
+        :raises ValueError: If there is nothing to undo or a change no longer applies.
+        :return: The number of changes undone.
+        """
+        self.checkpoint()
+        if not self._undo:
+            raise ValueError("Nothing to undo.")
+        return self._apply(self._undo, self._redo, "undone")
+
+    def redo(self) -> int:
+        """
+        Redo the most recently undone group of changes.
+
+        :raises ValueError: If there is nothing to redo or a change no longer applies.
+        :return: The number of changes redone.
+        """
+        self.checkpoint()
+        if not self._redo:
+            raise ValueError("Nothing to redo.")
+        return self._apply(self._redo, self._undo, "redone")
+
+    def _apply(self, source: deque[Group], target: deque[Group], done: str) -> int:
+        """
+        Apply the newest group of ``source``; the inverses recorded meanwhile go to ``target``.
+
+        The group is applied in a transaction of every store it touches: if
+        one change fails, the stores are rolled back and the group stays
+        where it was.
+        """
+        size, entries = source[-1]
+        stores = [self._stores[name] for name in dict.fromkeys(entry[0] for entry in entries)]
+        begun = []
+        self._collected = collected = []
+        try:
+            for store in stores:
+                store.begin()
+                begun.append(store)
+            # Inverses are applied newest first, so the records they depend on still hold.
+            for name, op, key, args in reversed(entries):
+                self._stores[name].apply_change(op, key, list(args))
+        except Exception as e:
+            for store in begun:
+                store.rollback()
+            raise ValueError(f"The change could not be {done}: {e}") from e
+        finally:
+            self._collected = None
+        for store in stores:
+            store.commit()
+        source.pop()
+        self._size -= size
+        if collected:
+            size = sum(_entry_size(entry) for entry in collected)
+            target.append((size, collected))
+            self._size += size
+            self._trim()
+        return len(entries)
+
+    def _trim(self) -> None:
+        """Drop the oldest undo groups, then the farthest redo groups, to fit the budget."""
+        while self._size > self._budget and (self._undo or self._redo):
+            size, _ = (self._undo or self._redo).popleft()
+            self._size -= size
+
+    # ----- Persistence ----------------------------------------------------
+    def save(self, config: StorageConfig) -> None:
+        """Write the undo and redo stacks to ``HISTORY_FILE``."""
+        self.checkpoint()
+        payload = {
+            "undo": [entries for _, entries in self._undo],
+            "redo": [entries for _, entries in self._redo],
+        }
+        path = config.path(data_storage.HISTORY_FILE)
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(payload, file, ensure_ascii=False, separators=(",", ":"))
+        except OSError as e:
+            print(f"[WARNING]: Failed to save the undo history to '{path}'. Details: {e}")
+
+    def load(self, config: StorageConfig) -> None:
+        """
+        Read the stacks written by ``save``. The file is removed, so a session
+        that ends without saving its history leaves none that no longer fits
+        the data.
+        """
+        path = config.path(data_storage.HISTORY_FILE)
+        try:
+            with open(path, encoding="utf-8") as file:
+                payload = json.load(file)
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"[WARNING]: Failed to load the undo history from '{path}'. Details: {e}")
+            return
+        for stack, groups in ((self._undo, payload.get("undo", [])), (self._redo, payload.get("redo", []))):
+            for group in groups:
+                entries = [(name, op, key, tuple(args)) for name, op, key, args in group]
+                if all(entry[0] in self._stores for entry in entries):
+                    size = sum(_entry_size(entry) for entry in entries)
+                    stack.append((size, entries))
+                    self._size += size
+        self._trim()
+
+
+def _entry_size(entry: Entry) -> int:
+    """Bytes an entry takes in JSON, the measure of the history budget."""
+    return len(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
@@ -3,6 +3,8 @@ from src.model.field import Field
 
 # Represents a contact's name; inherits from Field
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, value):
         if not isinstance(value, str) or not value.strip():
             raise ValueError("Name must be a non-empty string.")
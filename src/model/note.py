@@ -3,11 +3,15 @@ Module for Note entity and Notes container.
 Note has topic (string) and content (string), tag is optional parameter (list of strings)
 """
 
+import sys
 from collections import UserList
-from rich import print as rprint
+from typing import Iterable
 
 from colorama import Fore, Style
-from src.data_storage import DataStorage, NOTES_FILE, STORAGE_VERSION
+from src.data_storage import NOTES_FILE, STORAGE_VERSION, open_storage
+from src.model.history import History
+from src.model.note_index import NoteSortedView, NoteTagIndex, NoteTextIndex, parse_tag_query
+from src.storage.backend import Change, NoteSource, StorageBackend
 from src.util.messages import NOTE_NOT_FOUND, TAG_ADDED
 
 
@@ -16,14 +20,16 @@ class NoteEntity:
     Note has topic (string) and content (string). 
     Tag is optional parameter (list of strings)"""
 
+    __slots__ = ("topic", "content", "tags")
+
     def __init__(self, topic: str, content: str, tag: str = None):
         self.tags = []
         self.topic = topic
         self.content = content
         if tag:
             lst_tags = tag.lower().strip().split(',')
-            # Remove extra spaces around tags
-            self.tags = list(map(str.strip, lst_tags))
+            # Remove extra spaces around tags; the few distinct tags are shared.
+            self.tags = [sys.intern(t.strip()) for t in lst_tags]
 
     def __str__(self):
         if self.tags:
@@ -45,10 +51,327 @@ class NoteEntity:
             raise ValueError("Note must contain a topic.")
         return NoteEntity(topic, content, ",".join(tags) if tags else None)
 
+    @staticmethod
+    def from_trusted_dict(data: dict[str, object]) -> "NoteEntity":
+        """Rehydrate a note persisted by this application, keeping its tags as stored."""
+        note = NoteEntity.__new__(NoteEntity)
+        note.topic = data["topic"]
+        note.content = data["content"]
+        note.tags = [sys.intern(tag) for tag in data["tags"]]
+        return note
+
 
 class Notes(UserList[NoteEntity]):
     """Class container for Notes entities.
-    Inherits from UserList to manage a list of NoteEntity objects."""
+    Inherits from UserList to manage a list of NoteEntity objects.
+    Notes opened over a NoteSource are read from it on first access;
+    topic lookups and tag searches are answered by the source until then,
+    and notes added, edited or deleted by topic are kept aside and merged
+    into the list when it is read.
+    Text and tag searches go through indexes built on the first search,
+    and sorting by tag reads a view that is kept in order as notes change."""
+
+    def __init__(self, initlist=None, source: NoteSource | None = None):
+        self._data: list[NoteEntity] | None = None
+        super().__init__(initlist)
+        # True when the notes differ from what was last loaded or saved.
+        self._dirty = False
+        # Changes made since the last save, persisted by the storage backend.
+        self._changes: list[Change] = []
+        self._storage: StorageBackend | None = None
+        self._source = source
+        if source is not None:
+            self._data = None
+        # Open transaction: the content and tags of every note edited since
+        # begin(), and the note list if notes were added or deleted; the
+        # edited notes are None when no transaction is open.
+        self._saved_notes: dict[int, tuple[NoteEntity, str, list[str]]] | None = None
+        self._saved_list: list[NoteEntity] | None = None
+        # The same for notes not read from the source yet: the lookups and
+        # added notes kept aside, see _keep_list.
+        self._saved_lazy: tuple[dict[str, NoteEntity | None], list[NoteEntity]] | None = None
+        self._saved_dirty = False
+        self._saved_changes = 0
+        # Undo history, if one is attached.
+        self._history: History | None = None
+
+    @property
+    def data(self) -> list[NoteEntity]:
+        """The list of notes, read from the source on first access."""
+        if self._data is None:
+            loaded = [NoteEntity.from_dict(note_data) for note_data in self._source.load_all()]
+            if self._saved_lazy is not None:
+                self._saved_list = self._merge(loaded, *self._saved_lazy)
+                self._saved_lazy = None
+            self._data = self._merge(loaded, self._fetched, self._added)
+            self._fetched, self._added = {}, []
+        if self._removed:
+            self._data = [item for item in self._data if id(item) not in self._removed]
+            self._listed -= len(self._removed)
+            self._removed = {}
+        return self._data
+
+    @data.setter
+    def data(self, value: list[NoteEntity]) -> None:
+        self._data = value
+        # Notes by topic, in list order; None when the list was changed directly.
+        self._by_topic: dict[str, NoteEntity] | None = None
+        # Length of the list the topic map was kept for. With duplicate
+        # topics the map is smaller, so its own size cannot tell.
+        self._listed = 0
+        # Notes deleted by topic but still in the list until it is next read.
+        self._removed: dict[int, NoteEntity] = {}
+        # Before the list is read from the source: notes looked up by topic
+        # (None if there is no such note) and notes added since.
+        self._fetched: dict[str, NoteEntity | None] = {}
+        self._added: list[NoteEntity] = []
+        self._text_index: NoteTextIndex | None = None
+        self._tag_index: NoteTagIndex | None = None
+        self._sorted_views: dict[str | None, NoteSortedView] = {}
+
+    def _topics(self) -> dict[str, NoteEntity]:
+        """Return the topic map, rebuilding it if the list was changed directly."""
+        data = self._data if self._data is not None else self.data
+        if self._by_topic is None or self._listed != len(data):
+            self._by_topic = {}
+            for item in self.data:
+                self._by_topic.setdefault(item.topic, item)
+            self._listed = len(self._data)
+        return self._by_topic
+
+    @staticmethod
+    def _merge(
+        loaded: list[NoteEntity], fetched: dict[str, NoteEntity | None], added: list[NoteEntity]
+    ) -> list[NoteEntity]:
+        """The notes read from the source, with the changes kept aside applied."""
+        added_ids = {id(item) for item in added}
+        notes = []
+        for item in loaded:
+            if item.topic in fetched:
+                item = fetched[item.topic]
+                # Deleted, or deleted and added again at the end.
+                if item is None or id(item) in added_ids:
+                    continue
+            notes.append(item)
+        notes.extend(added)
+        return notes
+
+    def _append(self, item: NoteEntity) -> None:
+        if self._data is None:
+            self._fetched[item.topic] = item
+            self._added.append(item)
+            return
+        self._topics()[item.topic] = item
+        self._data.append(item)
+        self._listed += 1
+
+    def _remove(self, item: NoteEntity) -> None:
+        if self._data is None:
+            self._fetched[item.topic] = None
+            self._added = [added for added in self._added if added is not item]
+            return
+        # The list is compacted on its next read, so deleting is O(1).
+        del self._topics()[item.topic]
+        self._removed[id(item)] = item
+
+    def _index_note(self, item: NoteEntity) -> None:
+        """Bring the text index up to date with a new or edited note."""
+        if self._text_index is not None:
+            self._text_index.add(item)
+        if "length" in self._sorted_views:
+            self._sorted_views["length"].add(item)
+
+    def _index_tags(self, item: NoteEntity) -> None:
+        """Bring the tag index up to date with a new or retagged note."""
+        if self._tag_index is not None:
+            self._tag_index.add(item)
+        for view in self._sorted_views.values():
+            view.add(item)
+
+    def _unindex_note(self, topic: str) -> None:
+        """Drop a deleted note from the indexes."""
+        if self._text_index is not None:
+            self._text_index.remove(topic)
+        if self._tag_index is not None:
+            self._tag_index.remove(topic)
+        for view in self._sorted_views.values():
+            view.remove(topic)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the notes have unsaved changes."""
+        return self._dirty
+
+    def mark_clean(self) -> None:
+        """Mark the current state as persisted."""
+        self._dirty = False
+        self._changes = []
+
+    # ----- Transactions ---------------------------------------------------
+    @property
+    def in_transaction(self) -> bool:
+        """Whether changes are collected in an open transaction."""
+        return self._saved_notes is not None
+
+    def begin(self) -> None:
+        """
+        Open a transaction. Nothing is copied up front: a note is kept when it
+        is first edited, the note list when a note is first added or deleted.
+
+        :raises ValueError: If a transaction is already open.
+        """
+        if self._saved_notes is not None:
+            raise ValueError("A transaction is already open.")
+        self._saved_notes = {}
+        self._saved_list = None
+        self._saved_lazy = None
+        self._saved_dirty = self._dirty
+        self._saved_changes = len(self._changes)
+
+    def commit(self) -> None:
+        """Keep the changes of the open transaction; they are saved as usual."""
+        if self._saved_notes is None:
+            raise ValueError("No transaction is open.")
+        self._saved_notes = None
+        self._saved_list = None
+        self._saved_lazy = None
+
+    def rollback(self) -> None:
+        """Undo every change made since ``begin`` and close the transaction."""
+        saved_notes, saved_list, saved_lazy = self._saved_notes, self._saved_list, self._saved_lazy
+        if saved_notes is None:
+            raise ValueError("No transaction is open.")
+        self.commit()
+        for item, content, tags in saved_notes.values():
+            item.content = content
+            item.tags = tags
+        if saved_list is not None:
+            # Also drops the lookups and indexes; they are rebuilt on next use.
+            self.data = saved_list
+        elif saved_lazy is not None:
+            self._fetched, self._added = saved_lazy
+        else:
+            for item, _, _ in saved_notes.values():
+                self._index_note(item)
+                self._index_tags(item)
+        del self._changes[self._saved_changes:]
+        self._dirty = self._saved_dirty
+
+    def _keep(self, item: NoteEntity) -> None:
+        """In a transaction, remember the content and tags of a note before its first edit."""
+        if self._saved_notes is not None and id(item) not in self._saved_notes:
+            self._saved_notes[id(item)] = (item, item.content, item.tags[:])
+
+    def _keep_list(self) -> None:
+        """In a transaction, remember the note list before its first change."""
+        if self._saved_notes is None or self._saved_list is not None or self._saved_lazy is not None:
+            return
+        if self._data is None:
+            # Not read from the source yet: keep what was set aside instead.
+            self._saved_lazy = (dict(self._fetched), list(self._added))
+        else:
+            self._saved_list = list(self.data)
+
+    def _record(self, op: str, topic: str, args: tuple, inverse: list[Change] | None = None) -> None:
+        """
+        Remember a change so that it can be persisted on the next save, and
+        its ``inverse`` so that it can be undone.
+        """
+        self._changes.append((op, topic, args))
+        self._dirty = True
+        if self._history is not None and inverse is not None:
+            self._history.record(self, inverse)
+
+    def _restoring(self, item: NoteEntity) -> list[Change] | None:
+        """The change that adds a note about to be deleted back, at its place in the list."""
+        if self._history is None:
+            return None
+        tags = ",".join(item.tags) or None
+        return [("add_note", item.topic, (item.content, tags, self._index_of(item)))]
+
+    def _index_of(self, item: NoteEntity) -> int:
+        """Return the position of ``item`` in the list, without reading notes not read yet."""
+        if self._data is not None:
+            return next(index for index, note in enumerate(self.data) if note is item)
+        added_ids = {id(added) for added in self._added}
+        # Notes of the source out of their place: deleted, or deleted and added again.
+        moved = [position for position in (
+            self._source.position(topic) for topic, fetched in self._fetched.items()
+            if fetched is None or id(fetched) in added_ids
+        ) if position is not None]
+        if id(item) in added_ids:
+            kept = self._source.position(None) - len(moved)
+            return kept + next(index for index, added in enumerate(self._added) if added is item)
+        position = self._source.position(item.topic)
+        return position - sum(1 for other in moved if other < position)
+
+    def _insert(self, index: int, item: NoteEntity) -> None:
+        """Put a note back at ``index`` of the list; notes not read yet are read first."""
+        self.data.insert(index, item)
+        # The lookups and views follow list order; they are rebuilt on next use.
+        self._by_topic = None
+        self._text_index = None
+        self._tag_index = None
+        self._sorted_views = {}
+
+    def apply_change(self, op: str, topic: str, args: list) -> None:
+        """
+        Re-apply a change record produced by these notes, e.g. from the journal.
+        Tag arguments are already normalized, so no messages are printed.
+
+        :raises ValueError: If the change cannot be applied to the current state.
+        """
+        if op == "add_note":
+            if self.find_note_by_topic(topic):
+                raise ValueError(f"Note with topic {topic} already exists")
+            # Written by undo of a deletion: the note goes back to its index.
+            content, tag, *index = args
+            item = NoteEntity(topic, content, tag)
+            self._keep_list()
+            if index:
+                self._insert(index[0], item)
+            else:
+                self._append(item)
+            self._index_note(item)
+            self._index_tags(item)
+            self._record(op, topic, tuple(args), [("delete_note", topic, ())])
+            return
+
+        item = self.find_note_by_topic(topic)
+        if item is None:
+            raise ValueError(f"Note with topic '{topic}' not found.")
+        self._keep(item)
+        if op == "edit_note":
+            inverse = [(op, topic, (item.content,))]
+        elif op == "delete_note":
+            inverse = self._restoring(item)
+        else:
+            inverse = [("set_tags", topic, tuple(item.tags))]
+        if op == "edit_note":
+            item.content = args[0]
+            self._index_note(item)
+        elif op == "delete_note":
+            self._keep_list()
+            self._remove(item)
+            self._unindex_note(topic)
+        elif op == "add_tag":
+            item.tags.extend(t for t in args if t not in item.tags)
+        elif op == "edit_tag":
+            old, new = args
+            item.tags.remove(old)
+            if new not in item.tags:
+                item.tags.append(new)
+        elif op == "delete_tags":
+            for tag_item in args:
+                item.tags.remove(tag_item)
+        elif op == "set_tags":
+            # Written by undo and redo of the tag commands.
+            item.tags = [sys.intern(tag_item) for tag_item in args]
+        else:
+            raise ValueError(f"Unknown change operation '{op}'.")
+        if op in ("add_tag", "edit_tag", "delete_tags", "set_tags"):
+            self._index_tags(item)
+        self._record(op, topic, tuple(args), inverse)
 
     def __str__(self):
         ret = ""
@@ -61,58 +384,80 @@ class Notes(UserList[NoteEntity]):
         if self.find_note_by_topic(topic):
             return f"Note with topic {topic} already exists"
 
-        self.data.append(NoteEntity(topic, note, tag))
+        item = NoteEntity(topic, note, tag)
+        self._keep_list()
+        self._append(item)
+        self._index_note(item)
+        self._index_tags(item)
+        self._record("add_note", topic, (note, tag), [("delete_note", topic, ())])
         return "New note is added"
 
     def find_note_by_topic(self, topic: str):
         """Return note for the given topic or None if not found"""
-        for item in self.data:
-            if item.topic == topic:
-                return item
-        return None
+        if self._data is None:
+            if topic not in self._fetched:
+                note_data = self._source.find_by_topic(topic)
+                self._fetched[topic] = None if note_data is None else NoteEntity.from_dict(note_data)
+            return self._fetched[topic]
+        return self._topics().get(topic)
 
     def edit_note(self, topic: str, new_note: str):
         """Edit the content of an existing note."""
         item = self.find_note_by_topic(topic)
         if item:
+            self._keep(item)
+            inverse = [("edit_note", topic, (item.content,))]
             item.content = new_note
+            self._index_note(item)
+            self._record("edit_note", topic, (new_note,), inverse)
             return "The note is changed."
         return "Note not found."
 
     def delete_note(self, topic: str):
         """Delete a note by its topic."""
-        if not self.data:
-            return "There are no notes to delete."
         item = self.find_note_by_topic(topic)
+        # Unread notes are not read in full just to tell that there are none.
+        if item is None and self._data is not None and not self._topics():
+            return "There are no notes to delete."
         if item:
-            self.data.remove(item)
+            inverse = self._restoring(item)
+            self._keep_list()
+            self._remove(item)
+            self._unindex_note(topic)
+            self._record("delete_note", topic, (), inverse)
             return "The note is deleted."
         return f"Note with topic '{topic}' not found."
 
     def find_text_in_notes(self, text: str):
         """Find notes containing the given text in their content or topic."""
+        if self._text_index is None:
+            self._text_index = NoteTextIndex(self.data)
+        text = text.lower().strip()
         results = []
-        for item in self.data:
-            if (text.lower().strip() in item.content.lower() or
-                    text.lower().strip() in item.topic.lower()):
+        for item in self._text_index.candidates(text):
+            if text in item.content.lower() or text in item.topic.lower():
                 results.append(item)
         return results
 
     def add_tag(self, topic: str, tag: str):
         """Add a tag to an existing note.
         May add multiple tags separated by commas."""
-        tag_is_new = False
+        added_tags = []
         item = self.find_note_by_topic(topic)
         if item:
-            tag_lst = [t.strip().lower() for t in tag.split(",")]
+            tag_lst = [sys.intern(t.strip().lower()) for t in tag.split(",")]
+            self._keep(item)
+            inverse = [("set_tags", topic, tuple(item.tags))]
             for tag_item in tag_lst:
                 if tag_item not in item.tags:
-                    tag_is_new = True
+                    added_tags.append(tag_item)
                     item.tags.append(tag_item)
-            if tag_is_new:
-                return rprint(TAG_ADDED.format(topic=topic))
+            if added_tags:
+                self._index_tags(item)
+                self._record("add_tag", topic, tuple(added_tags), inverse)
+                return TAG_ADDED.format(topic=topic)
             return "Such tag(s) already exist."
-        return rprint(NOTE_NOT_FOUND.format(topic=topic))
+        return NOTE_NOT_FOUND.format(topic=topic)
 
     def edit_tag(self, topic: str, old_tag: str, new_tag: str):
         """Edit a tag of an existing note."""
@@ -121,11 +466,15 @@ class Notes(UserList[NoteEntity]):
         item = self.find_note_by_topic(topic)
         if item:
             old = old_tag.strip().lower()
-            new = new_tag.strip().lower()
+            new = sys.intern(new_tag.strip().lower())
             if old in item.tags:
+                self._keep(item)
+                inverse = [("set_tags", topic, tuple(item.tags))]
                 item.tags.remove(old)
                 if new not in item.tags:
                     item.tags.append(new)
+                self._index_tags(item)
+                self._record("edit_tag", topic, (old, new), inverse)
                 return "The tag is changed."
             return f"Tag {old_tag} not found in the note."
         return NOTE_NOT_FOUND.format(topic=topic)
@@ -133,57 +482,159 @@ class Notes(UserList[NoteEntity]):
     def delete_tags(self, topic: str, tag: str):
         """Delete tags from an existing note.
         May delete multiple tags separated by commas."""
-        tag_in_note_tags = False
+        deleted_tags = []
         item = self.find_note_by_topic(topic)
         if item:
             tag_lst = tag.lower().strip().split(",")
             tag_lst = list(map(str.strip, tag_lst))
+            self._keep(item)
+            inverse = [("set_tags", topic, tuple(item.tags))]
             for tag_item in tag_lst:
                 if tag_item in item.tags:
                     item.tags.remove(tag_item)
-                    tag_in_note_tags = True
-            if tag_in_note_tags:
+                    deleted_tags.append(tag_item)
+            if deleted_tags:
+                self._index_tags(item)
+                self._record("delete_tags", topic, tuple(deleted_tags), inverse)
                 return "Tags deleted."
             return "No such tags in the note."
         return f"Note with topic '{topic}' not found."
 
     def search_by_tag(self, tag: str):
-        """Find notes containing the given tag.
-        Multiple tags separated by commas are not supported."""
-        results = []
-        for item in self.data:
-            if tag.lower().strip() in item.tags:
-                results.append(item)
-        return results
+        """Find notes matching the given tag or tag query.
+        Tags are combined with 'and', 'or' and 'not'; a comma means 'or'.
+
+        :raises ValueError: If the tag query is malformed."""
+        expression = parse_tag_query(tag)
+        if self._data is None and not self._dirty and expression[0] == "tag":
+            return [NoteEntity.from_dict(note_data)
+                    for note_data in self._source.find_by_tag(expression[1])]
+        if self._tag_index is None:
+            self._tag_index = NoteTagIndex(self.data)
+        return self._tag_index.query(expression)
+
+    def sort_by_tag(self, then_by: str | None = None, page: int | None = None,
+                    page_size: int = 20):
+        """Return notes sorted by their first tag alphabetically.
+        Notes with the same first tag are ordered by 'then_by' ('topic' or
+        'length' of the content), then by insertion order.
+        If 'page' is given, only that page (starting from 1) is returned.
 
-    def sort_by_tag(self):
-        """Return notes sorted by their first tag alphabetically."""
-        if not self.data:
+        :raises ValueError: If 'then_by' is not a known sort key."""
+        if not self._topics():
             return None
-        return sorted(self.data, key=lambda x: x.tags[0] if x.tags else "")
+        view = self._sorted_views.get(then_by)
+        if view is None:
+            view = self._sorted_views[then_by] = NoteSortedView(then_by, self.data)
+        if page is None:
+            return view.slice()
+        start = (page - 1) * page_size
+        return view.slice(start, start + page_size)
 
     # ----- Persistence helpers -------------------------------------------
     def to_payload(self) -> list[dict[str, object]]:
         return [note.to_dict() for note in self.data]
 
     @classmethod
-    def from_payload(cls, payload: list[dict[str, object]]) -> "Notes":
+    def from_payload(cls, payload: Iterable[dict[str, object]], trusted: bool = False) -> "Notes":
         notes = cls()
+        from_dict = NoteEntity.from_trusted_dict if trusted else NoteEntity.from_dict
         for note_data in payload:
             try:
-                notes.data.append(NoteEntity.from_dict(note_data))
+                notes.data.append(from_dict(note_data))
             except Exception as e:
                 print(f"[WARNING]: Failed to load note: {note_data!r}. Details: {e}")
         return notes
 
     @staticmethod
-    def load_from_storage() -> "Notes":
-        storage = DataStorage(NOTES_FILE)
-        raw_data = storage.load_data()
-        payload = raw_data.get("data") or []
-        return Notes.from_payload(payload) if payload else Notes()
-
-    def save_to_storage(self, silent: bool = False) -> None:
-        data_to_save = {"version": STORAGE_VERSION, "data": self.to_payload()}
-        storage = DataStorage(NOTES_FILE)
-        storage.save_data(data_to_save, silent=silent)
+    def load_from_storage(storage: StorageBackend | None = None) -> "Notes":
+        storage = storage or open_storage(NOTES_FILE)
+        # Snapshot and journal are read without another session writing in between.
+        with storage.read_session():
+            source = storage.record_source()
+            if source is not None:
+                notes = Notes(source=source)
+                notes._storage = storage
+                return notes
+
+            # Records are streamed straight into notes, without a full payload copy.
+            notes = storage.load_records(Notes.from_payload) or Notes()
+            notes._replay(storage.replay_journal())
+        notes.mark_clean()
+        notes._storage = storage
+        return notes
+
+    def refresh_from_storage(self) -> bool:
+        """
+        Catch up with changes another session saved, keeping unsaved ones.
+
+        Works like ``ContactBook.refresh_from_storage``.
+
+        :return: True if the notes were updated.
+        """
+        storage = self._storage
+        if storage is None or not storage.changed_on_disk():
+            return False
+        if not self._changes:
+            changes = storage.new_changes()
+            if changes is not None:
+                self._replay(changes)
+                self.mark_clean()
+                return True
+        pending = self._changes
+        fresh = Notes.load_from_storage(storage)
+        self._source = fresh._source
+        self.data = fresh._data
+        self.mark_clean()
+        self._replay(pending)
+        return True
+
+    def _replay(self, changes: Iterable[Change]) -> None:
+        """Apply change records, reporting the ones that fail; they are not undoable."""
+        history, self._history = self._history, None
+        try:
+            for op, topic, args in changes:
+                try:
+                    self.apply_change(op, topic, args)
+                except Exception as e:
+                    print(f"[WARNING]: Failed to replay change '{op}' for note '{topic}'. Details: {e}")
+        finally:
+            self._history = history
+
+    def save_to_storage(self, silent: bool = False) -> bool:
+        if self._storage is None:
+            self._storage = open_storage(NOTES_FILE)
+        with self._storage.write_session():
+            # Merge what other sessions saved, so that their edits are not overwritten.
+            self.refresh_from_storage()
+            saved = self._storage.save_changes(
+                self._changes,
+                lambda: {"version": STORAGE_VERSION, "data": self.to_payload()},
+                silent=silent,
+            )
+        if saved:
+            self.mark_clean()
+        return saved
+
+
+def _invalidating_lookups(name: str):
+    """Wrap a mutating UserList method so that it drops the topic map and indexes."""
+    method = getattr(UserList, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._keep_list()
+        result = method(self, *args, **kwargs)
+        self._by_topic = None
+        self._text_index = None
+        self._tag_index = None
+        self._sorted_views = {}
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "insert",
+              "pop", "remove", "clear", "extend"):
+    setattr(Notes, _name, _invalidating_lookups(_name))
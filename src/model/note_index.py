@@ -0,0 +1,235 @@
+"""Inverted indexes and sorted views over notes, keyed by note topic."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.model.note import NoteEntity
+
+# Length of the character n-grams the text is split into.
+GRAM_SIZE = 3
+
+# Keywords of tag queries, from the loosest to the tightest binding.
+TAG_QUERY_KEYWORDS = ("or", "and", "not")
+
+
+def grams(text: str) -> set[str]:
+    """Return the distinct character trigrams of ``text``."""
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class _NoteIndex:
+    """
+    Map index terms to the topics of the notes they were extracted from.
+
+    Results are returned in the order the notes were first indexed, which
+    matches the order of the notes list.
+    """
+
+    def __init__(self, notes: Iterable[NoteEntity] = ()) -> None:
+        self._postings: dict[str, set[str]] = {}
+        # Indexed notes by topic, with the terms they were indexed under.
+        self._notes: dict[str, tuple[NoteEntity, set[str]]] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        for note in notes:
+            self.add(note)
+
+    def add(self, note: NoteEntity) -> None:
+        """Index a new note, or re-index a note that has changed."""
+        previous = self._notes.get(note.topic)
+        if previous is None:
+            self._order[note.topic] = self._next_order
+            self._next_order += 1
+        else:
+            self._unlink(note.topic, previous[1])
+
+        terms = self._terms(note)
+        for term in terms:
+            self._postings.setdefault(term, set()).add(note.topic)
+        self._notes[note.topic] = (note, terms)
+
+    def remove(self, topic: str) -> None:
+        """Drop the note with the given topic from the index."""
+        entry = self._notes.pop(topic, None)
+        if entry is not None:
+            self._unlink(topic, entry[1])
+            del self._order[topic]
+
+    def _terms(self, note: NoteEntity) -> set[str]:
+        raise NotImplementedError
+
+    def _notes_for(self, topics: Iterable[str]) -> list[NoteEntity]:
+        return [self._notes[topic][0] for topic in sorted(topics, key=self._order.__getitem__)]
+
+    def _unlink(self, topic: str, terms: set[str]) -> None:
+        for term in terms:
+            topics = self._postings[term]
+            topics.discard(topic)
+            if not topics:
+                del self._postings[term]
+
+
+class NoteTextIndex(_NoteIndex):
+    """
+    Map lowercased character trigrams of note topics and contents to the
+    topics of the notes that contain them.
+
+    Lookups only narrow down the candidates: a note holding every trigram of
+    the query does not necessarily contain the query itself, so callers verify
+    each candidate.
+    """
+
+    def candidates(self, text: str) -> list[NoteEntity]:
+        """
+        Return the notes that may contain the lowercased ``text``.
+
+        Queries shorter than a trigram cannot be narrowed down, so every note
+        is a candidate.
+        """
+        if len(text) < GRAM_SIZE:
+            return [note for note, _ in self._notes.values()]
+
+        # Intersect starting from the rarest trigram to keep the sets small.
+        postings = sorted((self._postings.get(gram, set()) for gram in grams(text)), key=len)
+        topics = set(postings[0])
+        for posting in postings[1:]:
+            if not topics:
+                break
+            topics &= posting
+        return self._notes_for(topics)
+
+    def _terms(self, note: NoteEntity) -> set[str]:
+        return grams(note.topic.lower()) | grams(note.content.lower())
+
+
+class NoteTagIndex(_NoteIndex):
+    """Map tags to the topics of the notes carrying them."""
+
+    def query(self, expression) -> list[NoteEntity]:
+        """Return the notes matching a query built by ``parse_tag_query``."""
+        return self._notes_for(self._evaluate(expression))
+
+    def _evaluate(self, expression) -> set[str]:
+        kind, operand = expression
+        if kind == "tag":
+            return set(self._postings.get(operand, ()))
+        if kind == "not":
+            return self._notes.keys() - self._evaluate(operand)
+
+        # Evaluate the smallest operands first so that AND shrinks early.
+        results = sorted((self._evaluate(item) for item in operand), key=len)
+        if kind == "and":
+            return set.intersection(*results)
+        return set.union(*results)
+
+    def _terms(self, note: NoteEntity) -> set[str]:
+        return set(note.tags)
+
+
+def parse_tag_query(query: str):
+    """
+    Parse a tag query such as ``"work and not done, home"``.
+
+    ``and``, ``or`` and ``not`` combine tags, with ``not`` binding tightest
+    and ``or`` loosest; a comma is a shorthand for ``or``. Consecutive words
+    form a single tag, so tags containing spaces need no quoting.
+
+    :return: A nested ``(kind, operand)`` tuple: ``("tag", name)``,
+        ``("not", expression)``, ``("and", [expressions])`` or
+        ``("or", [expressions])``.
+    :raises ValueError: If the query is empty or malformed.
+    """
+    tokens = []
+    for word in query.lower().replace(",", " or ").split():
+        if word not in TAG_QUERY_KEYWORDS and tokens and tokens[-1][0] == "tag":
+            tokens[-1] = ("tag", f"{tokens[-1][1]} {word}")
+        else:
+            tokens.append((word, None) if word in TAG_QUERY_KEYWORDS else ("tag", word))
+
+    position = 0
+
+    def parse_level(level: int):
+        nonlocal position
+        if level == len(TAG_QUERY_KEYWORDS) - 1:
+            if position < len(tokens) and tokens[position][0] == "not":
+                position += 1
+                return ("not", parse_level(level))
+            if position == len(tokens) or tokens[position][0] != "tag":
+                raise ValueError(f"Expected a tag in query '{query}'.")
+            position += 1
+            return tokens[position - 1]
+
+        keyword = TAG_QUERY_KEYWORDS[level]
+        operands = [parse_level(level + 1)]
+        while position < len(tokens) and tokens[position][0] == keyword:
+            position += 1
+            operands.append(parse_level(level + 1))
+        return operands[0] if len(operands) == 1 else (keyword, operands)
+
+    expression = parse_level(0)
+    if position != len(tokens):
+        raise ValueError(f"Unexpected '{tokens[position][0]}' in query '{query}'.")
+    return expression
+
+
+# Secondary sort keys of NoteSortedView, applied among notes with the same first tag.
+SORT_KEYS = {
+    "topic": lambda note: note.topic.lower(),
+    "length": lambda note: len(note.content),
+}
+
+
+class NoteSortedView:
+    """
+    Keep notes ordered by first tag, then by an optional secondary key, then
+    by the order in which they were added; untagged notes come first.
+
+    The entries are kept sorted as notes change, so reading the view or a
+    page of it never sorts.
+    """
+
+    def __init__(self, then_by: str | None = None, notes: Iterable[NoteEntity] = ()) -> None:
+        if then_by is not None and then_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{then_by}'. Use one of: {', '.join(SORT_KEYS)}.")
+        self._secondary = SORT_KEYS.get(then_by)
+        # Sorted (first tag, secondary value, order, topic) tuples.
+        self._entries: list[tuple] = []
+        self._keys: dict[str, tuple] = {}
+        self._notes: dict[str, NoteEntity] = {}
+        self._next_order = 0
+        for note in notes:
+            self.add(note)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, note: NoteEntity) -> None:
+        """Insert a new note, or move a note whose tags or content changed."""
+        previous = self._keys.get(note.topic)
+        if previous is None:
+            order = self._next_order
+            self._next_order += 1
+        else:
+            order = previous[2]
+            del self._entries[bisect_left(self._entries, previous)]
+
+        first_tag = note.tags[0] if note.tags else ""
+        secondary = self._secondary(note) if self._secondary else None
+        key = (first_tag, secondary, order, note.topic)
+        insort(self._entries, key)
+        self._keys[note.topic] = key
+        self._notes[note.topic] = note
+
+    def remove(self, topic: str) -> None:
+        """Drop the note with the given topic from the view."""
+        key = self._keys.pop(topic, None)
+        if key is not None:
+            del self._entries[bisect_left(self._entries, key)]
+            del self._notes[topic]
+
+    def slice(self, start: int = 0, stop: int | None = None) -> list[NoteEntity]:
+        """Return the notes at positions ``start`` to ``stop`` of the view."""
+        return [self._notes[key[3]] for key in self._entries[start:stop]]
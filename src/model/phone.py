@@ -4,10 +4,29 @@ from src.util.messages import INVALID_PHONE
 
 # Represents a phone number with validation: must be exactly 10 digits
 class Phone(Field):
+    __slots__ = ()
+
+    # When True, numbers are kept as ints (less memory per phone); ``value``
+    # still returns the 10-digit string.
+    PACKED = False
+
+    # Field's only slot, which the ``value`` property below hides; it holds
+    # the string or the packed int.
+    _digits = Field.value
+
     def __init__(self, value):
         if not value.isdigit() or len(value) != 10:
             raise ValueError(INVALID_PHONE)
         super().__init__(value)
 
+    @property
+    def value(self) -> str:
+        digits = self._digits
+        return digits if digits.__class__ is str else f"{digits:010d}"
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._digits = int(value) if self.PACKED else value
+
     def __str__(self):
         return str(self.value)
@@ -0,0 +1,164 @@
+"""
+Validation of contact records on several cores.
+
+Building a ``Contact`` from an untrusted record runs the field validators
+(the ``Email`` regex, ``Birthday``'s ``strptime``, ``Phone``'s digit check),
+which is pure CPU work. ``validate_contacts`` splits a stream of records into
+chunks of ``VALIDATION_CHUNK`` and validates them in a process pool. Workers
+return plain tuples, or nothing for a record that is already in canonical
+form; the main process rebuilds the contacts without validating again.
+Results come back in input order and carry the same error messages as
+validation in this process, which is used for small inputs, a single core or
+``VALIDATION_WORKERS = 1``, and for the rest of the records if the pool
+cannot start or breaks, e.g. when a worker is killed.
+
+Workers are spawned rather than forked, so that they do not copy the state of
+threads running in this process, such as the background save writer.
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, TypeVar
+
+from src import data_storage
+from src.model.contact import Contact
+
+T = TypeVar("T")
+
+# A validated record: None if the record equals Contact.to_dict of its
+# contact, the values of to_dict if not, or (None, error message).
+Validated = tuple | None
+
+
+def validate_contacts(
+    items: Iterable[tuple[T, Dict[str, Any]]],
+    workers: int | None = None,
+) -> Iterator[tuple[T, Contact | None, str]]:
+    """
+    Validates ``(tag, record)`` pairs of records in ``Contact.to_dict`` form.
+
+    Yields ``(tag, contact, "")`` for a valid record and ``(tag, None,
+    message)`` for an invalid one, in input order. Tags stay in this process,
+    e.g. the line number a record was read from.
+
+    :param workers: Number of processes; defaults to ``VALIDATION_WORKERS``.
+    """
+    workers = _worker_count(data_storage.VALIDATION_WORKERS if workers is None else workers)
+    size = data_storage.VALIDATION_CHUNK
+    items = iter(items)
+    chunks = iter(lambda: list(islice(items, size)), [])
+    first = next(chunks, None)
+    if first is None:
+        return
+    chunks = chain([first], chunks)
+    if workers <= 1 or len(first) < size:
+        for chunk in chunks:
+            yield from _validate_chunk(chunk)
+        return
+
+    pool = _ValidationPool(workers)
+    try:
+        # A few chunks per worker in flight keep every core busy with bounded memory.
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(chunk)))
+            if len(pending) >= 2 * workers:
+                yield from pool.results(*pending.popleft())
+        while pending:
+            yield from pool.results(*pending.popleft())
+    finally:
+        pool.close()
+
+
+class _ValidationPool:
+    """A process pool that falls back to validation in this process if it fails."""
+
+    def __init__(self, workers: int):
+        try:
+            self._pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        except OSError as e:
+            self._pool = None
+            _report_fallback(e)
+
+    def submit(self, chunk: list[tuple[T, Dict[str, Any]]]) -> Future | None:
+        """Start validating a chunk; None if it is to be validated in this process."""
+        if self._pool is None:
+            return None
+        try:
+            return self._pool.submit(validate_records, [record for _, record in chunk])
+        except (OSError, BrokenExecutor) as e:
+            self._fail(e)
+            return None
+
+    def results(self, chunk: list[tuple[T, Dict[str, Any]]], future: Future | None) -> Iterator[tuple[T, Contact | None, str]]:
+        """Yield the validated chunk, validating it here if its worker failed."""
+        if future is not None and self._pool is not None:
+            try:
+                results = future.result()
+            except (OSError, BrokenExecutor) as e:
+                self._fail(e)
+            else:
+                return _rebuild(chunk, results)
+        return _validate_chunk(chunk)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _fail(self, error: Exception) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        _report_fallback(error)
+
+
+def _report_fallback(error: Exception) -> None:
+    print(f"[WARNING]: Validating contacts without worker processes. Details: {str(error) or type(error).__name__}")
+
+
+def validate_records(records: list[Dict[str, Any]]) -> list[Validated]:
+    """Validates a chunk of records in a worker process."""
+    results = []
+    for record in records:
+        contact, error = _validate(record)
+        if contact is None:
+            results.append((None, error))
+        else:
+            # Canonical records, e.g. from a snapshot, need not travel back.
+            fields = contact.to_dict()
+            results.append(None if fields == record else tuple(fields.values()))
+    return results
+
+
+def _validate(record: Dict[str, Any]) -> tuple[Contact | None, str]:
+    try:
+        return Contact.from_dict(record), ""
+    except Exception as e:
+        return None, str(e)
+
+
+def _validate_chunk(chunk: list[tuple[T, Dict[str, Any]]]) -> Iterator[tuple[T, Contact | None, str]]:
+    for tag, record in chunk:
+        contact, error = _validate(record)
+        yield tag, contact, error
+
+
+def _rebuild(chunk: list[tuple[T, Dict[str, Any]]], results: list[Validated]) -> Iterator[tuple[T, Contact | None, str]]:
+    for (tag, record), result in zip(chunk, results):
+        if result is None:
+            yield tag, Contact.from_trusted_dict(record), ""
+        elif result[0] is None:
+            yield tag, None, result[1]
+        else:
+            name, phones, emails, addresses, birthday = result
+            contact = Contact.from_trusted_dict({
+                "name": name, "phones": phones, "emails": emails,
+                "addresses": addresses, "birthday": birthday,
+            })
+            yield tag, contact, ""
+
+
+def _worker_count(workers: int | None) -> int:
+    return workers if workers is not None else (os.cpu_count() or 1)
@@ -1,6 +1,10 @@
 """Module for the LexemesBuilder class."""
+import re
 from enum import Enum
 
+# A run of plain characters, a closed quotation, a run of spaces or a lone quotation mark.
+SEGMENT = re.compile(r"""[^ '"]+|"[^"]*"|'[^']*'| +|['"]""")
+
 
 class LexemesBuilder:
     """
@@ -31,6 +35,30 @@ class LexemesBuilder:
         else:
             self.__append_char_to_lexeme(char)
 
+    def append_text(self, text: str) -> None:
+        """
+        Appends a run of characters, with the same result as appending them
+        one by one but without a method call per character.
+        """
+        if self.__has_open_quote():
+            for char in text:
+                self.append_char(char)
+            return
+        for match in SEGMENT.finditer(text):
+            segment = match.group()
+            first = segment[0]
+            if first == " ":
+                self.__handle_whitespace()
+            elif first not in "'\"":
+                self.__lexeme += segment
+            elif len(segment) > 1:
+                self.__lexeme += segment[1:-1]
+            else:
+                # An unclosed quotation: the rest of the text is inside it.
+                for char in text[match.start():]:
+                    self.append_char(char)
+                return
+
     def build(self) -> list[str]:
         """Closes the current part and returns the list of parts."""
         if self.__lexeme_is_not_empty():
@@ -21,8 +21,7 @@ def parse(input_line: str) -> Command | None:
     :return: An object containing the extracted command name and a list of its arguments.
     """
     builder = LexemesBuilder()
-    for char in input_line:
-        builder.append_char(char)
+    builder.append_text(input_line)
     lexemes = builder.build()
     if len(lexemes) == 0:
         return None
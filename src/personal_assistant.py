@@ -8,12 +8,20 @@ The `PersonalAssistant` class acts as the main interface for the system, allowin
 users to interact with a series of commands such as adding contacts, adding notes,
 or exiting the application.
 """
+import signal
+import sys
+from typing import Iterable
+
 import rich
+from rich.console import Console
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.styles import Style
 
+from src import data_storage
+from src.data_storage import CONTACTS_FILE, NOTES_FILE, StorageConfig, current_config, open_storage
 from src.command.command import Command
+from src.command.handler import confirm_delete
 from src.command.handler.note.add_tags import AddTagsCommandHandler
 from src.command.handler.note.change_tag import ChangeTagCommandHandler
 from src.command.handler.note.del_tag import DelTagsCommandHandler
@@ -33,35 +41,80 @@ from src.command.handler.command_handlers import CommandHandlers
 from src.command.handler.contact.add_contact import AddContactCommandHandler
 from src.command.handler.contact.all_contact import AllContactsCommandHandler
 from src.command.handler.contact.del_contact import DelContactCommandHandler
+from src.command.handler.contact.export_contacts import ExportContactsCommandHandler
 from src.command.handler.contact.find_contact import FindContactCommandHandler
+from src.command.handler.contact.import_contacts import ImportContactsCommandHandler
+from src.command.handler.contact.stats import StatsCommandHandler
 from src.command.handler.email.add_email import AddEmailCommandHandler
 from src.command.handler.email.change_email import ChangeEmailCommandHandler
 from src.command.handler.email.del_email import DelEmailCommandHandler
 from src.command.handler.exit import ExitCommandHandler
 from src.command.handler.help import HelpCommandHandler
+from src.command.handler.history.redo import RedoCommandHandler
+from src.command.handler.history.undo import UndoCommandHandler
 from src.command.handler.note.find_note_by_tags import FindNoteByTagCommandHandler
 from src.command.handler.note.find_note_by_text import FindNoteByTextCommandHandler
 from src.command.handler.phone.add_phone import AddPhoneCommandHandler
 from src.command.handler.phone.change_phone import ChangePhoneCommandHandler
 from src.command.handler.phone.del_phone import DelPhoneCommandHandler
+from src.command.handler.transaction.begin import BeginCommandHandler
+from src.command.handler.transaction.commit import CommitCommandHandler
+from src.command.handler.transaction.rollback import RollbackCommandHandler
 from src.model.contact_book import ContactBook
+from src.model.history import History
 from src.model.note import Notes
+from src.storage.save_coordinator import SaveCoordinator
 from src.util.messages import print_welcome, INVALID_COMMAND
 from src.parser.parser import parse
 from src.util.colorize import error_color
 
 
 
-session = PromptSession()
 PROMPT_STYLE = Style.from_dict({'prompt': 'bold magenta'})
 
 
+class _HeldOutput(Console):
+    """
+    The console of a quiet batch run. What a command prints is kept, without
+    rendering it, and shown on stderr only if the command fails.
+    """
+
+    def __init__(self):
+        super().__init__(stderr=True, highlight=False, soft_wrap=True)
+        self.__held = []
+
+    def print(self, *objects, **kwargs) -> None:
+        self.__held.append((objects, kwargs))
+
+    def release(self) -> None:
+        """Show what was printed since the last release or discard."""
+        for objects, kwargs in self.__held:
+            super().print(*objects, **kwargs)
+        self.__held.clear()
+
+    def discard(self) -> None:
+        """Drop what was printed since the last release or discard."""
+        self.__held.clear()
+
+
 class PersonalAssistant:
     """Main class for the personal assistant system."""
 
-    def __init__(self):
-        self.__address_book = ContactBook.load_from_storage()
-        self.__notes = Notes.load_from_storage()
+    def __init__(self, config: StorageConfig | None = None):
+        # One storage configuration, shared by the contacts and the notes.
+        config = config or current_config()
+        self.__address_book = ContactBook.load_from_storage(open_storage(CONTACTS_FILE, config))
+        self.__notes = Notes.load_from_storage(open_storage(NOTES_FILE, config))
+        # Every change of either store can be undone, one command at a time.
+        self.__history = History()
+        self.__history.attach("contacts", self.__address_book)
+        self.__history.attach("notes", self.__notes)
+        if data_storage.HISTORY_PERSIST:
+            self.__history.load(config)
+        self.__save_coordinator = SaveCoordinator(
+            self.__address_book, self.__notes, debounce=data_storage.SAVE_DEBOUNCE_SECONDS,
+            history=self.__history, config=config,
+        )
         self.__handlers = CommandHandlers()
         self.__register_command_handlers()
 
@@ -72,22 +125,100 @@ class PersonalAssistant:
 
         :return: None
         """
+        # Created here: batch runs read stdin without a prompt.
+        session = PromptSession()
         print_welcome()
-        while True:
-            try:
-                input_line = session.prompt([("class:prompt", "Enter a command ➤  ")], style=PROMPT_STYLE)
-                command = parse(input_line)
-                if command is None:
+        self.__install_signal_handlers()
+        try:
+            while True:
+                try:
+                    input_line = session.prompt([("class:prompt", "Enter a command ➤  ")], style=PROMPT_STYLE)
+                    command = parse(input_line)
+                    if command is None:
+                        continue
+                    with self.__save_coordinator.lock:
+                        # Another session may have saved since the last command.
+                        self.__save_coordinator.refresh()
+                        self.__handle(command)
+                    self.__save_data()
+                except ValueError as e:
+                    rich.print(f"{error_color('[ERROR]')}: " + str(e))
+                except SystemExit:
+                    raise
+                print()
+        finally:
+            # Changes still waiting for the background writer are saved on any exit.
+            self.__save_coordinator.close()
+
+    def run_batch(self, lines: Iterable[str], save_every: int = 0, quiet: bool = False) -> int:
+        """
+        Executes commands read from ``lines`` (a script file or stdin) without
+        prompting. Blank lines and lines starting with "#" are skipped, and
+        "exit" ends the batch early.
+
+        A failing command is reported on stderr with its line number and the
+        batch goes on. A failure inside a transaction rolls it back, and the
+        commands up to its "commit" or "rollback" are skipped. Deletions are
+        confirmed automatically. The data is loaded once and saved once at the
+        end, or after every ``save_every`` commands.
+
+        :param quiet: Suppress the output of the commands; the output of a
+            failing command is still shown, on stderr.
+        :return: The number of commands that failed.
+        """
+        # Plain, unwrapped output renders several times faster than the prompt's.
+        output = _HeldOutput() if quiet else Console(highlight=False, soft_wrap=True)
+        errors = Console(stderr=True, highlight=False, soft_wrap=True)
+        self.__handlers.use_console(output)
+        confirm_delete.AUTO_CONFIRM = True
+        failures = 0
+        unsaved = 0
+        # Set when a command of a transaction failed, until the transaction ends.
+        aborted = False
+        try:
+            for number, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
                     continue
-                self.__handle(command)
-                self.__save_data(silent=True)
-            except ValueError as e:
-                rich.print(f"{error_color('[ERROR]')}: " + str(e))
-            except SystemExit:
-                raise
-            print()
-
-    def __handle(self, command: Command) -> None:
+                error = None
+                try:
+                    command = parse(line)
+                    if command is None:
+                        continue
+                    name = command.name.casefold()
+                    if name == "exit":
+                        break
+                    if aborted:
+                        aborted = name not in ("commit", "rollback")
+                        continue
+                    with self.__save_coordinator.lock:
+                        if not self.__handle(command):
+                            error = "the command failed"
+                except Exception as e:
+                    error = str(e)
+                if quiet and error is None:
+                    output.discard()
+                elif quiet:
+                    # The messages of a failing command explain what went wrong.
+                    output.release()
+                if error is not None:
+                    failures += 1
+                    errors.print(f"{error_color('[ERROR]')} line {number}: {error}")
+                    if self.__save_coordinator.in_transaction:
+                        self.__save_coordinator.rollback()
+                        aborted = True
+                        errors.print("The transaction was rolled back; skipping to its end.")
+                unsaved += 1
+                if save_every and unsaved >= save_every:
+                    self.__save_coordinator.save()
+                    unsaved = 0
+        finally:
+            self.__handlers.use_console(None)
+            confirm_delete.AUTO_CONFIRM = False
+            self.__save_coordinator.close()
+        return failures
+
+    def __handle(self, command: Command) -> bool:
         """
         Handles the processing of a command using a handler execution system. The method
         retrieves the appropriate handler for the provided command and executes it with
@@ -96,14 +227,26 @@ class PersonalAssistant:
         :param command: The command object containing the action to be performed and its
             associated arguments.
         :type command: Command
+        :return: False if the handler rejected the command arguments.
         """
         handler = self.__get_handler(command)
-        handler.handle(command.args)
+        try:
+            return handler.handle(command.args)
+        finally:
+            # The changes of one command are undone together.
+            self.__history.checkpoint()
+
+    def __save_data(self) -> None:
+        """Schedule a save of the contacts and notes that changed."""
+        self.__save_coordinator.schedule()
 
-    def __save_data(self, silent: bool = True) -> None:
-        """Persist current state of contacts and notes."""
-        self.__address_book.save_to_storage(silent=silent)
-        self.__notes.save_to_storage(silent=silent)
+    @staticmethod
+    def __install_signal_handlers() -> None:
+        """Turn termination signals into a regular exit, so pending changes are flushed."""
+        for name in ("SIGTERM", "SIGHUP"):
+            signum = getattr(signal, name, None)
+            if signum is not None:
+                signal.signal(signum, lambda received, _frame: sys.exit(128 + received))
 
     def __get_handler(self, command: Command) -> CommandHandler:
         """
@@ -141,6 +284,9 @@ class PersonalAssistant:
         self.__handlers.register(DelContactCommandHandler(self.__address_book))
         self.__handlers.register(FindContactCommandHandler(self.__address_book))
         self.__handlers.register(AllContactsCommandHandler(self.__address_book))
+        self.__handlers.register(StatsCommandHandler(self.__address_book))
+        self.__handlers.register(ImportContactsCommandHandler(self.__address_book))
+        self.__handlers.register(ExportContactsCommandHandler(self.__address_book))
 
         # Registering handlers for phone number management commands
         self.__handlers.register(AddPhoneCommandHandler(self.__address_book))
@@ -174,5 +320,14 @@ class PersonalAssistant:
         self.__handlers.register(DelTagsCommandHandler(self.__notes))
         self.__handlers.register(SortNotesByTagCommandHandler(self.__notes))
 
-        self.__handlers.register(ExitCommandHandler(self.__address_book, self.__notes))
+        # Registering handlers for transactions
+        self.__handlers.register(BeginCommandHandler(self.__save_coordinator))
+        self.__handlers.register(CommitCommandHandler(self.__save_coordinator))
+        self.__handlers.register(RollbackCommandHandler(self.__save_coordinator))
+
+        # Registering handlers for undo and redo
+        self.__handlers.register(UndoCommandHandler(self.__save_coordinator))
+        self.__handlers.register(RedoCommandHandler(self.__save_coordinator))
+
+        self.__handlers.register(ExitCommandHandler(self.__save_coordinator))
         self.__handlers.register(HelpCommandHandler(self.__handlers))
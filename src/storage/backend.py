@@ -0,0 +1,125 @@
+"""
+Interfaces shared by the storage backends.
+
+``ContactBook`` and ``Notes`` talk to their persistence layer only through
+``StorageBackend``. The JSON file implementation is ``DataStorage``; other
+implementations (e.g. SQLite) may additionally expose a record source, which
+lets a store open lazily and push lookups down to the backend instead of
+reading every record into memory at startup.
+"""
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, Sequence, TypeVar
+
+# A change record: (operation, record key, operation arguments).
+Change = tuple[str, str, Sequence[Any]]
+
+T = TypeVar("T")
+
+
+class ContactSource:
+    """Read access to persisted contacts, keyed by the casefolded name."""
+
+    # True if the records were verified by a checksum and need no validation.
+    trusted = False
+
+    def keys(self) -> Iterator[str]:
+        """Yields the keys of all persisted contacts."""
+        raise NotImplementedError
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        """Returns the contact in ``Contact.to_dict`` form, or None."""
+        raise NotImplementedError
+
+    def find_keys(self, param: str, value: Any) -> list[str]:
+        """
+        Returns keys of contacts whose ``param`` field equals ``value``.
+
+        :param param: One of phones, emails, addresses, birthday, birthday_day.
+        :param value: The field value; a ``datetime.date`` for birthday and a
+            (month, day) tuple for birthday_day, which ignores the year.
+        """
+        raise NotImplementedError
+
+
+class NoteSource:
+    """Read access to persisted notes."""
+
+    def load_all(self) -> list[Dict[str, Any]]:
+        """Returns all notes in ``NoteEntity.to_dict`` form, in insertion order."""
+        raise NotImplementedError
+
+    def find_by_tag(self, tag: str) -> list[Dict[str, Any]]:
+        """Returns the notes carrying ``tag``, in insertion order."""
+        raise NotImplementedError
+
+    def find_by_topic(self, topic: str) -> Dict[str, Any] | None:
+        """Returns the note with ``topic``, or None if there is none."""
+        raise NotImplementedError
+
+    def position(self, topic: str | None) -> int | None:
+        """
+        Returns the number of notes before the note with ``topic`` (None if
+        there is no such note), or the number of all notes if ``topic`` is None.
+        """
+        raise NotImplementedError
+
+
+class StorageBackend:
+    """Persistence operations used by ``ContactBook`` and ``Notes``."""
+
+    def load_data(self) -> Dict[str, Any]:
+        """Loads the full snapshot as ``{"version": ..., "data": ...}``."""
+        raise NotImplementedError
+
+    def load_records(self, build: Callable[[Iterable[Dict[str, Any]], bool], T]) -> T | None:
+        """
+        Builds a store from the persisted records, in ``to_dict`` form.
+
+        ``build(records, trusted)`` consumes the records as they are read;
+        ``trusted`` tells whether they passed a checksum and may skip
+        validation. ``build`` may be called again with other records if the
+        first source turns out to be damaged. Returns None if there is no data.
+        """
+        data = self.load_data().get("data")
+        if not data:
+            return None
+        return build(data.values() if isinstance(data, dict) else data, False)
+
+    def replay_journal(self) -> Iterator[Change]:
+        """Yields changes persisted after the snapshot read by ``load_data`` or ``load_records``."""
+        return iter(())
+
+    def save_changes(
+        self,
+        changes: Sequence[Change],
+        build_snapshot: Callable[[], Dict[str, Any]],
+        silent: bool = False,
+    ) -> bool:
+        """Persists the given changes; ``build_snapshot`` returns the full state."""
+        raise NotImplementedError
+
+    def record_source(self) -> ContactSource | NoteSource | None:
+        """Returns a source for lazy access, or None if records must be loaded eagerly."""
+        return None
+
+    def wait_for_compaction(self) -> None:
+        """Blocks until background maintenance of the storage has finished."""
+
+    def read_session(self) -> AbstractContextManager:
+        """Holds the storage for a consistent load of the snapshot and journal."""
+        return nullcontext()
+
+    def write_session(self) -> AbstractContextManager:
+        """Holds the storage exclusively for a check-merge-write cycle."""
+        return nullcontext()
+
+    def changed_on_disk(self) -> bool:
+        """Whether another session wrote since this backend last read or wrote."""
+        return False
+
+    def new_changes(self) -> list[Change] | None:
+        """
+        Returns the changes other sessions persisted since this backend last
+        read or wrote, or None if the store has to be loaded again instead.
+        """
+        return None
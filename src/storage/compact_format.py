@@ -0,0 +1,320 @@
+"""
+Compact snapshot format (file version 2).
+
+The first line is a JSON header naming the record fields once; every
+following line is one record as a JSON array of field values, then a tab and
+the CRC-32 of the array in hex::
+
+    {"version":2,"fields":["topic","content","tags"],"keyed":false,"count":2,"seq":7,"checksum":...,"line_checksums":true}
+    ["Shopping","Buy milk",["groceries"]]<tab>2997fe8b
+    ["Workout","Run",[]]<tab>73e4bbd3
+
+Keyed stores (contacts) key their records by the ``key_field`` named in the
+header (the name); files without it, and snapshots whose keys differ from
+that field, carry the key as the first array element instead.
+
+Keyed snapshots end with an index block written after the records, so that a
+lazy reader can open them without scanning every record: one JSON object
+line with the casefolded keys (as the stores look them up), the offsets of
+the record lines and the birthdays, and
+one line per list field mapping each casefolded value to the rows holding
+it. Index lines carry a checksum suffix like records, and the header's
+``index`` maps each of them to its ``[offset, size]`` in bytes from the
+start of the first record line; the ``rows`` offset is also the size of the
+record block.
+
+Records are decoded line by line. The header's record count detects a file
+truncated at a line boundary, and its checksum (CRC-32 of the UTF-8 bytes
+of all record lines) lets a reader trust the records without validating them.
+The per-line checksums locate damaged records, so the intact ones can be
+kept. Files written before line checksums were added have no suffixes and
+no ``line_checksums`` flag.
+"""
+import json
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, TextIO
+
+COMPACT_VERSION = 2
+
+_SEPARATORS = (",", ":")
+# Compact headers start without whitespace, like v1 files written without
+# indentation; only the first line is parsed to tell them apart.
+_MAGIC = '{"version":'
+# Headers are short; a longer first line is the whole of a minified v1 file.
+HEADER_LIMIT = 64 * 1024
+# The field holding the key of each record of a keyed store.
+KEY_FIELD = "name"
+
+
+class ChecksumError(ValueError):
+    """Raised when the record lines do not match the header checksum."""
+
+
+def read_header(file: TextIO) -> Dict[str, Any] | None:
+    """
+    Return the compact header at the start of ``file``, or None (with the
+    file rewound) if the file is not in the compact format.
+
+    Only the first line is read, at most ``HEADER_LIMIT`` characters of it.
+    It is a compact header if it is a JSON object with the compact version
+    and a ``fields`` list; anything else, including a damaged header, is
+    left to the v1 reader.
+    """
+    line = file.read(len(_MAGIC))
+    if line == _MAGIC:
+        line += file.readline(HEADER_LIMIT)
+        if line.endswith("\n"):
+            try:
+                header = json.loads(line)
+            except json.JSONDecodeError:
+                header = None
+            if (isinstance(header, dict) and header.get("version") == COMPACT_VERSION
+                    and isinstance(header.get("fields"), list)):
+                return header
+    file.seek(0)
+    return None
+
+
+def write_compact(file: TextIO, snapshot: Dict[str, Any]) -> None:
+    """Write a v1-shaped ``{"version", "data", "seq"}`` snapshot in the compact format."""
+    data = snapshot.get("data")
+    if data is None:
+        data = []
+    keyed = isinstance(data, dict)
+    records = list(data.values()) if keyed else data
+
+    fields: dict[str, None] = {}
+    for record in records:
+        fields.update(dict.fromkeys(record))
+    derived = keyed and all(key == record.get(KEY_FIELD) for key, record in data.items())
+
+    lines = []
+    starts = []
+    size = 0
+    checksum = 0
+    rows = data.items() if keyed else ((None, record) for record in records)
+    for key, record in rows:
+        row = [record.get(field) for field in fields]
+        if keyed and not derived:
+            row.insert(0, key)
+        line = _checked_line(row)
+        encoded = line.encode("utf-8")
+        checksum = zlib.crc32(encoded, checksum)
+        starts.append(size)
+        size += len(encoded)
+        lines.append(line)
+
+    header = {
+        "version": COMPACT_VERSION,
+        "fields": list(fields),
+        "keyed": keyed,
+        "count": len(records),
+        "seq": snapshot.get("seq", 0),
+        "checksum": checksum,
+        "line_checksums": True,
+    }
+    if derived:
+        header["key_field"] = KEY_FIELD
+    if keyed:
+        index = {}
+        for name, section in _index_sections(data, list(fields), starts):
+            line = _checked_line(section)
+            index[name] = [size, len(line.encode("utf-8"))]
+            size += index[name][1]
+            lines.append(line)
+        header["index"] = index
+    file.write(json.dumps(header, ensure_ascii=False, separators=_SEPARATORS) + "\n")
+    file.writelines(lines)
+
+
+def _index_sections(
+    data: Dict[str, Dict[str, Any]], fields: list[str], starts: list[int]
+) -> Iterator[tuple[str, Dict[str, Any]]]:
+    """Yield the index lines of a keyed snapshot, see the module docstring."""
+    rows: Dict[str, Any] = {"keys": [key.strip().casefold() for key in data], "starts": starts}
+    if "birthday" in fields:
+        rows["birthdays"] = [record.get("birthday") for record in data.values()]
+    yield "rows", rows
+    for field in fields:
+        values: Dict[str, list[int]] | None = None
+        for row, record in enumerate(data.values()):
+            value = record.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, list):
+                break
+            if values is None:
+                values = {}
+            for item in dict.fromkeys(str(item).casefold() for item in value):
+                values.setdefault(item, []).append(row)
+        else:
+            if values is not None:
+                yield field, values
+
+
+def _checked_line(value: Any) -> str:
+    text = json.dumps(value, ensure_ascii=False, separators=_SEPARATORS)
+    return f"{text}\t{zlib.crc32(text.encode('utf-8')):08x}\n"
+
+
+def iter_compact_records(
+    file: TextIO,
+    header: Dict[str, Any],
+    verify: bool = False,
+    damaged: list[int] | None = None,
+) -> Iterator[tuple[str | None, Dict[str, Any]]]:
+    """
+    Yield ``(key, record)`` pairs from the lines after the header; the key is
+    None for unkeyed stores. Records are rebuilt in their v1 dict form.
+
+    Lines carrying a checksum are checked one by one as they are read, so a
+    record yielded from such a file is intact. Reading stops at the index
+    block, whose lines start with "{" where records start with "[".
+
+    :param verify: Compare the lines with the header checksum once all
+        records have been read. Skipped for files with line checksums.
+    :param damaged: Salvage mode: damaged lines are skipped and their line
+        numbers (the header is line 1) appended to this list.
+    :raises ChecksumError: If ``verify`` is set and the checksum differs.
+    :raises ValueError: If a line is damaged (outside salvage mode) or
+        records are missing.
+    """
+    fields = header["fields"]
+    keyed = header.get("keyed", False)
+    key_index = fields.index(header["key_field"]) if "key_field" in header else None
+    indexed = "index" in header
+    line_checksums = header.get("line_checksums", False)
+    verify = verify and not line_checksums
+    count = 0
+    checksum = 0
+    for number, line in enumerate(file, start=2):
+        if indexed and line.startswith("{"):
+            break
+        if verify:
+            checksum = zlib.crc32(line.encode("utf-8"), checksum)
+        if not line.strip():
+            continue
+        count += 1
+        try:
+            row = json.loads(_checked_text(line) if line_checksums else line)
+            if not isinstance(row, list):
+                raise ValueError("Record line is not an array.")
+        except ValueError:
+            if damaged is None:
+                raise
+            damaged.append(number)
+            continue
+        if not keyed:
+            key = None
+        elif key_index is None:
+            key = row.pop(0)
+        else:
+            key = row[key_index]
+        yield key, dict(zip(fields, row))
+    if count != header.get("count", count):
+        raise ValueError(f"Expected {header['count']} records, found {count}.")
+    if verify and checksum != header.get("checksum"):
+        raise ChecksumError("Record checksum does not match the header.")
+
+
+def verify_compact(path: str) -> list[str]:
+    """
+    Check a compact snapshot against its checksums without decoding records.
+
+    The checksum of the record block is compared first; only if it differs
+    are the lines checked one by one to locate the damage. The lines of the
+    index block are checked last.
+
+    :return: Descriptions of all problems found; empty if the file is intact.
+    :raises OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            return ["Header line is damaged."]
+        if not isinstance(header, dict) or header.get("version") != COMPACT_VERSION:
+            return ["Not a compact snapshot."]
+        if not has_checksum(header):
+            return ["Snapshot has no checksum."]
+
+        start = f.tell()
+        index = header.get("index") or {}
+        # The index block follows the records; the rows line comes first.
+        remaining = index["rows"][0] if "rows" in index else None
+        checksum = 0
+        count = 0
+        for chunk in iter(lambda: f.read(_chunk_size(remaining)), b""):
+            checksum = zlib.crc32(chunk, checksum)
+            count += chunk.count(b"\n")
+            if remaining is not None:
+                remaining -= len(chunk)
+        if checksum == header["checksum"] and count == header.get("count"):
+            return _index_problems(f, start, index)
+
+        problems = []
+        if header.get("line_checksums"):
+            f.seek(start)
+            count = 0
+            for number, line in enumerate(f, start=2):
+                if index and line.startswith(b"{"):
+                    break
+                if not line.strip():
+                    continue
+                count += 1
+                text, _, crc = line.rstrip(b"\n").rpartition(b"\t")
+                if crc != b"%08x" % zlib.crc32(text):
+                    problems.append(f"Line {number} is damaged.")
+        else:
+            problems.append("Record checksum does not match the header.")
+        if count != header.get("count"):
+            problems.append(f"Expected {header.get('count')} records, found {count}.")
+        return problems + _index_problems(f, start, index)
+
+
+def _chunk_size(remaining: int | None) -> int:
+    return 1024 * 1024 if remaining is None else min(1024 * 1024, remaining)
+
+
+def _index_problems(file: BinaryIO, start: int, index: Dict[str, list[int]]) -> list[str]:
+    """Check every line of the index block against its checksum."""
+    problems = []
+    for name, (offset, size) in index.items():
+        file.seek(start + offset)
+        if read_index_line(file.read(size)) is None:
+            problems.append(f"Index of {name} is damaged.")
+    return problems
+
+
+def read_index_line(line: bytes) -> Any:
+    """Decode an index line, or return None if it is damaged."""
+    text, tab, crc = line.rstrip(b"\n").rpartition(b"\t")
+    if not tab or crc != b"%08x" % zlib.crc32(text):
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def strip_line_checksum(line: bytes) -> bytes:
+    """Return a record line without its checksum suffix, unchecked."""
+    text, tab, _ = line.rpartition(b"\t")
+    return text if tab else line
+
+
+def _checked_text(line: str) -> str:
+    """
+    Return the JSON part of a record line with a checksum.
+
+    :raises ValueError: If the suffix is missing or does not match.
+    """
+    text, tab, crc = line.rstrip("\n").rpartition("\t")
+    if not tab or crc != f"{zlib.crc32(text.encode('utf-8')):08x}":
+        raise ValueError("Record line checksum does not match.")
+    return text
+
+
+def has_checksum(header: Dict[str, Any] | None) -> bool:
+    """Whether a compact header carries a checksum of its records."""
+    return header is not None and header.get("checksum") is not None
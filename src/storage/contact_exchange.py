@@ -0,0 +1,254 @@
+"""
+Import and export of contacts as CSV and vCard files.
+
+Both directions stream: records are read and written one at a time, and an
+import validates them in chunks (see ``validation_pool``) before merging them
+into the book, so memory does not grow with the size of the file.
+
+CSV files have a header row naming the columns ``name``, ``phones``,
+``emails``, ``addresses`` and ``birthday`` (any order, only ``name`` and
+``phones`` required). A cell holds several values on separate lines;
+phones and emails may also be separated by ``;``.
+vCards (3.0 or 4.0) map ``FN``, ``TEL``, ``EMAIL``, ``ADR`` and ``BDAY``;
+other properties are ignored on import.
+"""
+import csv
+import os
+from datetime import date
+from typing import Callable, Iterable, Iterator, TextIO
+
+from src.model.contact import Contact
+from src.model.contact_book import ContactBook
+from src.model.validation_pool import validate_contacts
+
+FORMATS = ("csv", "vcard")
+EXTENSIONS = {".csv": "csv", ".vcf": "vcard", ".vcard": "vcard"}
+CSV_COLUMNS = ("name", "phones", "emails", "addresses", "birthday")
+LIST_COLUMNS = ("phones", "emails", "addresses")
+VALUE_SEPARATOR = "\n"
+
+# A record in Contact.to_dict form and the line of the file it starts on.
+Row = tuple[int, dict[str, object]]
+ErrorCallback = Callable[[int, str], None]
+
+
+class ImportResult:
+    """Counts of an import: contacts created, contacts updated and rejected rows."""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+
+
+def detect_format(path: str, fmt: str | None = None) -> str:
+    """
+    Returns the format given explicitly or implied by the file extension.
+
+    :raises ValueError: If the format is unknown or cannot be inferred.
+    """
+    if fmt is None:
+        fmt = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if fmt is None:
+            raise ValueError(f"Cannot tell the format of '{path}'; use one of: {', '.join(FORMATS)}.")
+    fmt = fmt.lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'; use one of: {', '.join(FORMATS)}.")
+    return fmt
+
+
+def import_contacts(
+    book: ContactBook,
+    file: TextIO,
+    fmt: str,
+    on_error: ErrorCallback | None = None,
+) -> ImportResult:
+    """
+    Merges the contacts read from ``file`` into ``book``.
+
+    Each row is validated by the ``Contact`` field validators. A contact whose
+    name is already in the book gains the phones, emails and addresses it is
+    missing, and the birthday of the row. Rejected rows are passed to
+    ``on_error(line, message)`` and do not stop the import.
+
+    The import is a single transaction: if reading the file fails, e.g. on
+    a byte that is not UTF-8, the book is left as it was. Inside an open
+    transaction the import is part of it, and its rollback undoes it.
+    """
+    result = ImportResult()
+    rows = _read_csv(file) if fmt == "csv" else _read_vcards(file)
+    own_transaction = not book.in_transaction
+    if own_transaction:
+        book.begin()
+    try:
+        for line, contact, error in validate_contacts(rows):
+            if contact is None:
+                result.failed += 1
+                if on_error is not None:
+                    on_error(line, error)
+            elif book.merge_contact(contact):
+                result.created += 1
+            else:
+                result.updated += 1
+    except BaseException:
+        if own_transaction:
+            book.rollback()
+        raise
+    if own_transaction:
+        book.commit()
+    return result
+
+
+def export_contacts(contacts: Iterable[Contact], file: TextIO, fmt: str) -> int:
+    """Writes ``contacts`` to ``file`` and returns how many were written."""
+    write = _write_csv if fmt == "csv" else _write_vcards
+    return write(contacts, file)
+
+
+# ---------------------------------------------------------------------- #
+# CSV
+# ---------------------------------------------------------------------- #
+def _read_csv(file: TextIO) -> Iterator[Row]:
+    reader = csv.DictReader(file)
+    columns = [column.strip().lower() for column in reader.fieldnames or ()]
+    missing = [column for column in ("name", "phones") if column not in columns]
+    if missing:
+        raise ValueError(f"The CSV header lacks the column(s): {', '.join(missing)}.")
+    reader.fieldnames = columns
+    for row in reader:
+        record = {
+            column: _split(row.get(column), column) if column in LIST_COLUMNS else (row.get(column) or "").strip()
+            for column in CSV_COLUMNS
+        }
+        # The reader counts physical lines, so quoted line breaks keep the numbers right.
+        yield reader.line_num, record
+
+
+def _split(cell: str | None, column: str) -> list[str]:
+    cell = cell or ""
+    if column != "addresses":
+        # No valid phone or email contains ";", so it separates values too.
+        cell = cell.replace(";", VALUE_SEPARATOR)
+    return [value.strip() for value in cell.split(VALUE_SEPARATOR) if value.strip()]
+
+
+def _write_csv(contacts: Iterable[Contact], file: TextIO) -> int:
+    writer = csv.writer(file)
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    for contact in contacts:
+        record = contact.to_dict()
+        writer.writerow([
+            VALUE_SEPARATOR.join(record[column]) if column in LIST_COLUMNS else record[column] or ""
+            for column in CSV_COLUMNS
+        ])
+        count += 1
+    return count
+
+
+# ---------------------------------------------------------------------- #
+# vCard
+# ---------------------------------------------------------------------- #
+def _read_vcards(file: TextIO) -> Iterator[Row]:
+    record: dict[str, object] | None = None
+    start = 0
+    for line, content in _unfold(file):
+        name, _, value = content.partition(":")
+        # Drop parameters (TEL;TYPE=cell) and group prefixes (item1.EMAIL).
+        prop = name.split(";", 1)[0].rsplit(".", 1)[-1].upper()
+        if prop == "BEGIN" and value.strip().upper() == "VCARD":
+            record = {"name": "", "phones": [], "emails": [], "addresses": [], "birthday": None}
+            start = line
+        elif record is None:
+            continue
+        elif prop == "END":
+            yield start, record
+            record = None
+        elif prop == "FN":
+            record["name"] = _unescape(value).strip()
+        elif prop == "TEL":
+            record["phones"].append(value.strip().removeprefix("tel:"))
+        elif prop == "EMAIL":
+            record["emails"].append(_unescape(value).strip())
+        elif prop == "ADR":
+            parts = (_unescape(part).strip() for part in _split_components(value))
+            record["addresses"].append(", ".join(part for part in parts if part))
+        elif prop == "BDAY":
+            record["birthday"] = _parse_vcard_date(value.strip())
+
+
+def _unfold(file: TextIO) -> Iterator[tuple[int, str]]:
+    """Yields logical vCard lines with their first line numbers, joining folded lines."""
+    pending, start = None, 0
+    for number, line in enumerate(file, start=1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending:
+            yield start, pending
+        pending, start = line, number
+    if pending:
+        yield start, pending
+
+
+def _split_components(value: str) -> list[str]:
+    """Splits a structured value at the ``;`` not escaped by a backslash."""
+    parts, current, escaped = [], [], False
+    for char in value:
+        if escaped:
+            current.append("\\" + char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == ";":
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def _unescape(value: str) -> str:
+    result, escaped = [], False
+    for char in value:
+        if escaped:
+            result.append("\n" if char in "nN" else char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _escape(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace(",", "\\,")
+            .replace(";", "\\;").replace("\n", "\\n"))
+
+
+def _parse_vcard_date(value: str) -> str:
+    """Converts a vCard date (YYYY-MM-DD or YYYYMMDD) to the DD.MM.YYYY form of ``Birthday``."""
+    digits = value.replace("-", "")
+    if len(digits) == 8 and digits.isdigit():
+        return f"{digits[6:]}.{digits[4:6]}.{digits[:4]}"
+    # Left for the Birthday validator to reject.
+    return value
+
+
+def _write_vcards(contacts: Iterable[Contact], file: TextIO) -> int:
+    count = 0
+    for contact in contacts:
+        lines = ["BEGIN:VCARD", "VERSION:4.0", f"FN:{_escape(contact.name.value)}"]
+        lines += [f"TEL;VALUE=uri:tel:{phone.value}" for phone in contact.phones]
+        lines += [f"EMAIL:{_escape(email.value)}" for email in contact.emails]
+        # Free-form addresses go to the street component.
+        lines += [f"ADR:;;{_escape(address.value)};;;;" for address in contact.addresses]
+        if contact.birthday is not None:
+            birthday: date = contact.birthday.value
+            lines.append(f"BDAY:{birthday:%Y%m%d}")
+        lines.append("END:VCARD")
+        file.write("\r\n".join(lines) + "\r\n")
+        count += 1
+    return count
@@ -0,0 +1,82 @@
+"""
+Advisory inter-process locks on the storage files.
+
+Every data file has a companion ``<file>.lock``. Readers hold it shared, so
+any number of sessions can load at once; a writer holds it exclusive for a
+whole check-merge-write cycle. Locks are advisory (``fcntl.flock``) and only
+coordinate processes that use them. Where ``fcntl`` is missing (Windows),
+only the threads of one process are coordinated.
+"""
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class FileLock:
+    """
+    A reentrant shared/exclusive lock on ``path``.
+
+    Threads of the same process take turns on an internal lock first, so the
+    file lock is held at most once per process. Nested acquisitions by the
+    holding thread are free; a shared lock nested in an exclusive one keeps
+    the exclusive lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._fd: int | None = None
+        self._exclusive = False
+        self._depth = 0
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the lock for reading."""
+        with self._hold(exclusive=False):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the lock for writing."""
+        with self._hold(exclusive=True):
+            yield
+
+    @contextmanager
+    def _hold(self, exclusive: bool) -> Iterator[None]:
+        with self._thread_lock:
+            if self._depth == 0:
+                self._acquire(exclusive)
+            elif exclusive and not self._exclusive:
+                raise RuntimeError("Cannot upgrade a shared lock to an exclusive one.")
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._release()
+
+    def _acquire(self, exclusive: bool) -> None:
+        self._exclusive = exclusive
+        if fcntl is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        except OSError:
+            os.close(self._fd)
+            self._fd = None
+            raise
+
+    def _release(self) -> None:
+        if self._fd is not None:
+            # Closing the descriptor releases the flock.
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,206 @@
+"""
+Incremental reader for v1 JSON snapshots.
+
+A snapshot is a JSON object whose ``data`` member holds the records: an
+object keyed by contact name or an array of notes. ``iter_snapshot_records``
+reads the file in chunks and decodes one record at a time, so the whole
+document is never held in memory as text or as Python objects.
+
+v1 files carry no checksums, but ``DataStorage`` writes them indented: every
+record starts on a line of its own, at the same indentation, and a line
+break never occurs inside a JSON string. A damaged record can therefore be
+skipped by moving on to the next line that starts a record.
+"""
+import json
+from typing import Any, Dict, Iterator, TextIO, Tuple
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+# Decoding errors this close to the end of the buffer may come from a value
+# that continues in the next chunk, such as a split "\\uXXXX" escape.
+_SPLIT_MARGIN = 16
+_LINE_KEEP = 1024
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """A window over a text file with on-demand refills."""
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.line = 1
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Read the next chunk, dropping the consumed part of the buffer up to
+        the current line, so its indentation can still be measured (unless
+        the consumed part of the line is longer than _LINE_KEEP).
+        """
+        if self.eof:
+            return False
+        chunk = self.file.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        keep = self.buffer.rfind("\n", max(0, self.pos - _LINE_KEEP), self.pos)
+        if keep < 0:
+            keep = self.pos
+        self.line += self.buffer.count("\n", 0, keep)
+        self.buffer = self.buffer[keep:] + chunk
+        self.pos -= keep
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise self.error("Unexpected end of file")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                split = e.pos >= len(self.buffer) - _SPLIT_MARGIN or e.msg.startswith("Unterminated")
+                if split and self.fill():
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def indent(self, leading: bool = False) -> str | None:
+        """
+        The indentation of the current line, or None on the first line. With
+        ``leading``, also None unless the current position starts the line.
+        """
+        start = self.buffer.rfind("\n", 0, self.pos) + 1
+        if start == 0:
+            return None
+        end = start
+        while end < self.pos and self.buffer[end] in " \t":
+            end += 1
+        if leading and end != self.pos:
+            return None
+        return self.buffer[start:end]
+
+    def line_number(self) -> int:
+        return self.line + self.buffer.count("\n", 0, self.pos)
+
+    def skip_to(self, *marks: str) -> str | None:
+        """
+        Move to the first of ``marks`` found after the current position and
+        return it, or return None if none is left in the file.
+        """
+        while True:
+            found = [(index, mark) for mark in marks if (index := self.buffer.find(mark, self.pos)) >= 0]
+            if found:
+                index, mark = min(found)
+                self.pos = index
+                return mark
+            self.pos = max(self.pos, len(self.buffer) - max(map(len, marks)))
+            if not self.fill():
+                return None
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def iter_snapshot_records(
+    file: TextIO, header: Dict[str, Any], damaged: list[int] | None = None
+) -> Iterator[Any]:
+    """
+    Yield the records of the snapshot's ``data`` member one at a time.
+
+    The other top-level members (``version``, ``seq``) are stored in
+    ``header`` as soon as they are read; ``version`` precedes ``data`` in
+    files written by ``DataStorage``.
+
+    If ``damaged`` is given, records that cannot be decoded are skipped and
+    their line numbers collected in it, as long as the file is indented.
+
+    :raises json.JSONDecodeError: If the file is not a well-formed snapshot.
+    """
+    for _, record in iter_snapshot_items(file, header, damaged):
+        yield record
+
+
+def iter_snapshot_items(
+    file: TextIO, header: Dict[str, Any], damaged: list[int] | None = None
+) -> Iterator[Tuple[str | None, Any]]:
+    """
+    Like ``iter_snapshot_records``, but yield ``(key, record)`` pairs; the key
+    is None for the records of an array.
+    """
+    reader = _Reader(file)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "data" and reader.peek() in "{[":
+            yield from _iter_container(reader, damaged)
+        else:
+            header[key] = reader.value()
+        if reader.peek() == "}":
+            break
+        reader.expect(",")
+
+
+def _iter_container(reader: _Reader, damaged: list[int] | None) -> Iterator[Tuple[str | None, Any]]:
+    opening = reader.peek()
+    closing = "}" if opening == "{" else "]"
+    is_object = closing == "}"
+    outer = reader.indent()
+    reader.pos += 1
+    if reader.peek() == closing:
+        reader.pos += 1
+        return
+    inner = reader.indent(leading=True)
+    while True:
+        reader.peek()
+        line = reader.line_number()
+        key = None
+        try:
+            if is_object:
+                key = reader.value()
+                reader.expect(":")
+            record = reader.value()
+            last = reader.peek() == closing
+            if not last and reader.peek() != ",":
+                raise reader.error("Expecting ','")
+        except json.JSONDecodeError:
+            if damaged is None or inner is None:
+                raise
+            damaged.append(line)
+            next_record = "\n" + inner + ('"' if is_object else "{")
+            end = "\n" + outer + closing if outer is not None else None
+            mark = reader.skip_to(*filter(None, (next_record, end)))
+            if mark is None:
+                raise
+            if mark == end:
+                reader.expect(closing)
+                return
+            continue
+        yield key, record
+        reader.pos += 1
+        if last:
+            return
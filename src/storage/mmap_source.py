@@ -0,0 +1,296 @@
+"""
+Lazy, memory-mapped access to compact contact snapshots.
+
+Opening a source reads only the header; no record is decoded and no
+``Contact`` is built until it is asked for. Keys, record offsets and
+birthdays come from the index block written after the records, read on
+first use; phone, email and address searches look the value up in the index
+line of that field and decode only the records listed there.
+
+Files written without an index block are scanned once for line boundaries,
+keys and birthdays instead, and their searches look for the JSON-encoded
+value in the mapped bytes.
+
+Records of files with line checksums are checked one at a time, when they
+are read; the checksum of the whole file is only checked on request.
+"""
+import json
+import mmap
+import re
+import zlib
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Iterator
+
+from src.storage.backend import ContactSource
+from src.storage.compact_format import (
+    COMPACT_VERSION,
+    HEADER_LIMIT,
+    has_checksum,
+    read_index_line,
+    strip_line_checksum,
+)
+
+# The quoted DD.MM.YYYY birthday closing a record line, before its checksum.
+_BIRTHDAY_TAIL = re.compile(rb'"(\d\d)\.(\d\d)\.(\d{4})"\]$')
+# Keys of the records by (month, day) of their birthday, with the birthday.
+Buckets = Dict[tuple[int, int], list[tuple[str, str]]]
+
+
+class MmapContactSource(ContactSource):
+    """A ``ContactSource`` over a memory-mapped compact contacts snapshot."""
+
+    def __init__(self, mapped: mmap.mmap, header: Dict[str, Any], records_start: int):
+        self._mmap = mapped
+        self._fields = header["fields"]
+        self._key_field = header.get("key_field")
+        self._records_start = records_start
+        self._count = header.get("count")
+        self._index: Dict[str, list[int]] = header.get("index") or {}
+        self.seq = header.get("seq", 0)
+        # (key, start, end) of every record line in file order, the offsets
+        # by key and the birthday buckets; read on first use.
+        self._lines: list[tuple[str, int, int]] | None = None
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._birthdays: Buckets = {}
+        # Rows by casefolded value, per list field; None if the index line is damaged.
+        self._values: dict[str, dict[str, list[int]] | None] = {}
+        self._line_checksums = bool(header.get("line_checksums"))
+        # Keys of records that failed their line checksum when read.
+        self._damaged: set[str] = set()
+        # Records checked against their line checksum skip validation.
+        self.trusted = self._line_checksums
+
+    @property
+    def records_size(self) -> int:
+        """Size in bytes of the record block, without the index block."""
+        if "rows" in self._index:
+            return self._index["rows"][0]
+        return len(self._mmap) - self._records_start
+
+    def keys(self) -> Iterator[str]:
+        return (key for key, _, _ in self._rows() if key not in self._damaged)
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        self._rows()
+        span = self._offsets.get(key)
+        if span is None or key in self._damaged:
+            return None
+        line = self._mmap[span[0]:span[1]]
+        if self._line_checksums:
+            text, tab, crc = line.rpartition(b"\t")
+            if not tab or crc != b"%08x" % zlib.crc32(text):
+                print(f"[WARNING]: Skipping damaged contact record '{key}'.")
+                self._damaged.add(key)
+                return None
+        row = json.loads(strip_line_checksum(line))
+        if self._key_field is None:
+            row.pop(0)
+        return dict(zip(self._fields, row))
+
+    def find_keys(self, param: str, value: Any) -> list[str]:
+        self._rows()
+        if param == "birthday":
+            wanted = value.strftime("%d.%m.%Y")
+            return [key for key, birthday in self._birthdays.get((value.month, value.day), ())
+                    if birthday == wanted]
+        if param == "birthday_day":
+            return [key for key, _ in self._birthdays.get(tuple(value), ())]
+
+        values = self._field_values(param)
+        if values is not None:
+            keys = [self._lines[row][0] for row in values.get(str(value).casefold(), ())]
+        else:
+            keys = self._search(param, value)
+        return [key for key in keys if self._matches(self.get(key), param, value)]
+
+    def close(self) -> None:
+        """Unmap the file; the source is empty afterwards."""
+        self._lines = []
+        self._offsets = {}
+        self._birthdays = {}
+        self._values = {}
+        self._index = {}
+        self._mmap.close()
+
+    def _rows(self) -> list[tuple[str, int, int]]:
+        """Return the record lines, reading the index block (or scanning) on first use."""
+        if self._lines is None:
+            rows = self._read_index("rows")
+            if rows is not None and len(rows["keys"]) == self._count:
+                self._lines, birthdays = self._indexed_lines(rows)
+            else:
+                self._lines, birthdays = _scan_lines(
+                    self._mmap, self._records_start, self._fields, self._key_field
+                )
+            self._offsets = {key: (start, end) for key, start, end in self._lines}
+            self._birthdays = birthdays
+        return self._lines
+
+    def _indexed_lines(self, rows: Dict[str, Any]) -> tuple[list[tuple[str, int, int]], Buckets]:
+        base = self._records_start
+        starts = [base + start for start in rows["starts"]]
+        # A line ends at its newline, one byte before the next line starts.
+        ends = [start - 1 for start in starts[1:]] + [base + self.records_size - 1]
+        lines = list(zip(rows["keys"], starts, ends))
+        birthdays: Buckets = defaultdict(list)
+        for key, birthday in zip(rows["keys"], rows.get("birthdays") or ()):
+            if birthday:
+                day, month, _ = birthday.split(".")
+                birthdays[(int(month), int(day))].append((key, birthday))
+        return lines, dict(birthdays)
+
+    def _field_values(self, field: str) -> dict[str, list[int]] | None:
+        if field not in self._values:
+            self._values[field] = self._read_index(field)
+        return self._values[field]
+
+    def _read_index(self, name: str) -> Any:
+        """Decode an index line of the file, or return None if it has none or it is damaged."""
+        if name not in self._index:
+            return None
+        offset, size = self._index[name]
+        start = self._records_start + offset
+        return read_index_line(self._mmap[start:start + size])
+
+    def _search(self, param: str, value: Any) -> list[str]:
+        """Find the keys of records whose bytes contain the JSON-encoded value."""
+        flags = re.IGNORECASE if param == "emails" else 0
+        # Encoded like the writer does.
+        pattern = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        starts = [start for _, start, _ in self._lines]
+        end = self._lines[-1][2] if self._lines else self._records_start
+        keys = {}
+        for match in re.compile(re.escape(pattern), flags).finditer(self._mmap, self._records_start, end):
+            index = bisect_right(starts, match.start()) - 1
+            if index >= 0:
+                keys[self._lines[index][0]] = None
+        return list(keys)
+
+    @staticmethod
+    def _matches(record: Dict[str, Any] | None, param: str, value: Any) -> bool:
+        if record is None:
+            return False
+        values = record.get(param) or []
+        if param == "emails":
+            return value.casefold() in (item.casefold() for item in values)
+        return value in values
+
+
+def open_mmap_source(path: str, verify: bool = False) -> MmapContactSource | None:
+    """
+    Map a compact contacts snapshot; only its header is read.
+
+    Records of a file with line checksums are trusted, so they skip
+    validation: each one is checked against its line checksum when it is
+    read. With ``verify``, the whole record block is checked against the
+    header checksum up front instead, which reads every byte; the source is
+    trusted if it matches, and a mismatch in a file with line checksums
+    returns None, so that the full load can salvage the intact records.
+
+    Returns None if the file is missing, is not a keyed compact snapshot, or
+    looks damaged; callers then fall back to a full load.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        # A minified v1 file is one long line; it is not parsed here.
+        header_end = mapped.find(b"\n", 0, HEADER_LIMIT)
+        if header_end == -1:
+            raise ValueError("Not a compact snapshot.")
+        header = json.loads(mapped[:header_end])
+        if (not isinstance(header, dict) or header.get("version") != COMPACT_VERSION
+                or not header.get("keyed")):
+            raise ValueError("Not a compact contacts snapshot.")
+        records_start = header_end + 1
+        source = MmapContactSource(mapped, header, records_start)
+        index = header.get("index") or {}
+        if index:
+            # A truncated file lost the end of its index block.
+            if records_start + max(offset + size for offset, size in index.values()) != len(mapped):
+                raise ValueError("Snapshot is truncated.")
+        elif len(source._rows()) != header.get("count"):
+            raise ValueError("Snapshot is truncated.")
+    except (ValueError, KeyError, TypeError):
+        mapped.close()
+        return None
+
+    if verify and has_checksum(header):
+        view = memoryview(mapped)
+        try:
+            records = view[records_start:records_start + source.records_size]
+            source.trusted = zlib.crc32(records) == header["checksum"]
+            records.release()
+        finally:
+            view.release()
+        if not source.trusted and header.get("line_checksums"):
+            # Damaged records are located and skipped by a full load.
+            source.close()
+            return None
+    return source
+
+
+def _scan_lines(
+    mapped: mmap.mmap, pos: int, fields: list[str], key_field: str | None
+) -> tuple[list[tuple[str, int, int]], Buckets]:
+    """
+    Return (casefolded key, start, end) of every record line from ``pos`` up
+    to the index block, if any, and the keys bucketed by the day of their
+    birthday.
+    """
+    lines = []
+    birthdays: Buckets = defaultdict(list)
+    # Written last by Contact.to_dict, so it is read from the line's tail.
+    birthday_last = fields[-1:] == ["birthday"]
+    size = len(mapped)
+    while pos < size and mapped[pos:pos + 1] != b"{":
+        end = mapped.find(b"\n", pos)
+        if end == -1:
+            end = size
+        if end > pos:
+            if key_field is None:
+                key = _read_key(mapped, pos, end)
+            else:
+                key = json.loads(strip_line_checksum(mapped[pos:end]))[fields.index(key_field)]
+            key = key.strip().casefold()
+            lines.append((key, pos, end))
+            birthday = _read_birthday(mapped, pos, end, fields, birthday_last, key_field is None)
+            if birthday is not None:
+                day, month, _ = birthday.split(".")
+                birthdays[(int(month), int(day))].append((key, birthday))
+        pos = end + 1
+    return lines, dict(birthdays)
+
+
+def _read_birthday(
+    mapped: mmap.mmap, start: int, end: int, fields: list[str], last: bool, key_column: bool
+) -> str | None:
+    """Read the birthday of a record line, from its last bytes if it is the last field."""
+    tab = mapped.rfind(b"\t", start, end)
+    text_end = tab if tab != -1 else end
+    if last:
+        tail = mapped[max(start, text_end - 16):text_end]
+        if tail.endswith(b"null]"):
+            return None
+        match = _BIRTHDAY_TAIL.search(tail)
+        if match:
+            return tail[match.start() + 1:match.end() - 2].decode("ascii")
+    if "birthday" not in fields:
+        return None
+    row = json.loads(mapped[start:text_end])
+    birthday = row[fields.index("birthday") + key_column]
+    return birthday if isinstance(birthday, str) else None
+
+
+def _read_key(mapped: mmap.mmap, start: int, end: int) -> str:
+    """Read the key that opens a record line, decoding the whole line only if escaped."""
+    close = mapped.find(b'",', start + 2, end)
+    if close != -1 and mapped[start:start + 2] == b'["':
+        raw = mapped[start + 2:close]
+        if b"\\" not in raw:
+            return raw.decode("utf-8")
+    return json.loads(strip_line_checksum(mapped[start:end]))[0]
@@ -0,0 +1,266 @@
+"""
+Coordinates persistence of the application's data stores.
+
+Each store (``ContactBook``, ``Notes``) tracks whether it has changed since it
+was last loaded or saved. The ``SaveCoordinator`` asks every registered store
+for that flag and writes only the stores that actually changed, so read-only
+commands never write to disk.
+
+With a debounce window, saving moves to a background thread: ``schedule``
+is called after every command and the writer saves once no further command
+arrived for ``debounce`` seconds, so a burst of edits costs one write and the
+prompt never waits for the disk. Commands and background saves share
+``lock``, so a save always sees the stores between two commands.
+
+Several sessions may share the data files. ``refresh`` is called before
+every command so that each command sees what other sessions saved, and
+every save merges their changes first (see ``refresh_from_storage``).
+
+Between ``begin`` and ``commit`` the stores collect changes in a transaction:
+nothing is saved and nothing is refreshed, and ``rollback`` drops the
+changes. ``commit`` saves once for the whole transaction. An undo history
+given to the coordinator keeps a transaction as one step, and is saved on
+``close`` if ``HISTORY_PERSIST`` is set.
+"""
+import threading
+import time
+from typing import Protocol
+
+from src import data_storage
+from src.data_storage import StorageConfig
+from src.model.history import History
+
+
+class TrackedStore(Protocol):
+    """A data store that knows whether it has unsaved changes."""
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the store has unsaved changes."""
+
+    def save_to_storage(self, silent: bool = False) -> bool:
+        """Persists the store and returns True on success."""
+
+    def refresh_from_storage(self) -> bool:
+        """Catches up with changes saved by other sessions; True if any."""
+
+    def begin(self) -> None:
+        """Opens a transaction."""
+
+    def commit(self) -> None:
+        """Keeps the changes of the open transaction."""
+
+    def rollback(self) -> None:
+        """Drops the changes of the open transaction."""
+
+
+class SaveCoordinator:
+    """Persists only the stores that changed since their last save."""
+
+    def __init__(
+        self,
+        *stores: TrackedStore,
+        debounce: float = 0,
+        history: History | None = None,
+        config: StorageConfig | None = None,
+    ):
+        """
+        :param history: Undo history of the stores, if any.
+        :param config: Where the history is persisted.
+        """
+        self.__stores = stores
+        self.__history = history
+        self.__config = config
+        self.__debounce = debounce
+        # Held while a command runs and while the stores are saved.
+        self.lock = threading.RLock()
+        self.__wake = threading.Condition()
+        self.__deadline: float | None = None
+        self.__closed = False
+        self.__writer: threading.Thread | None = None
+        self.__transaction = False
+        self.__history_saved = False
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any of the registered stores has unsaved changes."""
+        return any(store.is_dirty for store in self.__stores)
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is open."""
+        return self.__transaction
+
+    def begin(self) -> None:
+        """
+        Open a transaction over all stores. Changes made before are saved
+        first, so that the transaction holds only its own changes.
+
+        :raises ValueError: If a transaction is already open.
+        """
+        with self.lock:
+            if self.__transaction:
+                raise ValueError("A transaction is already open.")
+            self.save()
+            for store in self.__stores:
+                store.begin()
+            if self.__history is not None:
+                self.__history.begin()
+            self.__transaction = True
+
+    def commit(self, silent: bool = True) -> bool:
+        """
+        Close the transaction and save its changes at once.
+
+        :raises ValueError: If no transaction is open.
+        :return: True if all changed stores were saved successfully.
+        """
+        with self.lock:
+            if not self.__transaction:
+                raise ValueError("No transaction is open.")
+            for store in self.__stores:
+                store.commit()
+            if self.__history is not None:
+                self.__history.commit()
+            self.__transaction = False
+            return self.save(silent=silent)
+
+    def rollback(self) -> None:
+        """
+        Drop every change made since ``begin`` and close the transaction.
+
+        :raises ValueError: If no transaction is open.
+        """
+        with self.lock:
+            if not self.__transaction:
+                raise ValueError("No transaction is open.")
+            for store in self.__stores:
+                store.rollback()
+            if self.__history is not None:
+                self.__history.rollback()
+            self.__transaction = False
+
+    def undo(self) -> int:
+        """
+        Undo the most recent command, or transaction, that changed a store.
+
+        :raises ValueError: If there is no history, a transaction is open,
+            there is nothing to undo or the change no longer applies.
+        :return: The number of changes undone.
+        """
+        with self.lock:
+            return self.__undoable().undo()
+
+    def redo(self) -> int:
+        """
+        Redo the most recently undone command or transaction.
+
+        :raises ValueError: Like ``undo``.
+        :return: The number of changes redone.
+        """
+        with self.lock:
+            return self.__undoable().redo()
+
+    def __undoable(self) -> History:
+        if self.__history is None:
+            raise ValueError("No undo history is kept.")
+        if self.__transaction:
+            raise ValueError("Finish the open transaction first; 'rollback' undoes it.")
+        return self.__history
+
+    def save(self, silent: bool = True) -> bool:
+        """
+        Saves every store that has unsaved changes. Inside a transaction
+        nothing is saved until ``commit``.
+
+        :param silent: Suppress the "data saved" message of each store.
+        :return: True if all changed stores were saved successfully.
+        """
+        if self.__transaction:
+            return True
+        success = True
+        for store in self.__stores:
+            if store.is_dirty:
+                success = store.save_to_storage(silent=silent) and success
+        return success
+
+    def refresh(self) -> bool:
+        """
+        Bring every store up to date with changes saved by other sessions.
+
+        :return: True if any store was updated.
+        """
+        with self.lock:
+            if self.__transaction:
+                # The transaction works on what it began with; commit merges.
+                return False
+            refreshed = [store.refresh_from_storage() for store in self.__stores]
+        return any(refreshed)
+
+    def schedule(self) -> None:
+        """
+        Request a save of the changed stores.
+
+        Without a debounce window the stores are saved right away; otherwise
+        the background writer saves them once the window passes without
+        another request.
+        """
+        if not self.has_changes or self.__transaction:
+            return
+        if self.__debounce <= 0:
+            with self.lock:
+                self.save()
+            return
+        with self.__wake:
+            if self.__closed:
+                return
+            self.__deadline = time.monotonic() + self.__debounce
+            if self.__writer is None:
+                self.__writer = threading.Thread(target=self.__run, name="save-writer", daemon=True)
+                self.__writer.start()
+            self.__wake.notify()
+
+    def close(self, silent: bool = True) -> bool:
+        """
+        Stop the background writer and save pending changes now.
+
+        A background save in progress is finished first. An open transaction
+        was never committed, so it is rolled back. With ``HISTORY_PERSIST``
+        the undo history is saved as well. Safe to call more than once, e.g.
+        from the exit command and again on shutdown.
+
+        :return: True if all changed stores were saved successfully.
+        """
+        with self.__wake:
+            self.__closed = True
+            self.__deadline = None
+            self.__wake.notify()
+        with self.lock:
+            if self.__transaction:
+                self.rollback()
+                print("The open transaction was rolled back.")
+            saved = self.save(silent=silent)
+            if self.__history is not None and data_storage.HISTORY_PERSIST and not self.__history_saved:
+                self.__history.save(self.__config or data_storage.current_config())
+                self.__history_saved = True
+            return saved
+
+    def __run(self) -> None:
+        """Background writer: save once each debounce window has passed."""
+        while True:
+            with self.__wake:
+                while not self.__closed:
+                    if self.__deadline is None:
+                        self.__wake.wait()
+                        continue
+                    remaining = self.__deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.__wake.wait(remaining)
+                if self.__closed:
+                    return
+                self.__deadline = None
+            with self.lock:
+                # close() saves on its own; do not write twice.
+                if not self.__closed:
+                    self.save()
@@ -0,0 +1,471 @@
+"""
+SQLite storage backend.
+
+Contacts, their phones, emails and addresses, notes and their tags live in
+normalized tables of a single database file (SQLITE_FILE). Lookup columns are
+indexed, so ``ContactBook`` and ``Notes`` can open lazily and push searches
+down to the database instead of reading every record at startup.
+
+Changes recorded by the stores are applied as individual SQL statements in
+one transaction per save, so the cost of a save depends only on the size of
+the change.
+"""
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, Sequence
+
+from rich import print as rprint
+
+from src.data_storage import (
+    CONTACTS_FILE,
+    NOTES_FILE,
+    SQLITE_FILE,
+    STORAGE_VERSION,
+    resolve_storage_dir,
+)
+from src.model.note import NoteEntity
+from src.storage.backend import Change, ContactSource, NoteSource, StorageBackend
+from src.util.messages import DATA_SAVED
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    birthday TEXT
+);
+CREATE INDEX IF NOT EXISTS contacts_birthday ON contacts (birthday);
+CREATE INDEX IF NOT EXISTS contacts_birthday_day ON contacts (substr(birthday, 6));
+CREATE TABLE IF NOT EXISTS phones (
+    contact_id INTEGER NOT NULL REFERENCES contacts (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS phones_value ON phones (value);
+CREATE INDEX IF NOT EXISTS phones_contact ON phones (contact_id, position);
+CREATE TABLE IF NOT EXISTS emails (
+    contact_id INTEGER NOT NULL REFERENCES contacts (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS emails_folded ON emails (lower(value));
+CREATE INDEX IF NOT EXISTS emails_contact ON emails (contact_id, position);
+CREATE TABLE IF NOT EXISTS addresses (
+    contact_id INTEGER NOT NULL REFERENCES contacts (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS addresses_value ON addresses (value);
+CREATE INDEX IF NOT EXISTS addresses_contact ON addresses (contact_id, position);
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL UNIQUE,
+    content TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS note_tags (
+    note_id INTEGER NOT NULL REFERENCES notes (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS note_tags_tag ON note_tags (tag);
+CREATE INDEX IF NOT EXISTS note_tags_note ON note_tags (note_id, position);
+"""
+
+# Contact list fields and the table storing each of them.
+FIELD_TABLES = {"phones": "phones", "emails": "emails", "addresses": "addresses"}
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open the database and make sure the schema exists."""
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.executescript(SCHEMA)
+    connection.execute(
+        "INSERT OR IGNORE INTO meta (key, value) VALUES ('version', ?)",
+        (str(STORAGE_VERSION),),
+    )
+    connection.commit()
+    return connection
+
+
+# One connection per database file in this process, shared by the contact
+# and note stores: PRAGMA data_version changes only for commits of other
+# connections, so a save of one store is not taken for an outside change by
+# the other.
+_connections: dict[str, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
+def shared_connection(path: str) -> sqlite3.Connection:
+    """Return this process's connection to the database at ``path``, opening it once."""
+    path = os.path.realpath(path)
+    with _connections_lock:
+        connection = _connections.get(path)
+        if connection is None:
+            connection = _connections[path] = connect(path)
+        return connection
+
+
+def _to_iso(birthday: str) -> str:
+    """Convert a DD.MM.YYYY birthday into the sortable ISO form stored in the table."""
+    return datetime.strptime(birthday, "%d.%m.%Y").date().isoformat()
+
+
+def _from_iso(birthday: str | None) -> str | None:
+    if birthday is None:
+        return None
+    return date.fromisoformat(birthday).strftime("%d.%m.%Y")
+
+
+class SqliteStorage(StorageBackend):
+    """Common connection handling and save logic of the SQLite stores."""
+
+    def __init__(self, storage_dir: str | None = None):
+        self.storage_dir = storage_dir or resolve_storage_dir()
+        self.filename = os.path.join(self.storage_dir, SQLITE_FILE)
+        self.connection = shared_connection(self.filename)
+        # Bumped by SQLite whenever another connection, i.e. another process, commits.
+        self._read_version = self._data_version()
+
+    def load_data(self) -> Dict[str, Any]:
+        """Records are read lazily through ``record_source``."""
+        return {"version": STORAGE_VERSION, "data": []}
+
+    def save_changes(
+        self,
+        changes: Sequence[Change],
+        build_snapshot: Callable[[], Dict[str, Any]],
+        silent: bool = False,
+    ) -> bool:
+        """Apply all changes in one transaction."""
+        try:
+            with self.connection:
+                for op, key, args in changes:
+                    self._apply(op, key, args)
+        except Exception as e:
+            print(f"❌ Error during data write: {e}. Existing data preserved.")
+            return False
+        if not silent:
+            rprint(DATA_SAVED.format(filename=self.filename))
+        return True
+
+    def changed_on_disk(self) -> bool:
+        """Whether another connection committed since the records were last read."""
+        return self._data_version() != self._read_version
+
+    def _data_version(self) -> int:
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _apply(self, op: str, key: str, args: Sequence[Any]) -> None:
+        raise NotImplementedError
+
+    def _next_position(self, table: str, owner_column: str, owner_id: int) -> int:
+        row = self.connection.execute(
+            f"SELECT COALESCE(MAX(position), -1) + 1 FROM {table} WHERE {owner_column} = ?",
+            (owner_id,),
+        ).fetchone()
+        return row[0]
+
+
+class SqliteContactStorage(SqliteStorage, ContactSource):
+    """Contacts stored in normalized, indexed tables."""
+
+    def record_source(self) -> ContactSource:
+        self._read_version = self._data_version()
+        return self
+
+    # ----- ContactSource ---------------------------------------------------
+    def keys(self) -> Iterator[str]:
+        for (key,) in self.connection.execute("SELECT key FROM contacts ORDER BY id"):
+            yield key
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        row = self.connection.execute(
+            "SELECT id, name, birthday FROM contacts WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        contact_id, name, birthday = row
+        record: Dict[str, Any] = {"name": name}
+        for field, table in FIELD_TABLES.items():
+            record[field] = [
+                value for (value,) in self.connection.execute(
+                    f"SELECT value FROM {table} WHERE contact_id = ? ORDER BY position",
+                    (contact_id,),
+                )
+            ]
+        record["birthday"] = _from_iso(birthday)
+        return record
+
+    def find_keys(self, param: str, value: Any) -> list[str]:
+        if param == "birthday":
+            rows = self.connection.execute(
+                "SELECT key FROM contacts WHERE birthday = ?", (value.isoformat(),)
+            )
+        elif param == "birthday_day":
+            month, day = value
+            rows = self.connection.execute(
+                "SELECT key FROM contacts WHERE substr(birthday, 6) = ?", (f"{month:02d}-{day:02d}",)
+            )
+        elif param == "emails":
+            # Emails match case-insensitively; they are ASCII by validation.
+            rows = self.connection.execute(
+                "SELECT DISTINCT c.key FROM emails f JOIN contacts c ON c.id = f.contact_id "
+                "WHERE lower(f.value) = ?",
+                (value.lower(),),
+            )
+        else:
+            table = FIELD_TABLES[param]
+            rows = self.connection.execute(
+                f"SELECT DISTINCT c.key FROM {table} f JOIN contacts c ON c.id = f.contact_id "
+                "WHERE f.value = ?",
+                (value,),
+            )
+        return [key for (key,) in rows]
+
+    # ----- Writes ----------------------------------------------------------
+    def import_payload(self, payload: Dict[str, Dict[str, Any]]) -> int:
+        """Replace all contacts with a ``ContactBook.to_dict`` payload."""
+        with self.connection:
+            self.connection.execute("DELETE FROM contacts")
+            for record in payload.values():
+                self._insert(record["name"].strip().casefold(), record)
+        return len(payload)
+
+    def _insert(self, key: str, record: Dict[str, Any]) -> None:
+        birthday = record.get("birthday")
+        cursor = self.connection.execute(
+            "INSERT INTO contacts (key, name, birthday) VALUES (?, ?, ?)",
+            (key, record["name"], _to_iso(birthday) if birthday else None),
+        )
+        self._insert_fields(cursor.lastrowid, record)
+
+    def _insert_fields(self, contact_id: int, record: Dict[str, Any]) -> None:
+        for field, table in FIELD_TABLES.items():
+            self.connection.executemany(
+                f"INSERT INTO {table} (contact_id, position, value) VALUES (?, ?, ?)",
+                [(contact_id, position, value)
+                 for position, value in enumerate(record.get(field) or [])],
+            )
+
+    def _replace(self, key: str, record: Dict[str, Any]) -> None:
+        """Overwrite the contact stored under ``key`` in place, keeping its row and order."""
+        row = self.connection.execute("SELECT id FROM contacts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._insert(key, record)
+            return
+        contact_id = row[0]
+        birthday = record.get("birthday")
+        self.connection.execute(
+            "UPDATE contacts SET name = ?, birthday = ? WHERE id = ?",
+            (record["name"], _to_iso(birthday) if birthday else None, contact_id),
+        )
+        for table in FIELD_TABLES.values():
+            self.connection.execute(f"DELETE FROM {table} WHERE contact_id = ?", (contact_id,))
+        self._insert_fields(contact_id, record)
+
+    def _contact_id(self, key: str) -> int:
+        row = self.connection.execute("SELECT id FROM contacts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise ValueError(f"Contact '{key}' not found in the database.")
+        return row[0]
+
+    def _apply(self, op: str, key: str, args: Sequence[Any]) -> None:
+        if op == "create_contact":
+            name, phone = args
+            self._insert(key, {"name": name, "phones": [phone]})
+            return
+        if op == "put_contact":
+            self._replace(key, args[0])
+            return
+        if op == "delete_contact":
+            self.connection.execute("DELETE FROM contacts WHERE key = ?", (key,))
+            return
+
+        contact_id = self._contact_id(key)
+        if op == "set_birthday":
+            self.connection.execute(
+                "UPDATE contacts SET birthday = ? WHERE id = ?", (_to_iso(args[0]), contact_id)
+            )
+        elif op == "clear_birthday":
+            self.connection.execute("UPDATE contacts SET birthday = NULL WHERE id = ?", (contact_id,))
+        else:
+            action, field = op.split("_", 1)
+            table = FIELD_TABLES[field + "es" if field == "address" else field + "s"]
+            if action == "add":
+                self.connection.execute(
+                    f"INSERT INTO {table} (contact_id, position, value) VALUES (?, ?, ?)",
+                    (contact_id, self._next_position(table, "contact_id", contact_id), args[0]),
+                )
+            elif action == "remove":
+                self.connection.execute(
+                    f"DELETE FROM {table} WHERE contact_id = ? AND value = ?", (contact_id, args[0])
+                )
+            elif action == "update":
+                self.connection.execute(
+                    f"UPDATE {table} SET value = ? WHERE contact_id = ? AND value = ?",
+                    (args[1], contact_id, args[0]),
+                )
+            else:
+                raise ValueError(f"Unknown change operation '{op}'.")
+
+
+class SqliteNoteStorage(SqliteStorage, NoteSource):
+    """Notes and their tags stored in normalized, indexed tables."""
+
+    def record_source(self) -> NoteSource:
+        self._read_version = self._data_version()
+        return self
+
+    # ----- NoteSource ------------------------------------------------------
+    def load_all(self) -> list[Dict[str, Any]]:
+        return self._select_notes("SELECT id, topic, content FROM notes ORDER BY id", ())
+
+    def find_by_tag(self, tag: str) -> list[Dict[str, Any]]:
+        return self._select_notes(
+            "SELECT n.id, n.topic, n.content FROM notes n "
+            "WHERE n.id IN (SELECT note_id FROM note_tags WHERE tag = ?) ORDER BY n.id",
+            (tag,),
+        )
+
+    def find_by_topic(self, topic: str) -> Dict[str, Any] | None:
+        notes = self._select_notes("SELECT id, topic, content FROM notes WHERE topic = ?", (topic,))
+        return notes[0] if notes else None
+
+    def position(self, topic: str | None) -> int | None:
+        if topic is None:
+            return self.connection.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+        row = self.connection.execute("SELECT id FROM notes WHERE topic = ?", (topic,)).fetchone()
+        if row is None:
+            return None
+        return self.connection.execute("SELECT COUNT(*) FROM notes WHERE id < ?", row).fetchone()[0]
+
+    def _select_notes(self, query: str, params: tuple) -> list[Dict[str, Any]]:
+        notes = {
+            note_id: {"topic": topic, "content": content, "tags": []}
+            for note_id, topic, content in self.connection.execute(query, params)
+        }
+        if notes:
+            placeholders = ",".join("?" * len(notes))
+            for note_id, tag in self.connection.execute(
+                f"SELECT note_id, tag FROM note_tags WHERE note_id IN ({placeholders}) "
+                "ORDER BY note_id, position",
+                tuple(notes),
+            ):
+                notes[note_id]["tags"].append(tag)
+        return list(notes.values())
+
+    # ----- Writes ----------------------------------------------------------
+    def import_payload(self, payload: list[Dict[str, Any]]) -> int:
+        """Replace all notes with a ``Notes.to_payload`` payload."""
+        with self.connection:
+            self.connection.execute("DELETE FROM notes")
+            for record in payload:
+                self._insert(record["topic"], record["content"], record.get("tags") or [])
+        return len(payload)
+
+    def _insert(self, topic: str, content: str, tags: Sequence[str], position: int | None = None) -> None:
+        """
+        Insert a note at the end, or at ``position`` of the id order. A note
+        put back there by an undone deletion takes the id freed by the
+        deletion; if the ids leave no room, it goes to the end.
+        """
+        note_id = None
+        if position is not None:
+            row = self.connection.execute(
+                "SELECT id FROM notes ORDER BY id LIMIT 1 OFFSET ?", (position,)
+            ).fetchone()
+            if row is not None:
+                before = self.connection.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM notes WHERE id < ?", row
+                ).fetchone()[0]
+                if row[0] - 1 > before:
+                    note_id = row[0] - 1
+        cursor = self.connection.execute(
+            "INSERT INTO notes (id, topic, content) VALUES (?, ?, ?)", (note_id, topic, content)
+        )
+        self._add_tags(cursor.lastrowid, tags)
+
+    def _add_tags(self, note_id: int, tags: Sequence[str]) -> None:
+        position = self._next_position("note_tags", "note_id", note_id)
+        self.connection.executemany(
+            "INSERT INTO note_tags (note_id, position, tag) VALUES (?, ?, ?)",
+            [(note_id, position + offset, tag) for offset, tag in enumerate(tags)],
+        )
+
+    def _note_id(self, topic: str) -> int:
+        row = self.connection.execute("SELECT id FROM notes WHERE topic = ?", (topic,)).fetchone()
+        if row is None:
+            raise ValueError(f"Note with topic '{topic}' not found in the database.")
+        return row[0]
+
+    def _apply(self, op: str, key: str, args: Sequence[Any]) -> None:
+        if op == "add_note":
+            content, tag, *position = args
+            # Parse the tags exactly like the in-memory note does.
+            self._insert(key, content, NoteEntity(key, content, tag).tags, *position)
+            return
+
+        note_id = self._note_id(key)
+        if op == "edit_note":
+            self.connection.execute("UPDATE notes SET content = ? WHERE id = ?", (args[0], note_id))
+        elif op == "delete_note":
+            self.connection.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        elif op == "add_tag":
+            self._add_tags(note_id, args)
+        elif op == "edit_tag":
+            old, new = args
+            self.connection.execute(
+                "DELETE FROM note_tags WHERE note_id = ? AND tag = ?", (note_id, old)
+            )
+            exists = self.connection.execute(
+                "SELECT 1 FROM note_tags WHERE note_id = ? AND tag = ?", (note_id, new)
+            ).fetchone()
+            if exists is None:
+                self._add_tags(note_id, [new])
+        elif op == "delete_tags":
+            self.connection.executemany(
+                "DELETE FROM note_tags WHERE note_id = ? AND tag = ?",
+                [(note_id, tag) for tag in args],
+            )
+        elif op == "set_tags":
+            self.connection.execute("DELETE FROM note_tags WHERE note_id = ?", (note_id,))
+            self._add_tags(note_id, args)
+        else:
+            raise ValueError(f"Unknown change operation '{op}'.")
+
+
+def open_sqlite_storage(filename: str, storage_dir: str | None = None) -> SqliteStorage:
+    """Return the SQLite store replacing the JSON file ``filename``."""
+    if filename == CONTACTS_FILE:
+        return SqliteContactStorage(storage_dir)
+    if filename == NOTES_FILE:
+        return SqliteNoteStorage(storage_dir)
+    raise ValueError(f"No SQLite store for '{filename}'.")
+
+
+def migrate_json_to_sqlite() -> tuple[int, int]:
+    """
+    Copy the v1 JSON files (including pending journal changes) into SQLITE_FILE.
+
+    Existing rows of the database are replaced. The JSON files are left untouched.
+
+    :return: The number of migrated contacts and notes.
+    """
+    # Imported here: the contact book module imports the storage settings.
+    from src.data_storage import DataStorage
+    from src.model.contact_book import ContactBook
+    from src.model.note import Notes
+
+    book = ContactBook.load_from_storage(DataStorage(CONTACTS_FILE))
+    notes = Notes.load_from_storage(DataStorage(NOTES_FILE))
+    contacts_count = SqliteContactStorage().import_payload(book.to_dict())
+    notes_count = SqliteNoteStorage().import_payload(notes.to_payload())
+    return contacts_count, notes_count
@@ -0,0 +1,125 @@
+"""
+Unit tests for the batch mode, which runs commands read from a script.
+"""
+import pytest
+import rich
+
+from src import data_storage
+from src.data_storage import StorageConfig
+from src.model.contact_book import ContactBook
+from src.personal_assistant import PersonalAssistant
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch, storage_env) -> StorageConfig:
+    """A storage configuration in a temporary folder."""
+    monkeypatch.setattr(data_storage, "STORAGE_MODE", "journal")
+    return StorageConfig(str(tmp_path / "data"))
+
+
+def load_contacts(config: StorageConfig) -> ContactBook:
+    return ContactBook.load_from_storage(data_storage.open_storage(data_storage.CONTACTS_FILE, config))
+
+
+def test_batch_runs_commands_and_saves(config, capsys) -> None:
+    """Every command of the script runs; the result is saved at the end."""
+    script = [
+        "# contacts to import",
+        'add-contact "John Smith" 0501234567',
+        "",
+        'add-email "John Smith" john@example.com',
+        "add-contact Jane 0507654321",
+        "del-contact Jane",
+    ]
+
+    assert PersonalAssistant(config).run_batch(script, quiet=True) == 0
+
+    book = load_contacts(config)
+    assert list(book) == ["john smith"]
+    assert book["john smith"].emails[0].value == "john@example.com"
+    assert capsys.readouterr().err == ""
+
+
+def test_batch_reports_failures_and_goes_on(config, capsys) -> None:
+    """Failing commands are reported with their line numbers; the rest still runs."""
+    script = [
+        "add-contact John 0501234567",
+        "no-such-command",
+        "add-contact Jane",
+        "add-contact 'Jane 0507654321",
+        "add-contact Jane 0507654321",
+    ]
+
+    assert PersonalAssistant(config).run_batch(script, quiet=True) == 3
+
+    errors = capsys.readouterr().err
+    assert "line 2:" in errors and "line 3:" in errors and "line 4:" in errors
+    assert sorted(load_contacts(config)) == ["jane", "john"]
+
+
+def test_batch_saves_every_n_commands(config) -> None:
+    """With save_every, the changes are on disk before the batch ends."""
+
+    def script():
+        yield "add-contact John 0501234567"
+        yield "add-contact Jane 0507654321"
+        assert sorted(load_contacts(config)) == ["jane", "john"]
+        yield "exit"
+        yield "add-contact Never 0500000000"
+
+    assert PersonalAssistant(config).run_batch(script(), save_every=2, quiet=True) == 0
+    assert sorted(load_contacts(config)) == ["jane", "john"]
+
+
+def test_failure_rolls_back_the_transaction(config, capsys) -> None:
+    """A failing command undoes its transaction and skips the rest of it."""
+    script = [
+        "add-contact John 0501234567",
+        "begin",
+        "add-contact Jane 0507654321",
+        "change-phone John 0509999999 0501111111",
+        "add-contact Skipped 0500000000",
+        "commit",
+        "begin",
+        "add-email John john@example.com",
+        "commit",
+    ]
+
+    assert PersonalAssistant(config).run_batch(script, quiet=True) == 1
+
+    assert "rolled back" in capsys.readouterr().err
+    book = load_contacts(config)
+    assert list(book) == ["john"]
+    assert book["john"].emails[0].value == "john@example.com"
+
+
+def test_failures_that_commands_report_are_counted(config, capsys) -> None:
+    """Commands that only print why they failed count as failures, with their messages shown."""
+    script = [
+        "add-contact John 0501234567",
+        "add-email Nobody nobody@example.com",
+        "add-note plan 'Buy milk'",
+        "add-note plan 'Buy bread'",
+        "begin",
+        "begin",
+    ]
+
+    assert PersonalAssistant(config).run_batch(script, quiet=True) == 3
+
+    captured = capsys.readouterr()
+    assert "Nobody" in captured.err and "Failed to start a transaction" in captured.err
+    assert "line 2:" in captured.err and "line 4:" in captured.err and "line 6:" in captured.err
+    # The output of the commands that worked stays hidden.
+    assert "added" not in captured.out + captured.err
+
+
+def test_batch_leaves_the_global_console_unchanged(config) -> None:
+    """Quiet or not, a batch run does not reconfigure the shared rich console."""
+    console = rich.get_console()
+    settings = (console.print, console.soft_wrap, console._highlight)
+
+    PersonalAssistant(config).run_batch(["add-contact John 0501234567"], quiet=True)
+    PersonalAssistant(config).run_batch(["add-contact Jane 0507654321"])
+
+    assert rich.get_console() is console
+    assert (console.print, console.soft_wrap, console._highlight) == settings
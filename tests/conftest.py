@@ -0,0 +1,35 @@
+"""
+Fixtures shared by the test packages.
+"""
+import pytest
+
+from src import data_storage
+from src.data_storage import StorageConfig
+
+
+@pytest.fixture
+def storage_env(tmp_path, monkeypatch):
+    """
+    Redirects the home directory and clears the storage environment.
+
+    `StorageConfig` reads DATA_DIR_ENV and PROFILE_ENV, so a data folder or
+    profile set in the shell running the tests would otherwise be written
+    to. Returns the (not yet created) home directory.
+    """
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv(data_storage.DATA_DIR_ENV, raising=False)
+    monkeypatch.delenv(data_storage.PROFILE_ENV, raising=False)
+    return home
+
+
+@pytest.fixture
+def storage_home(storage_env):
+    """
+    Opens every storage without a configuration in a temporary home.
+    Returns the storage folder.
+    """
+    config = StorageConfig()
+    data_storage.use_config(config)
+    yield config.storage_dir
+    data_storage.use_config(None)
@@ -0,0 +1,141 @@
+"""
+Unit tests for the `ContactBook` collection and the change tracking of its
+contacts.
+"""
+from datetime import date, timedelta
+
+from src.model.contact import Contact
+from src.model.contact_book import ContactBook
+
+
+def make_book() -> ContactBook:
+    """Builds a clean book with a single contact, as if loaded from storage."""
+    contact = Contact("John", "0501234567")
+    return ContactBook({"john": contact})
+
+
+def test_loaded_book_is_clean() -> None:
+    """A book built from existing contacts has no unsaved changes."""
+    book = make_book()
+
+    assert not book.is_dirty
+
+
+def test_lookups_do_not_mark_book_dirty() -> None:
+    """Read-only operations leave the book clean."""
+    book = make_book()
+
+    book.find_contact("John")
+    book.find_contact_by_param("phones", "0501234567")
+    book.get_upcoming_birthdays(7)
+
+    assert not book.is_dirty
+
+
+def test_contact_mutation_marks_book_dirty() -> None:
+    """Changing a field of a stored contact marks the owning book dirty."""
+    book = make_book()
+
+    book["john"].add_email("john@example.com")
+
+    assert book.is_dirty
+
+
+def test_failed_mutation_keeps_book_clean() -> None:
+    """A rejected change does not mark the book dirty."""
+    book = make_book()
+
+    try:
+        book["john"].add_phone("0501234567")
+    except ValueError:
+        pass
+
+    assert not book.is_dirty
+
+
+def test_deleted_contact_is_no_longer_tracked() -> None:
+    """Once removed, a contact no longer reports changes to the book."""
+    book = make_book()
+    _, contact = book.delete_contact("John")
+    book.mark_clean()
+
+    contact.add_phone("0671112233")
+
+    assert not book.is_dirty
+
+
+def test_create_and_delete_mark_book_dirty() -> None:
+    """Creating or deleting contacts marks the book dirty."""
+    book = make_book()
+    book.create_contact("Jane", "0679876543")
+    assert book.is_dirty
+
+    book.mark_clean()
+    book.delete_contact("Jane")
+    assert book.is_dirty
+
+
+def test_indexes_follow_every_contact_change() -> None:
+    """Field lookups stay correct and consistent through all mutations."""
+    book = make_book()
+    book.create_contact("Jane", "0679876543")
+    john, jane = book["john"], book["jane"]
+
+    john.add_email("John@Example.com")
+    john.add_address("Main St, 1")
+    john.set_birthday("12.03.1978")
+    jane.add_phone("0501112233")
+    jane.update_phone("0679876543", "0631234567")
+    john.update_email("john@example.com", "j@example.com")
+    john.set_birthday("13.03.1978")
+    assert book.check_indexes() == []
+
+    assert book.find_contact_by_param("phones", "0631234567") == [jane]
+    assert book.find_contact_by_param("phones", "0679876543") == []
+    assert book.find_contact_by_param("emails", "J@EXAMPLE.COM") == [john]
+    assert book.find_contact_by_param("addresses", "Main St, 1") == [john]
+    assert book.find_contact_by_param("birthday", "13.03.1978") == [john]
+    assert book.find_contact_by_param("birthday", "12.03.1978") == []
+
+    john.clear_birthday()
+    john.remove_address("Main St, 1")
+    book.delete_contact("Jane")
+    assert book.check_indexes() == []
+    assert book.find_contact_by_param("phones", "0501112233") == []
+    assert book.find_contact("0501234567") is john
+
+
+def test_check_indexes_reports_out_of_band_changes() -> None:
+    """Editing field lists behind the book's back is detected by the checker."""
+    book = make_book()
+
+    book["john"].phones.clear()
+
+    assert book.check_indexes() == ["phones '0501234567': indexed ['john'], expected []"]
+
+
+def test_upcoming_birthdays_use_calendar_buckets() -> None:
+    """Only birthdays inside the window are listed, in calendar order."""
+    today = date.today()
+    book = make_book()
+    book.create_contact("Jane", "0679876543")
+    book.create_contact("Bob", "0631234567")
+    soon, later, outside = (today + timedelta(days=offset) for offset in (5, 1, 20))
+    book["john"].set_birthday(soon.replace(year=1990).strftime("%d.%m.%Y"))
+    book["jane"].set_birthday(later.replace(year=1985).strftime("%d.%m.%Y"))
+    book["bob"].set_birthday(outside.replace(year=1970).strftime("%d.%m.%Y"))
+
+    upcoming = book.get_upcoming_birthdays(7)
+
+    assert [entry["name"] for entry in upcoming] == ["Jane", "John"]
+    assert book.check_indexes() == []
+
+
+def test_leap_day_birthday_is_celebrated_on_feb_28() -> None:
+    """In a non-leap year, a Feb 29 birthday falls into the Feb 28 bucket."""
+    book = make_book()
+    book["john"].set_birthday("29.02.2000")
+
+    assert book._birthdays_on(date(2027, 2, 28)) == ["john"]
+    assert book._birthdays_on(date(2028, 2, 28)) == []
+    assert book._birthdays_on(date(2028, 2, 29)) == ["john"]
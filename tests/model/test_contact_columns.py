@@ -0,0 +1,77 @@
+"""
+Unit tests for the columnar mirror of a `ContactBook`.
+"""
+from src.model.contact import Contact
+from src.model.contact_book import ContactBook
+from src.model.contact_columns import ContactColumns
+
+
+def make_book() -> ContactBook:
+    """Builds a book with three contacts covering every column."""
+    john = Contact("John", "0501234567")
+    john.add_email("john@example.com")
+    john.set_birthday("15.03.1990")
+    john.add_address("Kyiv, Main St 1")
+    jane = Contact("Jane", "0507654321")
+    jane.add_phone("0671112233")
+    jane.add_email("jane@Example.com")
+    jane.add_address("Kyiv, Main St 1")
+    bob = Contact("Bob", "0931112233")
+    bob.set_birthday("02.03.1985")
+    return ContactBook({"john": john, "jane": jane, "bob": bob})
+
+
+def test_columns_aggregate_the_book() -> None:
+    """The column aggregates answer the report questions without walking contacts."""
+    book = make_book()
+    columns = book.columns()
+
+    assert len(columns) == 3
+    assert columns.total("phone_counts") == 4
+    assert columns.count_without_emails() == 1
+    assert columns.count_without_birthday() == 1
+    assert columns.birthdays_per_month()[2] == 2
+    assert columns.top_email_domains() == [("example.com", 2)]
+    assert columns.names_where("phone_counts", ">", 1) == ["Jane"]
+    assert columns.names_where("email_counts", "==", 0) == ["Bob"]
+    assert book.shared_addresses() == {"Kyiv, Main St 1": ["John", "Jane"]}
+
+
+def test_columns_follow_book_mutations() -> None:
+    """Once built, the columns are updated by every change of the book."""
+    book = make_book()
+    columns = book.columns()
+
+    book["bob"].add_email("bob@mail.org")
+    book["john"].clear_birthday()
+    book.delete_contact("jane")
+    book.create_contact("Alice", "0441234567")
+
+    assert sorted(columns.names) == ["Alice", "Bob", "John"]
+    assert columns.count_without_emails() == 1
+    assert columns.count_without_birthday() == 2
+    assert columns.top_email_domains() == [("example.com", 1), ("mail.org", 1)]
+    assert book.shared_addresses() == {}
+    book["alice"].add_address("Kyiv, Main St 1")
+    assert book.shared_addresses() == {"Kyiv, Main St 1": ["John", "Alice"]}
+
+    rebuilt = ContactColumns(book.data.items())
+    for name in ("names", "phone_counts", "email_counts", "birth_months", "birth_ordinals"):
+        row_of = {key: row for row, key in enumerate(rebuilt.keys)}
+        expected = [getattr(rebuilt, name)[row_of[key]] for key in columns.keys]
+        assert list(getattr(columns, name)) == expected
+
+
+def test_every_email_domain_is_counted() -> None:
+    """A contact with emails on two domains counts towards both."""
+    book = make_book()
+    columns = book.columns()
+
+    book["john"].add_email("john@mail.org")
+    book["jane"].add_email("jane.work@example.com")
+
+    assert columns.top_email_domains() == [("example.com", 3), ("mail.org", 1)]
+    book["john"].remove_email("john@example.com")
+    assert columns.top_email_domains() == [("example.com", 2), ("mail.org", 1)]
+    book.delete_contact("john")
+    assert columns.top_email_domains() == [("example.com", 2)]
@@ -0,0 +1,46 @@
+"""
+Unit tests for the memory layout of the model classes.
+"""
+import sys
+
+from src.model.address import Address
+from src.model.contact import Contact
+from src.model.name import Name
+from src.model.note import NoteEntity
+from src.model.phone import Phone
+
+
+def test_model_objects_have_no_instance_dict() -> None:
+    """Fields, contacts and notes are slotted."""
+    contact = Contact("John", "0501234567")
+    contact.add_email("john@example.com")
+    contact.set_birthday("12.03.1978")
+    note = NoteEntity("Shopping", "Buy milk", "groceries")
+
+    for obj in (contact, contact.name, contact.phones[0], contact.emails[0], contact.birthday, note):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_packed_phone_keeps_string_value(monkeypatch) -> None:
+    """A packed phone number still reads back as its 10-digit string."""
+    monkeypatch.setattr(Phone, "PACKED", True)
+    phone = Phone("0501234567")
+
+    assert phone._digits == 501234567
+    assert phone.value == "0501234567"
+    assert str(phone) == "0501234567"
+    assert Phone.trusted("0000000001").value == "0000000001"
+
+
+def test_phone_has_a_single_slot() -> None:
+    """The packed number is kept in Field's slot; a phone is as small as a name."""
+    assert sys.getsizeof(Phone("0501234567")) == sys.getsizeof(Name("John"))
+
+
+def test_repeated_values_are_shared() -> None:
+    """Equal tags and addresses built from separate strings share one object."""
+    first = NoteEntity("A", "a", "".join(["wo", "rk"]))
+    second = NoteEntity("B", "b", "work, home")
+
+    assert first.tags[0] is second.tags[0]
+    assert Address("".join(["Main ", "St"])).value is Address("Main St").value
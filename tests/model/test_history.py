@@ -0,0 +1,226 @@
+"""
+Unit tests for undo and redo of contact and note changes.
+"""
+import pytest
+
+from src import data_storage
+from src.data_storage import StorageConfig
+from src.model.contact_book import ContactBook
+from src.model.history import History
+from src.model.note import Notes
+from src.personal_assistant import PersonalAssistant
+
+
+def tracked() -> tuple[History, ContactBook, Notes]:
+    history = History()
+    book, notes = ContactBook(), Notes()
+    history.attach("contacts", book)
+    history.attach("notes", notes)
+    return history, book, notes
+
+
+def step(history: History, change) -> None:
+    """Run one command's worth of changes."""
+    change()
+    history.checkpoint()
+
+
+def test_undo_and_redo_contact_changes() -> None:
+    """Every contact change is undone exactly, and redone after that."""
+    history, book, _ = tracked()
+    _, john = book.create_contact("John", "0501234567")
+    history.checkpoint()
+    states = [book.to_dict()]
+    changes = [
+        lambda: book["john"].add_phone("0677654321"),
+        lambda: book["john"].add_email("john@example.com"),
+        lambda: book["john"].update_phone("0501234567", "0991112233"),
+        lambda: book["john"].add_address("Main St, 1"),
+        lambda: book["john"].set_birthday("15.01.1990"),
+        lambda: book["john"].set_birthday("16.01.1990"),
+        # Removing the first phone must not change the order on undo.
+        lambda: book["john"].remove_phone("0991112233"),
+        lambda: book["john"].clear_birthday(),
+        lambda: book["john"].remove_email("john@example.com"),
+        lambda: book.delete_contact("John"),
+    ]
+    for change in changes:
+        step(history, change)
+        states.append(book.to_dict())
+
+    for state in reversed(states[:-1]):
+        history.undo()
+        assert book.to_dict() == state
+    for state in states[1:]:
+        history.redo()
+        assert book.to_dict() == state
+    assert book.check_indexes() == []
+
+
+def note_state(notes: Notes) -> list[dict]:
+    return [dict(note.to_dict(), tags=list(note.tags)) for note in notes]
+
+
+def test_undo_and_redo_note_changes() -> None:
+    """Note edits, tag changes and deletions are undone and redone."""
+    history, _, notes = tracked()
+    step(history, lambda: notes.add_note("plan", "Buy milk", "home, urgent"))
+    states = [note_state(notes)]
+    changes = [
+        lambda: notes.edit_note("plan", "Buy bread"),
+        lambda: notes.add_tag("plan", "shop"),
+        lambda: notes.edit_tag("plan", "home", "urgent"),
+        lambda: notes.delete_tags("plan", "shop"),
+        lambda: notes.delete_note("plan"),
+    ]
+    for change in changes:
+        step(history, change)
+        states.append(note_state(notes))
+
+    for state in reversed(states[:-1]):
+        history.undo()
+        assert note_state(notes) == state
+        assert [note.topic for note in notes.search_by_tag("urgent")] == ["plan"]
+    for state in states[1:]:
+        history.redo()
+        assert note_state(notes) == state
+
+
+def test_a_new_change_drops_the_redo_stack() -> None:
+    """After undo, a new change cannot be followed by redo."""
+    history, book, _ = tracked()
+    step(history, lambda: book.create_contact("John", "0501234567"))
+    history.undo()
+    step(history, lambda: book.create_contact("Jane", "0507654321"))
+
+    assert not history.can_redo
+    with pytest.raises(ValueError):
+        history.redo()
+
+
+def test_undo_records_stay_small() -> None:
+    """An inverse holds the changed values only, not a copy of the data."""
+    history, book, notes = tracked()
+    _, john = book.create_contact("John", "0501234567")
+    for i in range(200):
+        john.add_email(f"john{i}@example.com")
+    notes.add_note("plan", "x" * 10_000)
+    history.checkpoint()
+    size = history._size
+
+    step(history, lambda: john.update_email("john5@example.com", "new@example.com"))
+    step(history, lambda: notes.add_tag("plan", "home"))
+
+    assert history._size - size < 200
+
+
+def test_budget_drops_the_oldest_changes() -> None:
+    """Within the byte budget only the newest commands can be undone."""
+    history = History(budget=400)
+    book = ContactBook()
+    history.attach("contacts", book)
+    _, john = book.create_contact("John", "0501234567")
+    history.checkpoint()
+    for i in range(50):
+        step(history, lambda: john.add_email(f"john{i}@example.com"))
+
+    assert history._size <= 400
+    undone = 0
+    while history.can_undo:
+        history.undo()
+        undone += 1
+    assert 0 < undone < 50
+    assert len(book["john"].emails) == 50 - undone
+
+
+def test_undo_command_reverts_a_transaction_at_once(tmp_path, monkeypatch, storage_env, capsys) -> None:
+    """The commands of a committed transaction are undone together and saved."""
+    monkeypatch.setattr(data_storage, "STORAGE_MODE", "journal")
+    config = StorageConfig(str(tmp_path / "data"))
+    script = [
+        "add-contact John 0501234567",
+        "begin",
+        "add-email John john@example.com",
+        "add-contact Jane 0507654321",
+        "commit",
+        "undo",
+        "begin",
+        "undo",
+        "rollback",
+        "undo",
+        "redo",
+    ]
+
+    # The refused undo fails, which rolls back its transaction.
+    assert PersonalAssistant(config).run_batch(script) == 1
+
+    assert "Failed to undo: Finish the open transaction first" in capsys.readouterr().out
+    book = ContactBook.load_from_storage(data_storage.open_storage(data_storage.CONTACTS_FILE, config))
+    assert list(book) == ["john"]
+    assert book["john"].emails == []
+
+
+def test_history_is_kept_across_sessions(tmp_path, monkeypatch, storage_env) -> None:
+    """With HISTORY_PERSIST, the next session can undo what the last one did."""
+    monkeypatch.setattr(data_storage, "HISTORY_PERSIST", True)
+    config = StorageConfig(str(tmp_path / "data"))
+
+    assert PersonalAssistant(config).run_batch(["add-note plan 'Buy milk' home"], quiet=True) == 0
+    assert PersonalAssistant(config).run_batch(["add-tags plan urgent", "undo", "undo"], quiet=True) == 0
+
+    notes = Notes.load_from_storage(data_storage.open_storage(data_storage.NOTES_FILE, config))
+    assert list(notes) == []
+
+
+def test_rolled_back_changes_are_not_undone() -> None:
+    """Changes a rollback of the book took back leave nothing to undo."""
+    history, book, _ = tracked()
+    step(history, lambda: book.create_contact("John", "0501234567"))
+    book.begin()
+    book.create_contact("Jane", "0507654321")
+    book.rollback()
+    history.checkpoint()
+
+    history.undo()
+    assert list(book) == []
+    assert not history.can_undo
+
+
+def test_a_failing_group_is_rolled_back() -> None:
+    """If one change of a group cannot be undone, none is, and the group stays."""
+    history, book, notes = tracked()
+    step(history, lambda: book.create_contact("John", "0501234567"))
+
+    def change() -> None:
+        notes.add_note("plan", "Buy milk")
+        book["john"].add_email("john@example.com")
+
+    step(history, change)
+    # Deleted behind the history's back, so its undo fails after the email's.
+    notes._history = None
+    notes.delete_note("plan")
+    notes._history = history
+    changes = list(book._changes)
+
+    with pytest.raises(ValueError):
+        history.undo()
+
+    assert [email.value for email in book["john"].emails] == ["john@example.com"]
+    assert book._changes == changes
+    assert not book.in_transaction and not notes.in_transaction
+    assert history.can_undo and not history.can_redo
+
+
+def test_undone_deletion_puts_the_note_back_in_place() -> None:
+    """A deleted note comes back at its index, also after a redo and undo."""
+    history, _, notes = tracked()
+    for topic in ("first", "second", "third"):
+        step(history, lambda topic=topic: notes.add_note(topic, "text"))
+    step(history, lambda: notes.delete_note("second"))
+
+    history.undo()
+    assert [note.topic for note in notes] == ["first", "second", "third"]
+    history.redo()
+    history.undo()
+    assert [note.topic for note in notes] == ["first", "second", "third"]
+    assert [note.topic for note in notes.sort_by_tag()] == ["first", "second", "third"]
@@ -0,0 +1,96 @@
+"""
+Unit tests for transactions over the contact book and the notes.
+"""
+import pytest
+
+from src.model.contact_book import ContactBook
+from src.model.note import Notes
+from src.storage.save_coordinator import SaveCoordinator
+
+
+def sample_book() -> ContactBook:
+    book = ContactBook()
+    _, john = book.create_contact("John", "0501234567")
+    john.add_email("john@example.com")
+    john.set_birthday("15.01.1990")
+    book.create_contact("Jane", "0507654321")
+    book.mark_clean()
+    return book
+
+
+def test_rollback_restores_contacts_and_indexes() -> None:
+    """Edits, additions and deletions since begin are undone; lookups agree."""
+    book = sample_book()
+    before = book.to_dict()
+    book.columns()
+
+    book.begin()
+    book["john"].update_phone("0501234567", "0671111111")
+    book["john"].remove_email("john@example.com")
+    book["john"].clear_birthday()
+    book.delete_contact("Jane")
+    book.create_contact("Bob", "0502222222")
+    book.rollback()
+
+    assert book.to_dict() == before
+    assert not book.is_dirty
+    assert book.find_contact("0501234567") is book["john"]
+    assert book.find_contact("0671111111") is None
+    assert book.check_indexes() == []
+    assert book.columns().count_without_birthday() == 1
+    with pytest.raises(ValueError):
+        book.rollback()
+
+
+def test_commit_keeps_the_changes() -> None:
+    """Committed changes stay recorded for the next save."""
+    book = sample_book()
+    book.begin()
+    book["jane"].add_email("jane@example.com")
+    book.commit()
+
+    assert book.is_dirty
+    assert book["jane"].emails[0].value == "jane@example.com"
+    assert not book.in_transaction
+
+
+def test_notes_rollback() -> None:
+    """Notes edited, retagged, added or deleted in a transaction come back."""
+    notes = Notes()
+    notes.add_note("Shopping", "Buy milk", "groceries")
+    notes.add_note("Work", "Call Bob", "office")
+    notes.mark_clean()
+    assert notes.search_by_tag("office")[0].topic == "Work"
+
+    notes.begin()
+    notes.edit_note("Shopping", "Buy bread")
+    notes.add_tag("Shopping", "urgent")
+    notes.delete_note("Work")
+    notes.add_note("Travel", "Book tickets")
+    notes.rollback()
+
+    assert [note.to_dict() for note in notes] == [
+        {"topic": "Shopping", "content": "Buy milk", "tags": ["groceries"]},
+        {"topic": "Work", "content": "Call Bob", "tags": ["office"]},
+    ]
+    assert not notes.is_dirty
+    assert notes.search_by_tag("urgent") == []
+    assert [note.topic for note in notes.find_text_in_notes("milk")] == ["Shopping"]
+
+
+def test_coordinator_saves_once_on_commit() -> None:
+    """Nothing is saved inside a transaction; commit saves both stores once."""
+    book, notes = sample_book(), Notes()
+    saves = []
+    book.save_to_storage = notes.save_to_storage = lambda silent=False: saves.append(1) or True
+    coordinator = SaveCoordinator(book, notes)
+
+    coordinator.begin()
+    book.create_contact("Bob", "0502222222")
+    notes.add_note("Shopping", "Buy milk")
+    coordinator.schedule()
+    coordinator.save()
+    assert saves == []
+
+    coordinator.commit()
+    assert len(saves) == 2
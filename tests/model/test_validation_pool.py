@@ -0,0 +1,120 @@
+"""
+Unit tests for validating contact records in a process pool.
+"""
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src import data_storage
+from src.model import validation_pool
+from src.model.contact_book import ContactBook
+from src.model.validation_pool import validate_contacts
+
+
+def sample_records() -> list[dict]:
+    records = []
+    for i in range(40):
+        records.append({
+            "name": f"Contact {i}",
+            "phones": [f"050{i:07d}"] if i % 7 else ["12345"],
+            # Padded emails are valid but not canonical: the workers send them back.
+            "emails": [f" c{i}@example.com " if i % 3 else f"c{i}@example.com"],
+            "addresses": ["Main St, 1"] if i % 2 else [],
+            "birthday": f"{i % 28 + 1:02d}.{i % 12 + 1:02d}.1990" if i % 5 else "31.02.1990",
+        })
+    return records
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    """Several chunks even for a few records."""
+    monkeypatch.setattr(data_storage, "VALIDATION_CHUNK", 4)
+
+
+def test_pool_matches_serial_validation() -> None:
+    """Both paths accept and reject the same records, in order, with the same messages."""
+    items = list(enumerate(sample_records()))
+
+    def outcome(workers: int) -> list:
+        return [
+            (tag, contact.to_dict() if contact else None, error)
+            for tag, contact, error in validate_contacts(items, workers=workers)
+        ]
+
+    serial = outcome(1)
+    assert serial == outcome(2)
+    assert [tag for tag, contact, _ in serial if contact is None] == [0, 5, 7, 10, 14, 15, 20, 21, 25, 28, 30, 35]
+    assert serial[1][1]["emails"] == ["c1@example.com"]
+
+
+def test_pooled_load_uses_the_pool(monkeypatch, capsys) -> None:
+    """A book loaded through the pool ("--verify") equals one validated in this process."""
+    records = sample_records()
+    monkeypatch.setattr(data_storage, "VALIDATION_WORKERS", 2)
+    serial = ContactBook.from_records(records)
+    serial_output = capsys.readouterr().out
+
+    monkeypatch.setattr(data_storage, "POOLED_LOAD", True)
+    pooled = ContactBook.from_records(records)
+
+    assert pooled.to_dict() == serial.to_dict()
+    assert capsys.readouterr().out == serial_output
+    assert serial_output.count("[WARNING]") == 12
+
+
+class StartFailure:
+    """A pool that cannot start, e.g. without permission to create semaphores."""
+
+    def __init__(self, *args, **kwargs):
+        raise PermissionError("Operation not permitted")
+
+
+class BrokenPool:
+    """A pool whose workers die, e.g. killed for running out of memory."""
+
+    def __init__(self, *args, **kwargs):
+        self.submitted = 0
+
+    def submit(self, fn, records):
+        self.submitted += 1
+        if self.submitted > 3:
+            raise BrokenProcessPool("A child process terminated abruptly")
+        future = Future()
+        if self.submitted == 1:
+            future.set_result(validation_pool.validate_records(records))
+        else:
+            future.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+@pytest.mark.parametrize("pool", [StartFailure, BrokenPool])
+def test_a_failing_pool_falls_back_to_serial_validation(pool, monkeypatch, capsys) -> None:
+    """Records are still validated, in this process, when the pool fails."""
+    items = list(enumerate(sample_records()))
+    serial = [(tag, contact and contact.to_dict(), error) for tag, contact, error in validate_contacts(items, workers=1)]
+    monkeypatch.setattr(validation_pool, "ProcessPoolExecutor", pool)
+
+    pooled = [(tag, contact and contact.to_dict(), error) for tag, contact, error in validate_contacts(items, workers=2)]
+
+    assert pooled == serial
+    assert capsys.readouterr().out.count("Validating contacts without worker processes") == 1
+
+
+def test_startup_load_never_starts_a_pool(storage_home, monkeypatch) -> None:
+    """A v1 snapshot of many chunks is validated in this process on a normal start."""
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started")
+
+    monkeypatch.setattr(validation_pool, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(data_storage, "VALIDATION_WORKERS", 2)
+    records = sample_records()
+    book = ContactBook.from_records(records)
+    assert book.save_to_storage(silent=True)
+
+    loaded = ContactBook.load_from_storage()
+
+    assert loaded.to_dict() == book.to_dict()
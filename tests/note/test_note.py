@@ -1,4 +1,6 @@
-from src.model.note import Notes
+import pytest
+
+from src.model.note import NoteEntity, Notes
 
 
 def test_notes() -> None:
@@ -36,4 +38,121 @@ def test_notes() -> None:
     notes.delete_tags("Workout", "fitness,  evening ")
     notes.delete_note("Shopping")
     print("\nAfter Deleting Fitness, evening Tag from Workout Note and Deleting Shopping Note:")
-    print(notes)
\ No newline at end of file
+    print(notes)
+
+def test_text_search_follows_note_changes() -> None:
+    """Text search keeps substring semantics as notes are added, edited and deleted."""
+    notes = Notes()
+    notes.add_note("Shopping", "Buy milk and eggs")
+    notes.add_note("Workout", "Go for a run")
+    assert [note.topic for note in notes.find_text_in_notes("  MILK ")] == ["Shopping"]
+
+    notes.add_note("Dairy", "Milkshake recipe")
+    notes.edit_note("Shopping", "Buy bread")
+    notes.edit_note("Workout", "Run, then drink milk")
+    assert [note.topic for note in notes.find_text_in_notes("milk")] == ["Workout", "Dairy"]
+
+    notes.delete_note("Dairy")
+    assert [note.topic for note in notes.find_text_in_notes("milk")] == ["Workout"]
+    assert [note.topic for note in notes.find_text_in_notes("hop")] == ["Shopping"]
+    assert [note.topic for note in notes.find_text_in_notes("n,")] == ["Workout"]
+    assert notes.find_text_in_notes("run then") == []
+
+
+def test_tag_queries_follow_tag_changes() -> None:
+    """Boolean tag queries see tags added, renamed and deleted after the first search."""
+    notes = Notes()
+    notes.add_note("Report", "Quarterly numbers", "work, urgent")
+    notes.add_note("Garden", "Plant tomatoes", "home")
+    notes.add_note("Slides", "Prepare the deck", "work")
+    assert [note.topic for note in notes.search_by_tag("WORK")] == ["Report", "Slides"]
+
+    notes.add_tag("Slides", "done")
+    notes.edit_tag("Garden", "home", "weekend plans")
+    notes.delete_tags("Report", "urgent")
+    notes.delete_note("Slides")
+    notes.add_note("Slides", "Prepare the deck again", "work")
+
+    def topics(query: str) -> list[str]:
+        return [note.topic for note in notes.search_by_tag(query)]
+
+    assert topics("work and not done") == ["Report", "Slides"]
+    assert topics("weekend plans, urgent") == ["Garden"]
+    assert topics("work and not urgent or weekend plans") == ["Report", "Garden", "Slides"]
+    assert topics("not work") == ["Garden"]
+    assert topics("done or home") == []
+
+
+def test_malformed_tag_query_is_rejected() -> None:
+    """Dangling operators in a tag query raise ValueError."""
+    notes = Notes()
+    notes.add_note("Report", "Quarterly numbers", "work")
+
+    with pytest.raises(ValueError):
+        notes.search_by_tag("work and")
+    with pytest.raises(ValueError):
+        notes.search_by_tag("work not urgent")
+
+
+def test_topic_lookup_keeps_list_semantics() -> None:
+    """Deleting by topic keeps list order, and direct list edits stay visible."""
+    notes = Notes()
+    for topic in ("A", "B", "C", "D"):
+        notes.add_note(topic, f"note {topic}")
+
+    notes.delete_note("B")
+    notes.delete_note("D")
+    notes.add_note("B", "again")
+    assert [note.topic for note in notes] == ["A", "C", "B"]
+    assert len(notes) == 3
+    assert notes[1].topic == "C"
+
+    notes.append(NoteEntity("E", "appended directly"))
+    notes.remove(notes[0])
+    assert notes.find_note_by_topic("E").content == "appended directly"
+    assert notes.find_note_by_topic("A") is None
+    assert [note["topic"] for note in notes.to_payload()] == ["C", "B", "E"]
+    assert [note.topic for note in notes.find_text_in_notes("directly")] == ["E"]
+
+
+def test_topic_map_is_kept_with_repeated_topics() -> None:
+    """Loaded notes sharing a topic do not make every lookup rebuild the map."""
+    notes = Notes.from_payload([
+        {"topic": "A", "content": "first"},
+        {"topic": "A", "content": "second"},
+        {"topic": "B", "content": "other"},
+    ])
+    assert notes.find_note_by_topic("A").content == "first"
+    topics = notes._topics()
+    assert notes.find_note_by_topic("B").content == "other"
+    assert notes._topics() is topics
+
+    notes.add_note("C", "added")
+    notes.delete_note("B")
+    assert notes._topics() is topics
+    assert [note.topic for note in notes] == ["A", "A", "C"]
+    assert notes._topics() is topics
+    assert notes.find_note_by_topic("C").content == "added"
+
+def test_sorted_view_follows_changes_and_pages() -> None:
+    """Sorting by tag reflects later changes and supports secondary keys and pages."""
+    notes = Notes()
+    notes.add_note("Zoo", "long content here", "b")
+    notes.add_note("Apple", "short", "b")
+    notes.add_note("Plain", "no tags")
+    assert [note.topic for note in notes.sort_by_tag()] == ["Plain", "Zoo", "Apple"]
+    assert [note.topic for note in notes.sort_by_tag("topic")] == ["Plain", "Apple", "Zoo"]
+    assert [note.topic for note in notes.sort_by_tag("length")] == ["Plain", "Apple", "Zoo"]
+
+    notes.add_tag("Plain", "c")
+    notes.edit_note("Zoo", "tiny")
+    notes.edit_tag("Apple", "b", "a")
+    notes.add_note("Mid", "m", "b")
+    assert [note.topic for note in notes.sort_by_tag()] == ["Apple", "Zoo", "Mid", "Plain"]
+    assert [note.topic for note in notes.sort_by_tag("length")] == ["Apple", "Mid", "Zoo", "Plain"]
+
+    notes.delete_note("Zoo")
+    assert [note.topic for note in notes.sort_by_tag("topic", page=2, page_size=2)] == ["Plain"]
+    assert notes.sort_by_tag(page=3, page_size=2) == []
+    with pytest.raises(ValueError):
+        notes.sort_by_tag("colour")
@@ -126,3 +126,18 @@ def test_parse_command_with_case_insensitivity() -> None:
 
     assert command.name == "CHANGE-EMAIL"
     assert command.args == ["A2B.CO", "C@B.CO"]
+
+
+@pytest.mark.parametrize("input_line, expected_args", [
+    ("add-note topic'-1 x'y", ["topic-1 xy"]),
+    ("add-note '' \"\" topic", ["topic"]),
+    ("add-note \"it's\"'\"ok\"' done", ["it's\"ok\"", "done"]),
+])
+def test_parse_quotes_inside_words(input_line: str, expected_args: list[str]) -> None:
+    """
+    Quoted parts join the text around them into one argument, and empty quotes
+    produce no argument.
+    """
+    command = parse(input_line)
+
+    assert command.args == expected_args
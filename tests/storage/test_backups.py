@@ -0,0 +1,72 @@
+"""
+Unit tests for the backup generations and fsync policies of `DataStorage`.
+"""
+import json
+import os
+
+import pytest
+
+from src import data_storage
+from src.model.note import Notes
+
+
+@pytest.fixture(autouse=True)
+def two_backups(storage_home, monkeypatch):
+    """Keeps two backup generations in a temporary storage folder."""
+    monkeypatch.setattr(data_storage, "BACKUP_GENERATIONS", 2)
+
+
+def save_notes(*topics: str) -> Notes:
+    notes = Notes()
+    for topic in topics:
+        notes.add_note(topic, "content")
+    assert notes.save_to_storage(silent=True)
+    return notes
+
+
+def saved_topics(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        return [note["topic"] for note in json.load(f)["data"]]
+
+
+def test_saves_rotate_backup_generations() -> None:
+    """Each save keeps the replaced snapshot; only the configured number is retained."""
+    for count in range(1, 5):
+        save_notes(*(f"Note {i}" for i in range(count)))
+
+    storage = data_storage.DataStorage(data_storage.NOTES_FILE)
+    assert storage.backup_files() == [storage.backup_path(1), storage.backup_path(2)]
+    assert not os.path.exists(storage.backup_path(3))
+    assert len(saved_topics(storage.filename)) == 4
+    assert len(saved_topics(storage.backup_path(1))) == 3
+    assert len(saved_topics(storage.backup_path(2))) == 2
+
+
+def test_load_uses_newest_valid_generation() -> None:
+    """A damaged main file and newest backup fall back to the next generation."""
+    for count in range(1, 4):
+        save_notes(*(f"Note {i}" for i in range(count)))
+    storage = data_storage.DataStorage(data_storage.NOTES_FILE)
+    for path in (storage.filename, storage.backup_path(1)):
+        # Replaced, not truncated: the backups are hard links of older snapshots.
+        os.remove(path)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"version": 1, "data": [')
+
+    loaded = Notes.load_from_storage()
+
+    assert [note.topic for note in loaded] == ["Note 0"]
+    assert saved_topics(storage.filename) == ["Note 0"]
+
+
+@pytest.mark.parametrize("policy, expected", [("none", 0), ("file", 1), ("file+dir", 2)])
+def test_fsync_policy(monkeypatch, policy, expected) -> None:
+    """The fsync policy decides whether the file and its folder are synced."""
+    save_notes("First")
+    calls = []
+    monkeypatch.setattr(data_storage, "FSYNC_POLICY", policy)
+    monkeypatch.setattr(os, "fsync", calls.append)
+
+    save_notes("First", "Second")
+
+    assert len(calls) == expected
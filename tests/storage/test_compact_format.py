@@ -0,0 +1,208 @@
+"""
+Unit tests for the compact snapshot format of `DataStorage`.
+"""
+import json
+import os
+import zlib
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.model.note import Notes
+
+
+@pytest.fixture(autouse=True)
+def compact_snapshots(storage_home, monkeypatch):
+    """Writes compact snapshots to a temporary storage folder."""
+    monkeypatch.setattr(data_storage, "SNAPSHOT_FORMAT", "compact")
+
+
+def storage_path(storage_home, filename: str) -> str:
+    return os.path.join(storage_home, filename)
+
+
+def make_book() -> ContactBook:
+    book = ContactBook.load_from_storage()
+    for i in range(20):
+        book.create_contact(f"Contact {i}", f"050{i:07d}")
+        book[f"contact {i}"].add_email(f"c{i}@example.com")
+    book["contact 3"].set_birthday("12.03.1978")
+    return book
+
+
+def test_compact_snapshot_round_trip(storage_home) -> None:
+    """Compact snapshots load back to the same contacts and notes."""
+    book = make_book()
+    assert book.save_to_storage(silent=True)
+    notes = Notes.load_from_storage()
+    notes.add_note("Shopping", "Buy milk", "groceries, fruits")
+    assert notes.save_to_storage(silent=True)
+
+    with open(storage_path(storage_home, data_storage.CONTACTS_FILE), encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    assert header["version"] == 2
+    assert header["count"] == 20
+
+    assert ContactBook.load_from_storage().to_dict() == book.to_dict()
+    assert Notes.load_from_storage().to_payload() == notes.to_payload()
+    assert data_storage.DataStorage(data_storage.CONTACTS_FILE).load_data()["data"] == book.to_dict()
+
+
+def test_conversion_to_and_from_json(storage_home) -> None:
+    """Converting keeps the data, and the compact file is smaller than the v1 JSON."""
+    book = make_book()
+    book.save_to_storage(silent=True)
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    compact_size = os.path.getsize(path)
+
+    assert data_storage.DataStorage(data_storage.CONTACTS_FILE).convert("json")
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["data"] == book.to_dict()
+    assert os.path.getsize(path) > compact_size
+
+    assert data_storage.DataStorage(data_storage.CONTACTS_FILE).convert("compact")
+    assert os.path.getsize(path) == compact_size
+    assert ContactBook.load_from_storage().to_dict() == book.to_dict()
+
+
+def test_truncated_compact_snapshot_uses_backup(storage_home) -> None:
+    """A compact file missing records is detected and restored from the backup."""
+    book = make_book()
+    book.save_to_storage(silent=True)
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    with open(path + ".bak", "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    with open(path, "w", encoding="utf-8") as f:
+        # The header and 17 of the 20 records, without the index block.
+        f.writelines(lines[:18])
+
+    assert ContactBook.load_from_storage().to_dict() == book.to_dict()
+
+
+def test_trusted_load_falls_back_on_checksum_mismatch(storage_home, capsys) -> None:
+    """Records of a file without line checksums are validated again on a mismatch."""
+    book = make_book()
+    book.save_to_storage(silent=True)
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        lines = [line.rsplit("\t", 1)[0] + "\n" for line in f if line.startswith("[")]
+    # A file written before line checksums and the index block were added.
+    del header["line_checksums"]
+    del header["index"]
+    header["checksum"] = zlib.crc32("".join(lines).encode("utf-8"))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        f.write("".join(lines).replace("c5@example.com", "not-an-email"))
+
+    loaded = ContactBook.load_from_storage()
+
+    output = capsys.readouterr().out
+    assert "Checksum mismatch" in output
+    assert "Failed to load contact: Contact 5" in output
+    assert "contact 5" not in loaded
+    assert len(loaded) == 19
+
+
+def test_trusted_contacts_match_validated_ones(storage_home, monkeypatch) -> None:
+    """Trusted and fully validated loads build the same contacts."""
+    book = make_book()
+    book.save_to_storage(silent=True)
+
+    trusted = ContactBook.load_from_storage()
+    monkeypatch.setattr(data_storage, "TRUSTED_LOAD", False)
+    validated = ContactBook.load_from_storage()
+
+    assert trusted.to_dict() == validated.to_dict() == book.to_dict()
+    assert trusted["contact 3"].birthday.value == validated["contact 3"].birthday.value
+    assert trusted.check_indexes() == []
+
+
+def test_damaged_records_are_salvaged(storage_home, capsys) -> None:
+    """Records failing their line checksum are skipped; the intact ones are kept."""
+    book = make_book()
+    book.save_to_storage(silent=True)
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(text.replace("c5@example.com", "c5@example.org").replace('"Contact 7"', '"Contact 7'))
+    os.replace(path + ".tmp", path)
+
+    problems = data_storage.DataStorage(data_storage.CONTACTS_FILE).verify()
+    loaded = ContactBook.load_from_storage()
+
+    # The removed quote also shifts the index block away from its offsets.
+    assert problems[:2] == ["Line 7 is damaged.", "Line 9 is damaged."]
+    assert "Index of rows is damaged." in problems
+    assert "Skipped 2 damaged record(s)" in capsys.readouterr().out
+    assert len(loaded) == 18
+    assert "contact 5" not in loaded and "contact 7" not in loaded
+    assert loaded["contact 6"].to_dict() == book["contact 6"].to_dict()
+    assert os.path.exists(path + data_storage.DAMAGED_SUFFIX)
+
+
+def test_intact_file_verifies_clean(storage_home) -> None:
+    """An intact compact file has no problems; a v1 JSON file is not checked."""
+    make_book().save_to_storage(silent=True)
+
+    assert data_storage.DataStorage(data_storage.CONTACTS_FILE).verify() == []
+    assert data_storage.DataStorage(data_storage.CONTACTS_FILE).convert("json")
+    assert data_storage.DataStorage(data_storage.CONTACTS_FILE).verify() == []
+
+
+def test_verify_mode_reports_without_repairing(storage_home, monkeypatch, capsys) -> None:
+    """Without REPAIR_ON_LOAD a damaged main file is reported, not replaced or copied."""
+    book = make_book()
+    book.save_to_storage(silent=True)
+    book.save_to_storage(silent=True)
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{ not json")
+    monkeypatch.setattr(data_storage, "REPAIR_ON_LOAD", False)
+
+    loaded = ContactBook.load_from_storage()
+
+    assert len(loaded) == len(book)
+    assert "is damaged" in capsys.readouterr().out
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "{ not json"
+    assert not os.path.exists(path + data_storage.DAMAGED_SUFFIX)
+
+
+def test_every_load_path_keeps_a_damaged_main_file(storage_home) -> None:
+    """Full loads, as used by conversions, keep a damaged main file like record loads do."""
+    make_book().save_to_storage(silent=True)
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text.replace("c5@example.com", "c5@example.org"))
+
+    data = data_storage.DataStorage(data_storage.CONTACTS_FILE).load_data()
+
+    assert len(data["data"]) == 19
+    assert os.path.exists(path + data_storage.DAMAGED_SUFFIX)
+
+
+@pytest.mark.parametrize("trailing_newline", [False, True])
+def test_minified_v1_file_is_not_taken_for_compact(storage_home, monkeypatch, trailing_newline) -> None:
+    """A v1 file written without indentation starts like a compact header but loads as v1."""
+    monkeypatch.setattr(data_storage, "SNAPSHOT_FORMAT", "json")
+    book = make_book()
+    path = storage_path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "data": book.to_dict()}, f)
+        if trailing_newline:
+            f.write("\n")
+
+    storage = data_storage.DataStorage(data_storage.CONTACTS_FILE)
+    assert len(storage.load_data()["data"]) == 20
+    loaded = storage.load_records(ContactBook.from_records)
+    assert loaded.to_dict() == book.to_dict()
+    monkeypatch.setattr(data_storage, "LAZY_LOAD", True)
+    assert ContactBook.load_from_storage().to_dict() == book.to_dict()
+    assert not os.path.exists(path + data_storage.DAMAGED_SUFFIX)
@@ -0,0 +1,114 @@
+"""
+Unit tests for sessions sharing the data files: locking, change detection
+and the merge of other sessions' changes.
+"""
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.model.note import Notes
+from src.storage.file_lock import FileLock
+
+
+pytestmark = pytest.mark.usefixtures("storage_home")
+
+
+@pytest.fixture(params=["snapshot", "journal"])
+def storage_mode(request, monkeypatch):
+    monkeypatch.setattr(data_storage, "STORAGE_MODE", request.param)
+    return request.param
+
+
+def test_saves_merge_changes_of_other_sessions(storage_mode) -> None:
+    """Two sessions editing different contacts keep both edits."""
+    first = ContactBook.load_from_storage()
+    second = ContactBook.load_from_storage()
+
+    first.create_contact("John", "0501234567")
+    assert first.save_to_storage(silent=True)
+    second.create_contact("Jane", "0507654321")
+    assert second.save_to_storage(silent=True)
+
+    assert sorted(ContactBook.load_from_storage()) == ["jane", "john"]
+    assert sorted(second) == ["jane", "john"]
+
+
+def test_refresh_picks_up_other_sessions(storage_mode) -> None:
+    """A clean session sees what another one saved; an unchanged one does nothing."""
+    first = Notes.load_from_storage()
+    second = Notes.load_from_storage()
+    assert not second.refresh_from_storage()
+
+    first.add_note("Shopping", "Buy milk", "groceries")
+    assert first.save_to_storage(silent=True)
+    first.add_tag("Shopping", "urgent")
+    assert first.save_to_storage(silent=True)
+
+    assert second.refresh_from_storage()
+    assert second.find_note_by_topic("Shopping").tags == ["groceries", "urgent"]
+    assert not second.is_dirty
+    assert not second.refresh_from_storage()
+
+
+def test_conflicting_change_is_dropped(capsys) -> None:
+    """A change to a contact another session deleted is reported, not saved."""
+    setup = ContactBook.load_from_storage()
+    setup.create_contact("John", "0501234567")
+    setup.save_to_storage(silent=True)
+    first = ContactBook.load_from_storage()
+    second = ContactBook.load_from_storage()
+
+    first.delete_contact("John")
+    first.save_to_storage(silent=True)
+    second["john"].add_email("john@example.com")
+    second.save_to_storage(silent=True)
+
+    assert "Failed to replay change 'add_email'" in capsys.readouterr().out
+    assert len(ContactBook.load_from_storage()) == 0
+
+
+def test_exclusive_lock_blocks_other_holders(storage_home) -> None:
+    """Shared holders coexist; an exclusive one waits until they are gone."""
+    path = os.path.join(storage_home, "data.lock")
+    reader, other_reader, writer = FileLock(path), FileLock(path), FileLock(path)
+    acquired = threading.Event()
+
+    def write() -> None:
+        with writer.exclusive():
+            acquired.set()
+
+    with reader.shared(), other_reader.shared():
+        thread = threading.Thread(target=write)
+        thread.start()
+        assert not acquired.wait(0.2)
+    thread.join(5)
+    assert acquired.is_set()
+
+
+def add_contacts(home: str, worker: int, count: int) -> None:
+    """Run a session in another process, saving after every new contact."""
+    os.environ["HOME"] = home
+    book = ContactBook.load_from_storage()
+    for i in range(count):
+        book.create_contact(f"Worker {worker} contact {i}", f"050{worker:02d}{i:05d}")
+        assert book.save_to_storage(silent=True)
+
+
+def test_concurrent_processes_lose_no_edits(tmp_path) -> None:
+    """Sessions in several processes saving at once keep every contact."""
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=add_contacts, args=(str(tmp_path), worker, 10))
+        for worker in range(4)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    assert len(ContactBook.load_from_storage()) == 40
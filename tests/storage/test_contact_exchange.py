@@ -0,0 +1,112 @@
+"""
+Unit tests for the CSV and vCard import and export of contacts.
+"""
+import io
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.storage.contact_exchange import detect_format, export_contacts, import_contacts
+
+
+def sample_book() -> ContactBook:
+    book = ContactBook()
+    _, john = book.create_contact("John Smith", "0501234567")
+    john.add_phone("0677654321")
+    john.add_email("john@example.com")
+    john.add_address("Hospital St, 15; Apt 4B")
+    john.set_birthday("15.01.1990")
+    book.create_contact("Jane", "0507654321")
+    return book
+
+
+@pytest.mark.parametrize("fmt", ["csv", "vcard"])
+def test_export_and_import_round_trip(fmt: str, monkeypatch) -> None:
+    """Exported contacts import back unchanged, across several chunks."""
+    monkeypatch.setattr(data_storage, "VALIDATION_CHUNK", 1)
+    book = sample_book()
+    file = io.StringIO()
+    assert export_contacts(book.values(), file, fmt) == 2
+
+    file.seek(0)
+    imported = ContactBook()
+    result = import_contacts(imported, file, fmt)
+
+    assert (result.created, result.updated, result.failed) == (2, 0, 0)
+    assert imported.to_dict() == book.to_dict()
+
+
+def test_rejected_rows_are_reported_with_line_numbers() -> None:
+    """Invalid rows are reported and skipped; the valid ones are imported."""
+    file = io.StringIO(
+        "Name,Phones,Emails,Birthday\n"
+        "John,0501234567; 0677654321,john@example.com,15.01.1990\n"
+        "Bad phone,12345,,\n"
+        "Jane,0507654321,not-an-email,\n"
+        ",0501112233,,\n"
+    )
+    errors = []
+    book = ContactBook()
+
+    result = import_contacts(book, file, "csv", lambda line, message: errors.append(line))
+
+    assert (result.created, result.failed) == (1, 3)
+    assert book["john"].to_dict()["phones"] == ["0501234567", "0677654321"]
+    assert errors == [3, 4, 5]
+
+
+def test_import_merges_into_existing_contacts() -> None:
+    """A known name gains the missing values; values it has are kept once."""
+    book = sample_book()
+    book.mark_clean()
+    file = io.StringIO(
+        "BEGIN:VCARD\r\n"
+        "VERSION:3.0\r\n"
+        "N:Smith;John;;;\r\n"
+        "FN:john smith\r\n"
+        "TEL;TYPE=cell:0501234567\r\n"
+        "item1.EMAIL;TYPE=work:john.smith@exam\r\n"
+        " ple.com\r\n"
+        "ADR;TYPE=home:;;Main St\\, 1;Kyiv;;01001;Ukraine\r\n"
+        "END:VCARD\r\n"
+    )
+
+    result = import_contacts(book, file, "vcard")
+
+    assert (result.created, result.updated) == (0, 1)
+    john = book["john smith"].to_dict()
+    assert john["phones"] == ["0501234567", "0677654321"]
+    assert john["emails"] == ["john@example.com", "john.smith@example.com"]
+    assert john["addresses"][-1] == "Main St, 1, Kyiv, 01001, Ukraine"
+    assert book.is_dirty
+
+
+def test_detect_format() -> None:
+    """The format comes from the argument or from the file extension."""
+    assert detect_format("contacts.VCF") == "vcard"
+    assert detect_format("contacts.txt", "CSV") == "csv"
+    with pytest.raises(ValueError):
+        detect_format("contacts.txt")
+    with pytest.raises(ValueError):
+        detect_format("contacts.csv", "xml")
+
+
+def test_failing_import_leaves_the_book_unchanged(tmp_path, monkeypatch) -> None:
+    """A file that cannot be read to its end imports nothing, even after several chunks."""
+    monkeypatch.setattr(data_storage, "VALIDATION_CHUNK", 100)
+    path = tmp_path / "contacts.csv"
+    rows = "".join(f"Contact {i},050{i:07d}\n" for i in range(5000))
+    path.write_bytes(b"Name,Phones\n" + rows.encode() + b"Broken \xff,0501234567\n")
+    book = sample_book()
+    book.mark_clean()
+    before = book.to_dict()
+
+    with open(path, encoding="utf-8", newline="") as file:
+        with pytest.raises(UnicodeDecodeError):
+            import_contacts(book, file, "csv")
+
+    assert book.to_dict() == before
+    assert not book.is_dirty
+    assert not book.in_transaction
+    assert book.check_indexes() == []
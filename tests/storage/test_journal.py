@@ -0,0 +1,109 @@
+"""
+Unit tests for the journal storage mode of `DataStorage`.
+"""
+import json
+import os
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.model.note import Notes
+
+
+@pytest.fixture(autouse=True)
+def journal_mode(storage_home, monkeypatch):
+    """Appends changes to journals in a temporary storage folder."""
+    monkeypatch.setattr(data_storage, "STORAGE_MODE", "journal")
+
+
+def storage_path(storage_home, filename: str) -> str:
+    return os.path.join(storage_home, filename)
+
+
+def test_changes_are_appended_and_replayed(storage_home) -> None:
+    """Each save appends compact records; loading replays them."""
+    book = ContactBook.load_from_storage()
+    book.create_contact("John", "0501234567")
+    book["john"].add_email("john@example.com")
+    assert book.save_to_storage(silent=True)
+    book["john"].update_phone("0501234567", "0679876543")
+    assert book.save_to_storage(silent=True)
+
+    assert not os.path.exists(storage_path(storage_home, data_storage.CONTACTS_FILE))
+    journal = storage_path(storage_home, data_storage.CONTACTS_FILE + data_storage.JOURNAL_SUFFIX)
+    with open(journal, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["op"] for r in records] == ["create_contact", "add_email", "update_phone"]
+    assert [r["s"] for r in records] == [1, 2, 3]
+
+    loaded = ContactBook.load_from_storage()
+    assert loaded.to_dict() == book.to_dict()
+    assert not loaded.is_dirty
+
+
+def test_torn_last_record_is_ignored(storage_home) -> None:
+    """A partially written record (crash during append) does not break loading."""
+    notes = Notes.load_from_storage()
+    notes.add_note("Shopping", "Buy milk", "groceries")
+    notes.save_to_storage(silent=True)
+
+    journal = storage_path(storage_home, data_storage.NOTES_FILE + data_storage.JOURNAL_SUFFIX)
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"s":2,"op":"edit_no')
+
+    loaded = Notes.load_from_storage()
+    assert loaded.to_payload() == notes.to_payload()
+
+
+def test_compaction_writes_snapshot_and_keeps_later_changes(storage_home, monkeypatch) -> None:
+    """Past the threshold the snapshot is rewritten and the old journal dropped."""
+    monkeypatch.setattr(data_storage, "JOURNAL_COMPACT_BYTES", 1)
+    notes = Notes.load_from_storage()
+    notes.add_note("Shopping", "Buy milk", "groceries")
+    notes.save_to_storage(silent=True)
+    notes._storage.wait_for_compaction()
+
+    snapshot = storage_path(storage_home, data_storage.NOTES_FILE)
+    with open(snapshot, encoding="utf-8") as f:
+        assert json.load(f)["seq"] == 1
+    assert not os.path.exists(snapshot + data_storage.JOURNAL_SUFFIX)
+
+    monkeypatch.setattr(data_storage, "JOURNAL_COMPACT_BYTES", 1024 * 1024)
+    notes.add_tag("Shopping", "urgent")
+    notes.save_to_storage(silent=True)
+
+    loaded = Notes.load_from_storage()
+    assert loaded.to_payload() == notes.to_payload()
+
+
+def test_journal_without_snapshot_is_not_reported_missing(storage_home, capsys) -> None:
+    """Before the first compaction the journal holds the data; nothing is reported lost."""
+    book = ContactBook.load_from_storage()
+    book.create_contact("John", "0501234567")
+    assert book.save_to_storage(silent=True)
+    other = ContactBook.load_from_storage()
+    capsys.readouterr()
+
+    loaded = ContactBook.load_from_storage()
+    other.create_contact("Jane", "0507654321")
+    book["john"].add_email("john@example.com")
+    assert book.save_to_storage(silent=True)
+    # Unsaved changes make the refresh reload the book and replay them.
+    assert other.refresh_from_storage()
+
+    output = capsys.readouterr().out
+    assert "not found" not in output
+    assert list(loaded) == ["john"]
+    assert sorted(other) == ["jane", "john"]
+
+
+def test_snapshot_mode_writes_plain_v1_files(storage_home, monkeypatch) -> None:
+    """Only a snapshot that a journal continues carries a sequence number."""
+    monkeypatch.setattr(data_storage, "STORAGE_MODE", "snapshot")
+    notes = Notes.load_from_storage()
+    notes.add_note("plan", "Buy milk")
+    assert notes.save_to_storage(silent=True)
+
+    with open(storage_path(storage_home, data_storage.NOTES_FILE), encoding="utf-8") as f:
+        assert sorted(json.load(f)) == ["data", "version"]
@@ -0,0 +1,107 @@
+"""
+Unit tests for the streaming snapshot reader used by `DataStorage.load_records`.
+"""
+import io
+import json
+import os
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.model.note import Notes
+from src.storage import json_stream
+from src.storage.json_stream import iter_snapshot_records
+
+
+@pytest.fixture(autouse=True)
+def tiny_chunks(storage_home, monkeypatch):
+    """Reads a temporary storage folder in tiny chunks."""
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", 7)
+
+
+def test_records_are_read_one_at_a_time() -> None:
+    """Records split across many chunks decode like a full json.load."""
+    snapshot = {
+        "version": 1,
+        "data": {"john": {"name": "John", "phones": ["0501234567"], "note": "ü \\\" }"}},
+        "seq": 12345,
+    }
+    header = {}
+
+    records = list(iter_snapshot_records(io.StringIO(json.dumps(snapshot, indent=4)), header))
+
+    assert records == list(snapshot["data"].values())
+    assert header == {"version": 1, "seq": 12345}
+    assert list(iter_snapshot_records(io.StringIO('{"version": 1, "data": []}'), {})) == []
+
+
+def test_damaged_snapshot_falls_back_to_backup(storage_home) -> None:
+    """A truncated main file is replaced by the backup, and the store loads from it."""
+    notes = Notes()
+    notes.add_note("Shopping", "Buy milk", "groceries")
+    notes.add_note("Workout", "Run", "fitness")
+    assert notes.save_to_storage(silent=True)
+
+    path = os.path.join(storage_home, data_storage.NOTES_FILE)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path + ".bak", "w", encoding="utf-8") as f:
+        f.write(text)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text[:len(text) // 2])
+
+    loaded = Notes.load_from_storage()
+
+    assert loaded.to_payload() == notes.to_payload()
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["data"] == notes.to_payload()
+
+
+def test_version_mismatch_yields_empty_store(storage_home) -> None:
+    """A snapshot of another version is not loaded."""
+    path = os.path.join(storage_home, data_storage.CONTACTS_FILE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 99, "data": {"john": {"name": "John", "phones": []}}}, f)
+
+    assert len(ContactBook.load_from_storage()) == 0
+    assert os.path.exists(path + data_storage.DAMAGED_SUFFIX)
+
+
+def test_damaged_records_are_skipped_when_asked() -> None:
+    """Indented records that fail to decode are skipped up to the next record."""
+    snapshot = {"version": 1, "data": [{"title": f"Note {i}", "tags": ["a"]} for i in range(4)], "seq": 7}
+    text = json.dumps(snapshot, indent=4).replace('"Note 1"', '"Note 1').replace('"Note 3",', '"Note 3"')
+    header = {}
+    damaged = []
+
+    records = list(iter_snapshot_records(io.StringIO(text), header, damaged))
+
+    assert [record["title"] for record in records] == ["Note 0", "Note 2"]
+    assert damaged == [10, 22]
+    assert header == {"version": 1, "seq": 7}
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_snapshot_records(io.StringIO(text), {}))
+
+
+def test_damaged_v1_snapshot_keeps_intact_records(storage_home, capsys) -> None:
+    """One corrupt byte in a v1 file loses that record only, on every load path."""
+    book = ContactBook.load_from_storage()
+    for i in range(10):
+        book.create_contact(f"Contact {i}", f"050{i:07d}")
+    assert book.save_to_storage(silent=True)
+    path = os.path.join(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text.replace('"0500000004"', '"0500000004', 1))
+
+    data = data_storage.DataStorage(data_storage.CONTACTS_FILE).load_data()
+    loaded = ContactBook.load_from_storage()
+
+    assert "Skipped 1 damaged record(s)" in capsys.readouterr().out
+    assert sorted(data["data"]) == [f"Contact {i}" for i in range(10) if i != 4]
+    assert len(loaded) == 9 and "contact 4" not in loaded
+    assert loaded["contact 5"].to_dict() == book["contact 5"].to_dict()
+    assert os.path.exists(path + data_storage.DAMAGED_SUFFIX)
@@ -0,0 +1,147 @@
+"""
+Unit tests for lazy loading of memory-mapped compact contact snapshots.
+"""
+import json
+import pathlib
+import zlib
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.storage import mmap_source
+
+
+@pytest.fixture(autouse=True)
+def lazy_compact_snapshots(storage_home, monkeypatch):
+    """Loads compact snapshots lazily from a temporary storage folder."""
+    monkeypatch.setattr(data_storage, "SNAPSHOT_FORMAT", "compact")
+    monkeypatch.setattr(data_storage, "LAZY_LOAD", True)
+
+
+def save_book() -> ContactBook:
+    book = ContactBook.load_from_storage()
+    book.create_contact("John", "0501234567")
+    book["john"].add_email("John@Example.com")
+    book["john"].set_birthday("12.03.1978")
+    book.create_contact("Élodie \"Lo\"", "0671112233")
+    book["élodie \"lo\""].add_address("Main St, 1")
+    book.create_contact("Jane", "0631234567")
+    assert book.save_to_storage(silent=True)
+    return book
+
+
+def test_contacts_are_decoded_on_first_access() -> None:
+    """Only looked-up contacts are decoded; searches find the others."""
+    book = save_book()
+
+    loaded = ContactBook.load_from_storage()
+    assert not loaded.data
+    assert loaded._source.trusted
+    assert loaded["jane"].phones[0].value == "0631234567"
+    assert list(loaded.data) == ["jane"]
+
+    assert [c.name.value for c in loaded.find_contact_by_param("emails", "john@EXAMPLE.com")] == ["John"]
+    assert [c.name.value for c in loaded.find_contact_by_param("addresses", "Main St, 1")] == ['Élodie "Lo"']
+    assert loaded.find_contact_by_param("phones", "050123") == []
+    assert loaded.to_dict() == book.to_dict()
+
+
+def test_changes_on_a_lazy_book_are_saved() -> None:
+    """Edits, deletions and birthday queries work on a lazy book and survive a save."""
+    save_book()
+    loaded = ContactBook.load_from_storage()
+    loaded["john"].add_phone("0509998877")
+    loaded.delete_contact("Jane")
+    assert "jane" not in loaded
+    assert loaded.find_contact_by_param("birthday", "12.03.1978")[0].name.value == "John"
+    assert loaded.save_to_storage(silent=True)
+
+    reloaded = ContactBook.load_from_storage()
+    assert sorted(reloaded) == ["john", 'élodie "lo"']
+    assert [p.value for p in reloaded["john"].phones] == ["0501234567", "0509998877"]
+
+
+def test_json_snapshots_are_loaded_in_full(monkeypatch) -> None:
+    """Without a compact snapshot, lazy loading falls back to a full load."""
+    monkeypatch.setattr(data_storage, "SNAPSHOT_FORMAT", "json")
+    save_book()
+
+    loaded = ContactBook.load_from_storage()
+    assert len(loaded.data) == 3
+
+
+def test_birthday_lookups_do_not_scan_the_file(monkeypatch) -> None:
+    """Birthday queries are answered from the buckets built when opening."""
+    save_book()
+    loaded = ContactBook.load_from_storage()
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("the mapped file was scanned")
+
+    monkeypatch.setattr(mmap_source.re, "finditer", no_scan)
+    assert [c.name.value for c in loaded.find_contact_by_param("birthday", "12.03.1978")] == ["John"]
+    assert loaded.find_contact_by_param("birthday", "12.03.1979") == []
+    assert loaded._source.find_keys("birthday_day", (3, 12)) == ["john"]
+    assert loaded._source.find_keys("birthday_day", (3, 13)) == []
+
+
+def test_a_damaged_record_is_skipped_when_read(storage_home, capsys) -> None:
+    """A record that fails its line checksum is not trusted, the others load."""
+    save_book()
+    path = pathlib.Path(storage_home, data_storage.CONTACTS_FILE)
+    path.write_bytes(path.read_bytes().replace(b"0631234567", b"0631234568"))
+
+    loaded = ContactBook.load_from_storage()
+    assert loaded.get("jane") is None
+    assert "Skipping damaged contact record 'jane'" in capsys.readouterr().out
+    assert loaded["john"].phones[0].value == "0501234567"
+    assert sorted(loaded) == ["john", 'élodie "lo"']
+
+
+def test_opening_reads_the_index_instead_of_the_records(storage_home, monkeypatch) -> None:
+    """Keys, offsets and field searches come from the index block; rows carry no key column."""
+    book = save_book()
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("the records were scanned")
+
+    monkeypatch.setattr(mmap_source, "_scan_lines", no_scan)
+    monkeypatch.setattr(mmap_source.MmapContactSource, "_search", no_scan)
+    loaded = ContactBook.load_from_storage()
+
+    assert [c.name.value for c in loaded.find_contact_by_param("phones", "0631234567")] == ["Jane"]
+    assert [c.name.value for c in loaded.find_contact_by_param("emails", "JOHN@example.com")] == ["John"]
+    assert [c.name.value for c in loaded.find_contact_by_param("addresses", "Main St, 1")] == ['Élodie "Lo"']
+    assert loaded.find_contact_by_param("addresses", "main st, 1") == []
+    assert loaded.to_dict() == book.to_dict()
+
+    with open(pathlib.Path(storage_home, data_storage.CONTACTS_FILE), encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        row = json.loads(f.readline().rsplit("\t", 1)[0])
+    assert row[0] == "John" and len(row) == len(header["fields"])
+
+
+def test_files_without_an_index_are_scanned(storage_home) -> None:
+    """Snapshots written before the index block still open lazily."""
+    book = save_book()
+    path = pathlib.Path(storage_home, data_storage.CONTACTS_FILE)
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        rows = [json.loads(line.rsplit("\t", 1)[0]) for line in f if line.startswith("[")]
+    del header["index"], header["key_field"]
+    lines = []
+    for row in rows:
+        text = json.dumps([row[0], *row], ensure_ascii=False, separators=(",", ":"))
+        lines.append(f"{text}\t{zlib.crc32(text.encode('utf-8')):08x}\n")
+    header["checksum"] = zlib.crc32("".join(lines).encode("utf-8"))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, separators=(",", ":")) + "\n")
+        f.writelines(lines)
+
+    loaded = ContactBook.load_from_storage()
+
+    assert loaded._source is not None
+    assert [c.name.value for c in loaded.find_contact_by_param("phones", "0631234567")] == ["Jane"]
+    assert loaded._source.find_keys("birthday_day", (3, 12)) == ["john"]
+    assert loaded.to_dict() == book.to_dict()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the `SaveCoordinator`, which persists only changed stores.
+"""
+import time
+
+from src.model.note import Notes
+from src.storage.save_coordinator import SaveCoordinator
+
+
+class FakeStore:
+    """A store that records how many times it was saved."""
+
+    def __init__(self, is_dirty: bool):
+        self.is_dirty = is_dirty
+        self.saves = 0
+
+    def save_to_storage(self, silent: bool = False) -> bool:
+        self.saves += 1
+        self.is_dirty = False
+        return True
+
+
+def test_only_dirty_stores_are_saved() -> None:
+    """Clean stores are skipped, dirty ones are written exactly once."""
+    clean, dirty = FakeStore(False), FakeStore(True)
+    coordinator = SaveCoordinator(clean, dirty)
+
+    coordinator.save()
+    coordinator.save()
+
+    assert clean.saves == 0
+    assert dirty.saves == 1
+    assert not coordinator.has_changes
+
+
+def test_notes_track_only_real_changes() -> None:
+    """Searches keep the notes clean, edits mark them dirty."""
+    notes = Notes()
+    notes.add_note("Shopping", "Buy milk", "groceries")
+    notes.mark_clean()
+
+    notes.find_text_in_notes("milk")
+    notes.search_by_tag("groceries")
+    notes.edit_note("Unknown", "nothing")
+    assert not notes.is_dirty
+
+    notes.edit_note("Shopping", "Buy bread")
+    assert notes.is_dirty
+
+
+def test_debounced_saves_coalesce_in_the_background() -> None:
+    """Requests within the debounce window lead to one background save."""
+    store = FakeStore(True)
+    coordinator = SaveCoordinator(store, debounce=0.05)
+
+    for _ in range(3):
+        store.is_dirty = True
+        coordinator.schedule()
+    assert store.saves == 0
+
+    deadline = time.monotonic() + 2
+    while store.saves == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert store.saves == 1
+    coordinator.close()
+
+
+def test_close_flushes_pending_changes() -> None:
+    """Closing saves changes still waiting for the writer, then stops scheduling."""
+    store = FakeStore(True)
+    coordinator = SaveCoordinator(store, debounce=60)
+    coordinator.schedule()
+
+    assert coordinator.close()
+    assert store.saves == 1
+
+    store.is_dirty = True
+    coordinator.schedule()
+    assert coordinator.close()
+    assert store.saves == 2
+
+
+def test_zero_debounce_saves_synchronously() -> None:
+    """Without a debounce window every request saves right away."""
+    store = FakeStore(True)
+    coordinator = SaveCoordinator(store)
+
+    coordinator.schedule()
+
+    assert store.saves == 1
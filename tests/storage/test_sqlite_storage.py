@@ -0,0 +1,172 @@
+"""
+Unit tests for the SQLite storage backend and the lazy stores built on it.
+"""
+import sqlite3
+
+import pytest
+
+from src import data_storage
+from src.model.contact_book import ContactBook
+from src.model.history import History
+from src.model.note import Notes
+from src.storage.sqlite_storage import (
+    SqliteContactStorage,
+    SqliteNoteStorage,
+    migrate_json_to_sqlite,
+)
+
+
+pytestmark = pytest.mark.usefixtures("storage_home")
+
+
+def test_contacts_round_trip_and_lazy_lookup() -> None:
+    """Saved changes are readable by a new lazy book without loading everything."""
+    book = ContactBook.load_from_storage(SqliteContactStorage())
+    book.create_contact("John", "0501234567")
+    book.create_contact("Jane", "0671112233")
+    book["john"].add_email("john@example.com")
+    book["john"].set_birthday("12.03.1978")
+    book["jane"].update_phone("0671112233", "0679876543")
+    assert book.save_to_storage(silent=True)
+
+    loaded = ContactBook.load_from_storage(SqliteContactStorage())
+    assert not loaded.data
+
+    found = loaded.find_contact_by_param("phones", "0679876543")
+    assert [contact.name.value for contact in found] == ["Jane"]
+    assert list(loaded.data) == ["jane"]
+
+    found = loaded.find_contact_by_param("birthday", "12.03.1978")
+    assert [contact.name.value for contact in found] == ["John"]
+    assert loaded.to_dict() == book.to_dict()
+
+
+def test_unsaved_changes_win_over_the_database() -> None:
+    """Lookups on a lazy book reflect in-memory changes not saved yet."""
+    book = ContactBook.load_from_storage(SqliteContactStorage())
+    book.create_contact("John", "0501234567")
+    book.save_to_storage(silent=True)
+
+    book["john"].update_phone("0501234567", "0679876543")
+    assert book.find_contact_by_param("phones", "0501234567") == []
+
+    book.delete_contact("John")
+    assert "john" not in book
+    assert len(book) == 0
+
+
+def test_notes_tag_search_is_pushed_down() -> None:
+    """Tag search on unopened notes is answered by the database."""
+    notes = Notes.load_from_storage(SqliteNoteStorage())
+    notes.add_note("Shopping", "Buy milk", "groceries, Fruits")
+    notes.add_note("Workout", "Run", "fitness")
+    notes.edit_tag("Workout", "fitness", "sport")
+    assert notes.save_to_storage(silent=True)
+
+    loaded = Notes.load_from_storage(SqliteNoteStorage())
+    found = loaded.search_by_tag("FRUITS")
+    assert [note.topic for note in found] == ["Shopping"]
+    assert loaded._data is None
+    assert loaded.to_payload() == notes.to_payload()
+
+
+def test_note_topic_lookups_are_pushed_down(monkeypatch) -> None:
+    """Editing, deleting and adding notes by topic never reads every note."""
+    notes = Notes.load_from_storage(SqliteNoteStorage())
+    for topic in ("First", "Second", "Third"):
+        notes.add_note(topic, f"{topic} note", "plans")
+    assert notes.save_to_storage(silent=True)
+
+    loaded = Notes.load_from_storage(SqliteNoteStorage())
+    load_all = loaded._source.load_all
+    monkeypatch.setattr(loaded._source, "load_all", lambda: pytest.fail("read every note"))
+    loaded.edit_note("Second", "changed")
+    loaded.add_tag("Second", "urgent")
+    loaded.delete_note("First")
+    loaded.add_note("Fourth", "new", None)
+    loaded.begin()
+    loaded.delete_note("Third")
+    loaded.add_note("Fifth", "rolled back", None)
+    loaded.rollback()
+    assert loaded.find_note_by_topic("First") is None
+    assert loaded.find_note_by_topic("Second").content == "changed"
+    assert loaded.delete_note("Missing") == "Note with topic 'Missing' not found."
+    monkeypatch.setattr(loaded._source, "load_all", load_all)
+
+    assert [note.topic for note in loaded] == ["Second", "Third", "Fourth"]
+    assert loaded.save_to_storage(silent=True)
+    reloaded = Notes.load_from_storage(SqliteNoteStorage())
+    assert reloaded.to_payload() == loaded.to_payload()
+    assert reloaded.to_payload()[0]["tags"] == ["plans", "urgent"]
+
+
+def test_replaced_contact_keeps_its_place() -> None:
+    """Undoing a field removal rewrites the contact row in place."""
+    history = History()
+    book = ContactBook.load_from_storage(SqliteContactStorage())
+    history.attach("contacts", book)
+    for name in ("John", "Jane", "Bob"):
+        book.create_contact(name, "0501234567")
+    book["jane"].add_email("jane@example.com")
+    history.checkpoint()
+    book["jane"].remove_email("jane@example.com")
+    history.checkpoint()
+    history.undo()
+    assert book.save_to_storage(silent=True)
+
+    loaded = ContactBook.load_from_storage(SqliteContactStorage())
+    assert list(loaded) == ["john", "jane", "bob"]
+    assert loaded["jane"].to_dict() == book["jane"].to_dict()
+
+
+def test_undone_note_deletion_keeps_its_place() -> None:
+    """A lazily deleted note goes back to its place in memory and in the database."""
+    notes = Notes.load_from_storage(SqliteNoteStorage())
+    for topic in ("First", "Second", "Third"):
+        notes.add_note(topic, f"{topic} note", None)
+    assert notes.save_to_storage(silent=True)
+
+    history = History()
+    loaded = Notes.load_from_storage(SqliteNoteStorage())
+    history.attach("notes", loaded)
+    loaded.delete_note("Second")
+    history.checkpoint()
+    assert loaded._data is None
+    history.undo()
+    assert loaded.save_to_storage(silent=True)
+
+    assert [note.topic for note in loaded] == ["First", "Second", "Third"]
+    reloaded = Notes.load_from_storage(SqliteNoteStorage())
+    assert [note.topic for note in reloaded] == ["First", "Second", "Third"]
+
+
+def test_migration_copies_json_files(monkeypatch) -> None:
+    """The v1 JSON files, journal included, are copied into the database."""
+    monkeypatch.setattr(data_storage, "STORAGE_MODE", "journal")
+    book = ContactBook.load_from_storage(data_storage.DataStorage(data_storage.CONTACTS_FILE))
+    book.create_contact("John", "0501234567")
+    book.save_to_storage(silent=True)
+    notes = Notes.load_from_storage(data_storage.DataStorage(data_storage.NOTES_FILE))
+    notes.add_note("Shopping", "Buy milk", "groceries")
+    notes.save_to_storage(silent=True)
+
+    assert migrate_json_to_sqlite() == (1, 1)
+
+    migrated = ContactBook.load_from_storage(SqliteContactStorage())
+    assert migrated.to_dict() == book.to_dict()
+
+
+def test_sibling_store_saves_are_not_outside_changes() -> None:
+    """A save of the notes does not make the contacts reload; another connection's commit does."""
+    contacts, notes = SqliteContactStorage(), SqliteNoteStorage()
+    book = ContactBook.load_from_storage(contacts)
+    notebook = Notes.load_from_storage(notes)
+
+    notebook.add_note("Shopping", "Buy milk")
+    assert notebook.save_to_storage(silent=True)
+    assert not contacts.changed_on_disk()
+    assert not book.refresh_from_storage()
+
+    with sqlite3.connect(contacts.filename) as outside:
+        outside.execute("UPDATE notes SET content = 'Buy bread'")
+    assert contacts.changed_on_disk() and notes.changed_on_disk()
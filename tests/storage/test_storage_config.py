@@ -0,0 +1,49 @@
+"""
+Unit tests for `StorageConfig`, which chooses the folder of the data files.
+"""
+import os
+
+import pytest
+
+from src import data_storage
+from src.data_storage import StorageConfig, open_storage
+from src.model.note import Notes
+
+
+pytestmark = pytest.mark.usefixtures("storage_env")
+
+
+def test_profiles_keep_separate_data_sets(tmp_path, storage_env) -> None:
+    """Stores opened with different configurations never see each other's data."""
+    base = str(tmp_path / "data")
+    for profile in ("bench-1", "bench-2"):
+        notes = Notes.load_from_storage(open_storage(data_storage.NOTES_FILE, StorageConfig(base, profile)))
+        notes.add_note(profile, "content")
+        assert notes.save_to_storage(silent=True)
+
+    for profile in ("bench-1", "bench-2"):
+        config = StorageConfig(base, profile)
+        assert config.storage_dir == os.path.join(base, data_storage.PROFILES_FOLDER, profile)
+        notes = Notes.load_from_storage(open_storage(data_storage.NOTES_FILE, config))
+        assert [note.topic for note in notes] == [profile]
+    assert not storage_env.exists()
+
+
+def test_environment_selects_the_folder(tmp_path, monkeypatch, storage_env) -> None:
+    """DATA_DIR_ENV and PROFILE_ENV apply to storages opened without a configuration."""
+    monkeypatch.setenv(data_storage.DATA_DIR_ENV, str(tmp_path / "ram"))
+    monkeypatch.setenv(data_storage.PROFILE_ENV, "load-test")
+
+    storage = data_storage.DataStorage(data_storage.CONTACTS_FILE)
+
+    expected = tmp_path / "ram" / data_storage.PROFILES_FOLDER / "load-test"
+    assert storage.filename == str(expected / data_storage.CONTACTS_FILE)
+    assert data_storage.current_config() is data_storage.current_config()
+    assert not storage_env.exists()
+
+
+def test_invalid_profile_is_rejected(tmp_path) -> None:
+    """Profile names cannot point outside the data folder."""
+    for profile in ("../other", "a/b", ".."):
+        with pytest.raises(ValueError):
+            StorageConfig(str(tmp_path), profile)